@@ -0,0 +1,181 @@
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .main import AudioSummarizer
+from .cli import process_to_file, save_results
+from .src.config.settings import Settings
+from .src.utils.output_writers import output_extension
+
+AUDIO_EXTENSIONS = {'.mp3', '.wav', '.m4a', '.ogg'}
+
+_worker_summarizer: Optional[AudioSummarizer] = None
+
+def collect_audio_files(inputs: List[str], recursive: bool = False) -> List[Path]:
+    """Expand directories and glob patterns into a sorted list of audio files."""
+    files = set()
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            candidates = path.rglob('*') if recursive else path.iterdir()
+        elif path.exists():
+            candidates = [path]
+        else:
+            candidates = (Path(match) for match in glob.glob(item, recursive=True))
+
+        for candidate in candidates:
+            if candidate.is_file() and candidate.suffix.lower() in AUDIO_EXTENSIONS:
+                files.add(candidate.resolve())
+
+    return sorted(files)
+
+def output_path_for(input_path: Path, output_dir: Optional[str] = None, extension: str = ".json") -> Path:
+    """Return where the summary for ``input_path`` is written."""
+    name = input_path.stem + "_summary" + extension
+    if output_dir:
+        return Path(output_dir) / name
+    return input_path.with_name(name)
+
+def _init_worker(settings: Settings):
+    """Build one summarizer per worker process and load its models up front."""
+    global _worker_summarizer
+    _worker_summarizer = AudioSummarizer(settings)
+    _worker_summarizer.preload_models()
+
+def _process_file(
+    input_path: str,
+    output_path: str,
+    create_tasks: bool,
+    schedule_followup: bool,
+    output_format: str = "json",
+    compress: bool = False,
+    resume: bool = False
+) -> Dict:
+    """Process one file in a worker, streaming its results to disk, and return its manifest record."""
+    record = {"input": input_path, "output": output_path}
+    start = time.perf_counter()
+    try:
+        process_to_file(
+            _worker_summarizer,
+            input_path,
+            output_path,
+            output_format,
+            compress,
+            create_tasks=create_tasks,
+            schedule_followup=schedule_followup,
+            resume=resume
+        )
+        record["status"] = "processed"
+    except Exception as e:
+        record["status"] = "failed"
+        record["error"] = str(e)
+
+    record["seconds"] = round(time.perf_counter() - start, 3)
+    return record
+
+def run_batch(
+    files: List[Path],
+    output_dir: Optional[str] = None,
+    workers: int = 2,
+    create_tasks: bool = False,
+    schedule_followup: bool = False,
+    resume: bool = False,
+    settings: Optional[Settings] = None,
+    pipelined: bool = False,
+    output_format: str = "json",
+    compress: bool = False,
+    progress=print
+) -> Dict:
+    """Process many files on a pool of worker processes and return a manifest.
+
+    Each worker loads its models once and reuses them for every file it is
+    given. With ``pipelined``, files are instead processed in this process by
+    the staged pipeline, overlapping decoding, transcription and analysis
+    across files. With ``resume``, files whose output already exists are
+    skipped and, with CHECKPOINT_DIR set, failed files continue from their
+    checkpoints. Results are written in ``output_format``, gzipped with
+    ``compress``.
+    """
+    settings = settings or Settings()
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    started_at = datetime.now().isoformat()
+    records = []
+    pending = []
+    for input_path in files:
+        output_path = output_path_for(input_path, output_dir, output_extension(output_format, compress))
+        if resume and output_path.exists():
+            records.append({"input": str(input_path), "output": str(output_path), "status": "skipped"})
+        else:
+            pending.append((str(input_path), str(output_path), create_tasks, schedule_followup, output_format, compress, resume))
+
+    if pending and pipelined:
+        records.extend(_run_pipelined(pending, settings, progress))
+    elif pending and workers <= 1:
+        _init_worker(settings)
+        for job in pending:
+            record = _process_file(*job)
+            records.append(record)
+            progress(f"[{record['status']}] {record['input']}")
+    elif pending:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(settings,)) as executor:
+            futures = [executor.submit(_process_file, *job) for job in pending]
+            for future in as_completed(futures):
+                record = future.result()
+                records.append(record)
+                progress(f"[{record['status']}] {record['input']}")
+
+    records.sort(key=lambda record: record["input"])
+    return {
+        "started_at": started_at,
+        "finished_at": datetime.now().isoformat(),
+        "workers": workers,
+        "total": len(records),
+        "processed": sum(record["status"] == "processed" for record in records),
+        "skipped": sum(record["status"] == "skipped" for record in records),
+        "failed": sum(record["status"] == "failed" for record in records),
+        "files": records
+    }
+
+def _run_pipelined(pending: List[tuple], settings: Settings, progress) -> List[Dict]:
+    summarizer = AudioSummarizer(settings)
+    output_paths = {input_path: output_path for input_path, output_path, *_ in pending}
+    _, _, create_tasks, schedule_followup, output_format, compress, resume = pending[0]
+    records = []
+
+    def write_result(result: Dict):
+        record = {"input": result["file_path"], "output": output_paths[result["file_path"]]}
+        if result["error"] is None:
+            try:
+                save_results(result["results"], record["output"], output_format, compress)
+                record["status"] = "processed"
+            except Exception as e:
+                record["status"] = "failed"
+                record["error"] = str(e)
+        else:
+            record["status"] = "failed"
+            record["error"] = result["error"]
+            record["failed_stage"] = result["failed_stage"]
+        record["stage_seconds"] = {stage: round(seconds, 3) for stage, seconds in result["timings"].items()}
+        records.append(record)
+        progress(f"[{record['status']}] {record['input']}")
+
+    summarizer.process_audio_files(
+        list(output_paths),
+        create_tasks=create_tasks,
+        schedule_followup=schedule_followup,
+        on_result=write_result,
+        resume=resume
+    )
+    return records
+
+def save_manifest(manifest: Dict, manifest_path: str):
+    """Write the batch manifest as JSON."""
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,77 @@
+from typing import Dict, List
+
+import numpy as np
+
+from src.audio.audio_buffer import AudioBuffer
+from src.nlp.action_item_extractor import ACTION_PATTERN
+
+SENTENCES = [
+    "We need to finalize the budget before Friday.",
+    "The design review went well and everyone agreed on the layout.",
+    "Maria will send the updated slides to the team.",
+    "Nobody had concerns about the vendor contract.",
+    "We should revisit the onboarding flow next sprint.",
+    "The team is going to migrate the database in March.",
+    "John must prepare the quarterly report.",
+    "There was a short discussion about hiring.",
+    "Sales numbers for the second quarter were slightly above the forecast.",
+    "The support backlog has been shrinking for three weeks in a row.",
+    "Everyone agreed that the release checklist is too long.",
+    "Priya will follow up with legal about the data retention policy."
+]
+
+# Roughly the pace of conversational speech.
+WORDS_PER_MINUTE = 150
+
+def generate_transcript(duration_seconds: float, seed: int = 0) -> str:
+    """Build a deterministic transcript as long as a meeting of the given duration."""
+    rng = np.random.default_rng(seed)
+    target_words = int(duration_seconds / 60 * WORDS_PER_MINUTE)
+    sentences = []
+    words = 0
+    while words < target_words:
+        sentence = SENTENCES[rng.integers(len(SENTENCES))]
+        sentences.append(sentence)
+        words += len(sentence.split())
+    return " ".join(sentences)
+
+def generate_action_items(transcript: str) -> List[Dict[str, str]]:
+    """Derive action items from a transcript without loading a spaCy model."""
+    action_items = []
+    for sentence in transcript.split('.'):
+        sentence = sentence.strip()
+        for match in ACTION_PATTERN.finditer(sentence.lower()):
+            action_items.append({"action": match.group(1), "context": sentence, "priority": "medium"})
+    return action_items
+
+def generate_audio(duration_seconds: float, sample_rate: int = 16000, channels: int = 1, seed: int = 0) -> AudioBuffer:
+    """Synthesize deterministic speech-like audio.
+
+    Utterances of two to eight seconds (harmonic tones with a syllable-rate
+    envelope) alternate with pauses of low background noise, so silence-based
+    chunking behaves as it would on a recorded meeting.
+    """
+    rng = np.random.default_rng(seed)
+    total = int(duration_seconds * sample_rate)
+    samples = np.empty((total, channels), dtype=np.int16)
+
+    position = 0
+    speaking = True
+    while position < total:
+        seconds = rng.uniform(2.0, 8.0) if speaking else rng.uniform(0.3, 1.5)
+        length = min(int(seconds * sample_rate), total - position)
+        t = np.arange(length, dtype=np.float32) / sample_rate
+
+        if speaking:
+            pitch = rng.uniform(100.0, 220.0)
+            signal = sum(np.sin(2 * np.pi * pitch * h * t) / h for h in (1, 2, 3))
+            signal *= 0.5 * (1 + np.sin(2 * np.pi * rng.uniform(3.0, 6.0) * t))
+            signal = 6000 * signal + rng.normal(0, 200, length)
+        else:
+            signal = rng.normal(0, 60, length)
+
+        samples[position:position + length] = np.clip(signal, -32768, 32767).astype(np.int16)[:, None]
+        position += length
+        speaking = not speaking
+
+    return AudioBuffer(samples, sample_rate, sample_width=2)
@@ -0,0 +1,90 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+from src.audio.audio_buffer import AudioBuffer
+from src.audio.backends import TranscriptionBackend
+
+from .data import WORDS_PER_MINUTE, SENTENCES
+
+class StubBackend(TranscriptionBackend):
+    """Offline backend that returns canned text sized to each chunk.
+
+    ``realtime_factor`` sleeps for that fraction of each chunk's duration to
+    stand in for model latency; at 0 only the chunking and scheduling
+    overhead around the backend is measured.
+    """
+
+    supports_batching = True
+
+    def __init__(self, batch_size: int = 8, realtime_factor: float = 0.0):
+        self.batch_size = batch_size
+        self.realtime_factor = realtime_factor
+        self._words = " ".join(SENTENCES).split()
+
+    def transcribe(self, chunk: AudioBuffer, language: str) -> str:
+        return self.transcribe_batch([chunk], language)[0]
+
+    def transcribe_batch(self, chunks: List[AudioBuffer], language: str) -> List[str]:
+        if self.realtime_factor:
+            time.sleep(self.realtime_factor * sum(chunk.duration_seconds for chunk in chunks))
+        texts = []
+        for chunk in chunks:
+            count = max(1, int(chunk.duration_seconds / 60 * WORDS_PER_MINUTE))
+            texts.append(" ".join(self._words[i % len(self._words)] for i in range(count)))
+        return texts
+
+class StubIntegrationHandler(BaseHTTPRequestHandler):
+    """Answers the task manager and calendar endpoints the integrations call."""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.request_count += 1
+            number = self.server.request_count
+
+        if self.path.endswith("/tasks/batch"):
+            return self._reply({"tasks": [{"id": f"task-{number}-{i}"} for i in range(len(body["tasks"]))]})
+        if self.path.endswith("/tasks"):
+            return self._reply({"id": f"task-{number}", "title": body["title"]})
+        if self.path.endswith("/freeBusy"):
+            return self._reply({"calendars": {item["id"]: {"busy": []} for item in body["items"]}})
+        self._reply({"id": f"event-{number}", "start": body.get("start")})
+
+    def _reply(self, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+class StubIntegrationServer:
+    """Local HTTP server standing in for the task manager and calendar APIs."""
+
+    def __init__(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubIntegrationHandler)
+        self.server.lock = threading.Lock()
+        self.server.request_count = 0
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    @property
+    def request_count(self) -> int:
+        return self.server.request_count
+
+    def __enter__(self) -> "StubIntegrationServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,234 @@
+import json
+import logging
+import os
+import platform
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from src.audio.audio_processor import AudioProcessor
+from src.audio.transcriber import AudioTranscriber
+from src.audio.vad import VoiceActivityDetector
+from src.integrations.calendar_integration import CalendarIntegration
+from src.integrations.task_manager import TaskManager
+from src.utils.metrics import PeakRSSMonitor
+
+from .data import generate_action_items, generate_audio, generate_transcript
+from .stubs import StubBackend, StubIntegrationServer
+
+STAGES = ["convert", "normalize", "transcribe", "summarize", "key_points", "action_items", "integrations"]
+
+DEFAULT_DURATIONS = [60, 600, 1800, 7200]
+
+def measure(func: Callable[[], object], repeat: int = 1) -> Dict:
+    """Run ``func`` ``repeat`` times; keep the best wall and CPU time and the highest peak RSS."""
+    wall = cpu = float('inf')
+    peak = growth = 0
+    for _ in range(repeat):
+        with PeakRSSMonitor(interval=0.005) as monitor:
+            start_wall = time.perf_counter()
+            start_cpu = time.process_time()
+            func()
+            wall = min(wall, time.perf_counter() - start_wall)
+            cpu = min(cpu, time.process_time() - start_cpu)
+        peak = max(peak, monitor.peak_rss)
+        growth = max(growth, monitor.peak_rss - monitor.start_rss)
+    return {
+        "wall_seconds": wall,
+        "cpu_seconds": cpu,
+        "peak_rss_mb": peak / 2 ** 20,
+        "rss_growth_mb": growth / 2 ** 20
+    }
+
+class BenchmarkSuite:
+    """Time each pipeline stage on generated meetings of increasing length.
+
+    Transcription runs on ``StubBackend`` and the integrations against a local
+    HTTP stub, so results depend only on this codebase and the machine.
+    Summarization and action items use the configured models; a stage whose
+    model cannot be loaded is reported with its error instead of a timing.
+    """
+
+    def __init__(
+        self,
+        durations: Optional[List[int]] = None,
+        stages: Optional[List[str]] = None,
+        repeat: int = 1,
+        summarizer_model: str = "facebook/bart-large-cnn",
+        summarizer_mode: str = "full",
+        summarizer_threads: int = 0,
+        spacy_model: str = "en_core_web_sm",
+        transcription_workers: int = 4,
+        stub_realtime_factor: float = 0.0,
+        progress=print
+    ):
+        unknown = set(stages or []) - set(STAGES)
+        if unknown:
+            raise ValueError(f"Unknown benchmark stages: {', '.join(sorted(unknown))}")
+        self.durations = durations or DEFAULT_DURATIONS
+        self.stages = [stage for stage in STAGES if stage in (stages or STAGES)]
+        self.repeat = repeat
+        self.summarizer_model = summarizer_model
+        self.summarizer_mode = summarizer_mode
+        self.summarizer_threads = summarizer_threads
+        self.spacy_model = spacy_model
+        self.transcription_workers = transcription_workers
+        self.stub_realtime_factor = stub_realtime_factor
+        self.progress = progress
+        self.audio_processor = AudioProcessor()
+
+    def run(self) -> Dict:
+        """Run every selected stage for every duration and return the report."""
+        results = {}
+        with tempfile.TemporaryDirectory() as workdir, StubIntegrationServer() as server:
+            for duration in self.durations:
+                inputs = self._prepare(duration, workdir)
+                for stage in self.stages:
+                    result = self._run_stage(stage, inputs, server)
+                    results[f"{stage}@{duration}"] = result
+                    self.progress(format_result(stage, duration, result))
+                inputs.clear()
+
+        return {
+            "created_at": datetime.now().isoformat(),
+            "machine": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "processor": platform.processor(),
+                "cpu_count": os.cpu_count()
+            },
+            "repeat": self.repeat,
+            "results": results
+        }
+
+    def _prepare(self, duration: int, workdir: str) -> Dict:
+        buffer = generate_audio(duration, seed=duration)
+        wav_path = os.path.join(workdir, f"meeting_{duration}.wav")
+        buffer.save_wav(wav_path)
+        transcript = generate_transcript(duration, seed=duration)
+        return {
+            "duration": duration,
+            "buffer": buffer,
+            "wav_path": wav_path,
+            "converted_path": os.path.join(workdir, f"converted_{duration}.wav"),
+            "transcript": transcript,
+            "action_items": generate_action_items(transcript)
+        }
+
+    def _run_stage(self, stage: str, inputs: Dict, server: StubIntegrationServer) -> Dict:
+        try:
+            func = getattr(self, f"_stage_{stage}")(inputs, server)
+            result = measure(func, self.repeat)
+        except Exception as e:
+            logging.getLogger(__name__).debug("Benchmark stage failed", exc_info=True)
+            return {"error": str(e)}
+
+        result["audio_seconds_per_second"] = inputs["duration"] / result["wall_seconds"] if result["wall_seconds"] else None
+        return result
+
+    # Each _stage_* method does its setup (model loading included) and returns
+    # the call to time, so only the work itself is measured.
+
+    def _stage_convert(self, inputs: Dict, server) -> Callable:
+        return lambda: _required(self.audio_processor.convert_to_wav(inputs["wav_path"], inputs["converted_path"]), "convert")
+
+    def _stage_normalize(self, inputs: Dict, server) -> Callable:
+        return lambda: _required(self.audio_processor.normalize_buffer(inputs["buffer"]), "normalize")
+
+    def _stage_transcribe(self, inputs: Dict, server) -> Callable:
+        transcriber = AudioTranscriber(
+            max_workers=self.transcription_workers,
+            backend=StubBackend(realtime_factor=self.stub_realtime_factor),
+            vad=VoiceActivityDetector()
+        )
+        return lambda: _required(transcriber.transcribe_buffer(inputs["buffer"]), "transcribe")
+
+    def _stage_summarize(self, inputs: Dict, server) -> Callable:
+        summarizer = self._summarizer()
+        return lambda: summarizer.summarize(inputs["transcript"])
+
+    def _stage_key_points(self, inputs: Dict, server) -> Callable:
+        summarizer = self._summarizer()
+        return lambda: summarizer.extract_key_points(inputs["transcript"])
+
+    def _stage_action_items(self, inputs: Dict, server) -> Callable:
+        from src.nlp.action_item_extractor import ActionItemExtractor
+
+        extractor = ActionItemExtractor(self.spacy_model)
+        extractor.load_model()
+        return lambda: extractor.extract_action_items(inputs["transcript"])
+
+    def _stage_integrations(self, inputs: Dict, server: StubIntegrationServer) -> Callable:
+        task_manager = TaskManager("benchmark", server.url, retry_backoff=0)
+        calendar = CalendarIntegration("benchmark", retry_backoff=0)
+        calendar.base_url = server.url
+        followups = [
+            {
+                "summary": item["action"],
+                "start_time": datetime(2030, 1, 2, 9, 0),
+                "attendees": ["team@example.com"]
+            }
+            for item in inputs["action_items"][:10]
+        ]
+
+        def run():
+            calendar._availability_cache.clear()
+            task_manager.create_tasks_from_action_items(inputs["action_items"])
+            calendar.create_followup_meetings(followups)
+
+        return run
+
+    def _summarizer(self):
+        # Imported here so the audio stages can run without transformers installed.
+        from src.nlp.summarizer import ContentSummarizer
+
+        summarizer = ContentSummarizer(self.summarizer_model, mode=self.summarizer_mode, num_threads=self.summarizer_threads)
+        summarizer.load_model()
+        return summarizer
+
+def _required(value, stage: str):
+    if value is None:
+        raise RuntimeError(f"{stage} returned no result")
+    return value
+
+def format_result(stage: str, duration: int, result: Dict) -> str:
+    """One progress line for a stage result."""
+    label = f"{stage:<13} {duration:>6}s"
+    if "error" in result:
+        return f"{label}  error: {result['error']}"
+    return (f"{label}  {result['wall_seconds']:>9.3f}s wall  {result['cpu_seconds']:>9.3f}s cpu  "
+            f"{result['audio_seconds_per_second']:>10.1f}x realtime  {result['peak_rss_mb']:>8.1f} MB peak")
+
+def compare_to_baseline(report: Dict, baseline: Dict, time_tolerance: float = 0.2, memory_tolerance: float = 0.2) -> List[str]:
+    """List the stages that got slower or used more memory than the baseline allows.
+
+    Stages missing from either report, or that errored in either, are not
+    compared.
+    """
+    regressions = []
+    for key, result in report["results"].items():
+        previous = baseline.get("results", {}).get(key)
+        if not previous or "error" in previous or "error" in result:
+            continue
+
+        if result["wall_seconds"] > previous["wall_seconds"] * (1 + time_tolerance):
+            regressions.append(
+                f"{key}: wall time {result['wall_seconds']:.3f}s vs baseline {previous['wall_seconds']:.3f}s"
+            )
+        if result["peak_rss_mb"] > previous["peak_rss_mb"] * (1 + memory_tolerance):
+            regressions.append(
+                f"{key}: peak RSS {result['peak_rss_mb']:.1f} MB vs baseline {previous['peak_rss_mb']:.1f} MB"
+            )
+    return regressions
+
+def load_report(path: str) -> Dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_report(report: Dict, path: str):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
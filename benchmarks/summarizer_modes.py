@@ -0,0 +1,120 @@
+import gc
+import logging
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .data import generate_transcript
+from .suite import measure
+
+DEFAULT_TRANSCRIPT_DURATIONS = [60, 600, 1800]
+
+def fixed_transcripts(durations: Optional[List[int]] = None, directory: Optional[str] = None) -> Dict[str, str]:
+    """The transcript set to compare on: every ``.txt`` file in ``directory``, or generated meetings."""
+    if directory:
+        return {path.stem: path.read_text(encoding='utf-8') for path in sorted(Path(directory).glob("*.txt"))}
+    return {
+        f"generated_{duration}s": generate_transcript(duration, seed=duration)
+        for duration in durations or DEFAULT_TRANSCRIPT_DURATIONS
+    }
+
+def _tokens(text: str) -> List[str]:
+    return [token.strip(".,!?;:\"'()").lower() for token in text.split() if token.strip(".,!?;:\"'()")]
+
+def _f1(overlap: int, candidate_total: int, reference_total: int) -> float:
+    if not overlap:
+        return 0.0
+    precision = overlap / candidate_total
+    recall = overlap / reference_total
+    return 2 * precision * recall / (precision + recall)
+
+def rouge_n(candidate: str, reference: str, n: int = 1) -> float:
+    """ROUGE-N F1 of ``candidate`` against ``reference``."""
+    candidate_tokens, reference_tokens = _tokens(candidate), _tokens(reference)
+    candidate_grams = Counter(zip(*(candidate_tokens[i:] for i in range(n))))
+    reference_grams = Counter(zip(*(reference_tokens[i:] for i in range(n))))
+    overlap = sum((candidate_grams & reference_grams).values())
+    return _f1(overlap, sum(candidate_grams.values()), sum(reference_grams.values()))
+
+def rouge_l(candidate: str, reference: str) -> float:
+    """ROUGE-L F1: the longest common token subsequence."""
+    candidate_tokens, reference_tokens = _tokens(candidate), _tokens(reference)
+    previous = [0] * (len(reference_tokens) + 1)
+    for token in candidate_tokens:
+        current = [0]
+        for j, reference_token in enumerate(reference_tokens):
+            current.append(previous[j] + 1 if token == reference_token else max(previous[j + 1], current[j]))
+        previous = current
+    return _f1(previous[-1], len(candidate_tokens), len(reference_tokens))
+
+def score_summary(candidate: str, reference: str) -> Dict[str, float]:
+    return {
+        "rouge1": rouge_n(candidate, reference, 1),
+        "rouge2": rouge_n(candidate, reference, 2),
+        "rougeL": rouge_l(candidate, reference)
+    }
+
+def compare_modes(
+    modes: List[str],
+    transcripts: Dict[str, str],
+    summarizer_factory: Callable[[str], object],
+    baseline_mode: str = "full",
+    repeat: int = 1,
+    progress=print
+) -> Dict:
+    """Summarize every transcript in each mode, timing it and scoring it against the baseline mode.
+
+    ``summarizer_factory`` builds a ContentSummarizer for a mode. The
+    baseline runs first and its summaries are the references; each mode's
+    model is unloaded before the next is loaded, so peak RSS is its own.
+    """
+    modes = [baseline_mode] + [mode for mode in modes if mode != baseline_mode]
+    references: Dict[str, str] = {}
+    report = {"baseline": baseline_mode, "repeat": repeat, "modes": {}}
+
+    for mode in modes:
+        try:
+            result = _run_mode(summarizer_factory(mode), transcripts, references, repeat)
+        except Exception as e:
+            # Without the baseline's summaries there is nothing to score against.
+            if mode == baseline_mode:
+                raise
+            logging.getLogger(__name__).debug("Summarizer mode failed", exc_info=True)
+            report["modes"][mode] = {"error": str(e)}
+            progress(f"{mode:<10} error: {e}")
+            continue
+
+        runs = list(result["transcripts"].values())
+        result["wall_seconds"] = sum(run["wall_seconds"] for run in runs)
+        result["peak_rss_mb"] = max((run["peak_rss_mb"] for run in runs), default=0.0)
+        for metric in ("rouge1", "rouge2", "rougeL"):
+            result[metric] = sum(run[metric] for run in runs) / len(runs) if runs else 0.0
+        baseline = report["modes"].get(baseline_mode, result)
+        result["speedup"] = baseline["wall_seconds"] / result["wall_seconds"] if result["wall_seconds"] else None
+
+        report["modes"][mode] = result
+        progress(format_mode(mode, result))
+    return report
+
+def _run_mode(summarizer, transcripts: Dict[str, str], references: Dict[str, str], repeat: int) -> Dict:
+    start = time.perf_counter()
+    summarizer.load_model()
+    result = {"model": summarizer.model_name, "load_seconds": time.perf_counter() - start, "transcripts": {}}
+    try:
+        for name, text in transcripts.items():
+            outputs = []
+            timing = measure(lambda: outputs.append(summarizer.summarize(text)), repeat)
+            summary = outputs[-1]
+            references.setdefault(name, summary)
+            result["transcripts"][name] = dict(timing, summary=summary, **score_summary(summary, references[name]))
+    finally:
+        summarizer.unload_model()
+        gc.collect()
+    return result
+
+def format_mode(mode: str, result: Dict) -> str:
+    """One table row for a mode's results."""
+    return (f"{mode:<10} {result['load_seconds']:>8.1f}s load  {result['wall_seconds']:>9.2f}s  "
+            f"{result['speedup'] or 0.0:>5.2f}x  {result['peak_rss_mb']:>8.1f} MB  "
+            f"R1 {result['rouge1']:.3f}  R2 {result['rouge2']:.3f}  RL {result['rougeL']:.3f}")
@@ -1,9 +1,14 @@
 import argparse
+import glob
+import os
 import sys
 import json
 from pathlib import Path
 import asyncio
 from .main import AudioSummarizer, create_async_summarizer
+from .src.config.settings import Settings
+from .src.utils.output_writers import OUTPUT_FORMATS, create_writer, output_extension, read_results
+from .src.utils.search_index import SEARCH_FIELDS, TranscriptIndex, meeting_key
 
 def create_parser() -> argparse.ArgumentParser:
     """Create command line argument parser."""
@@ -21,7 +26,21 @@ def create_parser() -> argparse.ArgumentParser:
         "--output",
         "-o",
         type=str,
-        help="Path to save the output JSON file (default: input_file_summary.json)"
+        help="Path to save the results (default: input_file_summary.json, with the extension of --format)"
+    )
+    
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default=Settings.OUTPUT_FORMAT,
+        help="Output format: indented json, compact json, jsonl streamed per field and segment, or msgpack (default: OUTPUT_FORMAT)"
+    )
+    
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        default=Settings.OUTPUT_GZIP,
+        help="Gzip the output file"
     )
     
     parser.add_argument(
@@ -36,6 +55,43 @@ def create_parser() -> argparse.ArgumentParser:
         help="Schedule a follow-up meeting based on the summary"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the result cache configured by CACHE_DIR"
+    )
+    
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Print result cache statistics after processing"
+    )
+    
+    parser.add_argument(
+        "--job-dir",
+        type=str,
+        default=Settings.CHECKPOINT_DIR,
+        help="Checkpoint each stage's intermediate results under this directory (default: CHECKPOINT_DIR)"
+    )
+    
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from the checkpoint an earlier, failed run left in the job directory"
+    )
+    
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Include per-stage timing and memory metrics in the results"
+    )
+    
+    parser.add_argument(
+        "--metrics-file",
+        type=str,
+        help="Write Prometheus metrics to this file (.om for OpenMetrics)"
+    )
+    
     parser.add_argument(
         "--async",
         action="store_true",
@@ -44,40 +100,534 @@ def create_parser() -> argparse.ArgumentParser:
     
     return parser
 
+def create_batch_parser() -> argparse.ArgumentParser:
+    """Create argument parser for the batch subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="batch",
+        description="Process every audio file in the given directories or glob patterns."
+    )
+    
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="Audio files, directories or glob patterns to process"
+    )
+    
+    parser.add_argument(
+        "--output-dir",
+        "-o",
+        type=str,
+        help="Directory for per-file results (default: next to each input file)"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=Settings.BATCH_WORKERS,
+        help="Number of worker processes (default: BATCH_WORKERS)"
+    )
+    
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="Overlap decoding, transcription and analysis across files in one process"
+    )
+    
+    parser.add_argument(
+        "--recursive",
+        "-r",
+        action="store_true",
+        help="Descend into subdirectories of input directories"
+    )
+    
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip files whose output already exists and continue failed files from their checkpoints"
+    )
+    
+    parser.add_argument(
+        "--job-dir",
+        type=str,
+        default=Settings.CHECKPOINT_DIR,
+        help="Checkpoint each file's intermediate results under this directory (default: CHECKPOINT_DIR)"
+    )
+    
+    parser.add_argument(
+        "--manifest",
+        type=str,
+        help="Path of the batch manifest (default: batch_manifest.json in the output directory)"
+    )
+    
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default=Settings.OUTPUT_FORMAT,
+        help="Output format for each file's results (default: OUTPUT_FORMAT)"
+    )
+    
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        default=Settings.OUTPUT_GZIP,
+        help="Gzip each output file"
+    )
+    
+    parser.add_argument(
+        "--create-tasks",
+        action="store_true",
+        help="Create tasks from extracted action items"
+    )
+    
+    parser.add_argument(
+        "--schedule-followup",
+        action="store_true",
+        help="Schedule a follow-up meeting based on each summary"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the result cache configured by CACHE_DIR"
+    )
+    
+    return parser
+
+def create_stream_parser() -> argparse.ArgumentParser:
+    """Create argument parser for the stream subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="stream",
+        description="Transcribe raw PCM audio as it arrives and print results as JSON lines."
+    )
+    
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default="-",
+        help="Raw PCM file or named pipe to read (default: stdin)"
+    )
+    
+    parser.add_argument(
+        "--sample-rate",
+        type=int,
+        default=16000,
+        help="Sample rate of the PCM stream in Hz (default: 16000)"
+    )
+    
+    parser.add_argument(
+        "--sample-width",
+        type=int,
+        default=2,
+        choices=[1, 2, 3, 4],
+        help="Bytes per sample (default: 2)"
+    )
+    
+    parser.add_argument(
+        "--channels",
+        type=int,
+        default=1,
+        help="Number of interleaved channels (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--read-size",
+        type=int,
+        default=16384,
+        help="Bytes to read from the input at a time (default: 16384)"
+    )
+    
+    return parser
+
+def create_serve_parser() -> argparse.ArgumentParser:
+    """Create argument parser for the serve subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="serve",
+        description="Run a resident service that keeps models loaded and processes submitted jobs."
+    )
+    
+    parser.add_argument(
+        "--host",
+        type=str,
+        default=Settings.SERVICE_HOST,
+        help="Address to listen on (default: SERVICE_HOST)"
+    )
+    
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=Settings.SERVICE_PORT,
+        help="Port to listen on (default: SERVICE_PORT)"
+    )
+    
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=Settings.SERVICE_SOCKET,
+        help="Listen on this Unix domain socket instead of a TCP port"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=Settings.SERVICE_WORKERS,
+        help="Number of jobs processed at once (default: SERVICE_WORKERS)"
+    )
+    
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=Settings.SERVICE_QUEUE_SIZE,
+        help="Jobs that may wait before submissions are refused (default: SERVICE_QUEUE_SIZE)"
+    )
+    
+    parser.add_argument(
+        "--drain-timeout",
+        type=float,
+        default=Settings.SERVICE_DRAIN_TIMEOUT,
+        help="Seconds to let accepted jobs finish on shutdown; 0 waits for all of them (default: SERVICE_DRAIN_TIMEOUT)"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the result cache configured by CACHE_DIR"
+    )
+    
+    return parser
+
+def create_index_parser() -> argparse.ArgumentParser:
+    """Create argument parser for the index subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="index",
+        description="Add results files written earlier to the search index."
+    )
+    
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="Results files, directories of *_summary.* files or glob patterns to index"
+    )
+    
+    parser.add_argument(
+        "--index-dir",
+        type=str,
+        default=Settings.SEARCH_INDEX_DIR,
+        help="Search index directory (default: SEARCH_INDEX_DIR)"
+    )
+    
+    parser.add_argument(
+        "--recursive",
+        "-r",
+        action="store_true",
+        help="Descend into subdirectories of input directories"
+    )
+    
+    parser.add_argument(
+        "--optimize",
+        action="store_true",
+        help="Merge the index into one part afterwards, dropping replaced entries"
+    )
+    
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print index statistics afterwards"
+    )
+    
+    return parser
+
+def create_search_parser() -> argparse.ArgumentParser:
+    """Create argument parser for the search subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="search",
+        description='Search indexed meetings for keywords and "quoted phrases", all of which must match.'
+    )
+    
+    parser.add_argument(
+        "query",
+        type=str,
+        help='Keywords and "quoted phrases" to search for'
+    )
+    
+    parser.add_argument(
+        "--index-dir",
+        type=str,
+        default=Settings.SEARCH_INDEX_DIR,
+        help="Search index directory (default: SEARCH_INDEX_DIR)"
+    )
+    
+    parser.add_argument(
+        "--field",
+        action="append",
+        choices=SEARCH_FIELDS,
+        help="Only search this field; repeat for several (default: all)"
+    )
+    
+    parser.add_argument(
+        "--meetings",
+        action="store_true",
+        help="List matching meetings with their best hit instead of individual segments"
+    )
+    
+    parser.add_argument(
+        "--limit",
+        "-n",
+        type=int,
+        default=20,
+        help="Maximum number of results (default: 20)"
+    )
+    
+    return parser
+
 async def process_async(
     input_file: str,
     create_tasks: bool = False,
-    schedule_followup: bool = False
+    schedule_followup: bool = False,
+    settings: Settings = None,
+    resume: bool = False,
+    cache_stats: bool = False
 ) -> dict:
     """Process audio file asynchronously."""
-    async with await create_async_summarizer() as summarizer:
-        return await summarizer.process_audio_file_async(
+    async with await create_async_summarizer(settings) as summarizer:
+        results = await summarizer.process_audio_file_async(
             input_file,
             create_tasks=create_tasks,
-            schedule_followup=schedule_followup
+            schedule_followup=schedule_followup,
+            resume=resume
         )
+        if cache_stats:
+            print_cache_stats(summarizer)
+        return results
 
 def process_sync(
     input_file: str,
     create_tasks: bool = False,
-    schedule_followup: bool = False
+    schedule_followup: bool = False,
+    settings: Settings = None,
+    cache_stats: bool = False,
+    output_path: str = None,
+    output_format: str = "json",
+    compress: bool = None,
+    resume: bool = False
 ) -> dict:
-    """Process audio file synchronously."""
-    summarizer = AudioSummarizer()
-    return summarizer.process_audio_file(
-        input_file,
-        create_tasks=create_tasks,
-        schedule_followup=schedule_followup
+    """Process audio file synchronously, streaming the results to ``output_path`` if given."""
+    summarizer = AudioSummarizer(settings)
+    if output_path:
+        results = process_to_file(
+            summarizer,
+            input_file,
+            output_path,
+            output_format,
+            compress,
+            create_tasks=create_tasks,
+            schedule_followup=schedule_followup,
+            resume=resume
+        )
+    else:
+        results = summarizer.process_audio_file(
+            input_file,
+            create_tasks=create_tasks,
+            schedule_followup=schedule_followup,
+            resume=resume
+        )
+    if cache_stats:
+        print_cache_stats(summarizer)
+    return results
+
+def print_cache_stats(summarizer: AudioSummarizer):
+    """Print the summarizer's result cache statistics."""
+    if summarizer.cache is None:
+        print("Result cache is disabled (set CACHE_DIR to enable it).")
+        return
+    print(json.dumps(summarizer.cache.stats(), indent=2))
+
+def save_results(results: dict, output_path: str, output_format: str = "json", compress: bool = None):
+    """Save processing results in ``output_format``, gzipped for a ``.gz`` path."""
+    with create_writer(output_path, output_format, compress) as writer:
+        writer.write(results)
+
+def process_to_file(
+    summarizer: AudioSummarizer,
+    input_file: str,
+    output_path: str,
+    output_format: str = "json",
+    compress: bool = None,
+    create_tasks: bool = False,
+    schedule_followup: bool = False,
+    resume: bool = False
+) -> dict:
+    """Process a file, writing each result field to ``output_path`` as its stage finishes.
+    
+    A run that fails leaves no partial output behind; its checkpoint, if
+    any, is what a resumed run continues from.
+    """
+    writer = create_writer(output_path, output_format, compress)
+    try:
+        with writer:
+            return summarizer.process_audio_file(
+                input_file,
+                create_tasks=create_tasks,
+                schedule_followup=schedule_followup,
+                on_field=writer.write_field,
+                resume=resume
+            )
+    except Exception:
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        raise
+
+def batch_main(argv):
+    """Run the batch subcommand."""
+    from .batch import collect_audio_files, run_batch, save_manifest
+    
+    args = create_batch_parser().parse_args(argv)
+    
+    files = collect_audio_files(args.inputs, recursive=args.recursive)
+    if not files:
+        print("Error: No audio files found")
+        sys.exit(1)
+    
+    settings = Settings()
+    if args.no_cache:
+        settings.CACHE_DIR = None
+    settings.CHECKPOINT_DIR = args.job_dir
+    
+    manifest = run_batch(
+        files,
+        output_dir=args.output_dir,
+        workers=args.workers,
+        create_tasks=args.create_tasks,
+        schedule_followup=args.schedule_followup,
+        resume=args.resume,
+        settings=settings,
+        pipelined=args.pipelined,
+        output_format=args.format,
+        compress=args.gzip
     )
+    
+    manifest_path = args.manifest or str(Path(args.output_dir or ".") / "batch_manifest.json")
+    save_manifest(manifest, manifest_path)
+    print(
+        f"Batch complete: {manifest['processed']} processed, {manifest['skipped']} skipped, "
+        f"{manifest['failed']} failed. Manifest saved to: {manifest_path}"
+    )
+    if manifest["failed"]:
+        sys.exit(1)
+
+def stream_main(argv):
+    """Run the stream subcommand."""
+    args = create_stream_parser().parse_args(argv)
+    
+    source = None
+    try:
+        source = sys.stdin.buffer if args.input == "-" else open(args.input, 'rb')
+        chunks = iter(lambda: source.read(args.read_size), b'')
+        summarizer = AudioSummarizer()
+        for event in summarizer.process_stream(
+            chunks,
+            sample_rate=args.sample_rate,
+            sample_width=args.sample_width,
+            channels=args.channels
+        ):
+            print(json.dumps(event, ensure_ascii=False), flush=True)
+    except Exception as e:
+        print(f"Error processing stream: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if source is not None and source is not sys.stdin.buffer:
+            source.close()
+
+def collect_result_files(inputs, recursive: bool = False):
+    """Expand directories and glob patterns into a sorted list of results files."""
+    files = set()
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            files.update(path.rglob('*_summary.*') if recursive else path.glob('*_summary.*'))
+        elif path.exists():
+            files.add(path)
+        else:
+            files.update(Path(match) for match in glob.glob(item, recursive=True))
+    return sorted(path.resolve() for path in files if path.is_file())
 
-def save_results(results: dict, output_path: str):
-    """Save processing results to a JSON file."""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+def index_main(argv):
+    """Run the index subcommand."""
+    args = create_index_parser().parse_args(argv)
+    if not args.index_dir:
+        print("Error: No search index configured (set SEARCH_INDEX_DIR or pass --index-dir)")
+        sys.exit(1)
+    
+    index = TranscriptIndex(args.index_dir, merge_factor=Settings.SEARCH_MERGE_FACTOR)
+    failed = 0
+    for path in collect_result_files(args.inputs, recursive=args.recursive):
+        try:
+            results = read_results(str(path))
+            count = index.add(meeting_key(results, str(path)), results)
+            print(f"[indexed] {path} ({count} documents)")
+        except Exception as e:
+            failed += 1
+            print(f"[failed] {path}: {str(e)}")
+    
+    if args.optimize:
+        index.optimize()
+    if args.stats:
+        print(json.dumps(index.stats(), indent=2))
+    if failed:
+        sys.exit(1)
+
+def search_main(argv):
+    """Run the search subcommand."""
+    args = create_search_parser().parse_args(argv)
+    if not args.index_dir or not Path(args.index_dir).is_dir():
+        print("Error: No search index found (set SEARCH_INDEX_DIR or pass --index-dir)")
+        sys.exit(1)
+    
+    index = TranscriptIndex(args.index_dir, merge_factor=Settings.SEARCH_MERGE_FACTOR)
+    if args.meetings:
+        hits = index.search_meetings(args.query, limit=args.limit, fields=args.field)
+    else:
+        hits = index.search(args.query, limit=args.limit, fields=args.field)
+    print(json.dumps(hits, indent=2, ensure_ascii=False))
 
-def main():
+def serve_main(argv):
+    """Run the serve subcommand."""
+    from .service import create_server, serve
+    
+    args = create_serve_parser().parse_args(argv)
+    
+    settings = Settings()
+    settings.SERVICE_WORKERS = args.workers
+    settings.SERVICE_QUEUE_SIZE = args.queue_size
+    if args.no_cache:
+        settings.CACHE_DIR = None
+    
+    server = create_server(settings, host=args.host, port=args.port, socket_path=args.socket)
+    print(f"Serving on {server.address} with {args.workers} workers", flush=True)
+    serve(server, drain_timeout=args.drain_timeout or None)
+    print("Service stopped.")
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "serve":
+        serve_main(argv[1:])
+        return
+    if argv and argv[0] == "batch":
+        batch_main(argv[1:])
+        return
+    if argv and argv[0] == "stream":
+        stream_main(argv[1:])
+        return
+    if argv and argv[0] == "index":
+        index_main(argv[1:])
+        return
+    if argv and argv[0] == "search":
+        search_main(argv[1:])
+        return
+    
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     input_path = Path(args.input_file)
     if not input_path.exists():
@@ -86,23 +636,44 @@ def main():
     
     output_path = args.output
     if not output_path:
-        output_path = str(input_path.with_suffix('')) + "_summary.json"
+        output_path = str(input_path.with_suffix('')) + "_summary" + output_extension(args.format, args.gzip)
+    
+    settings = Settings()
+    if args.no_cache:
+        settings.CACHE_DIR = None
+    if args.metrics:
+        settings.METRICS_ENABLED = True
+    if args.metrics_file:
+        settings.METRICS_FILE = args.metrics_file
+    settings.CHECKPOINT_DIR = args.job_dir
+    if args.resume and not args.job_dir:
+        print("Error: --resume needs a job directory (--job-dir or CHECKPOINT_DIR)")
+        sys.exit(1)
     
     try:
         if getattr(args, 'async'):
             results = asyncio.run(process_async(
                 str(input_path),
                 create_tasks=args.create_tasks,
-                schedule_followup=args.schedule_followup
+                schedule_followup=args.schedule_followup,
+                settings=settings,
+                resume=args.resume,
+                cache_stats=args.cache_stats
             ))
+            save_results(results, output_path, args.format, args.gzip or None)
         else:
-            results = process_sync(
+            process_sync(
                 str(input_path),
                 create_tasks=args.create_tasks,
-                schedule_followup=args.schedule_followup
+                schedule_followup=args.schedule_followup,
+                settings=settings,
+                cache_stats=args.cache_stats,
+                output_path=output_path,
+                output_format=args.format,
+                compress=args.gzip or None,
+                resume=args.resume
             )
         
-        save_results(results, output_path)
         print(f"Processing complete. Results saved to: {output_path}")
         
     except Exception as e:
@@ -1,16 +1,29 @@
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+import asyncio
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime, timedelta
-from pathlib import Path
 
 from .src.audio.transcriber import AudioTranscriber
 from .src.audio.audio_processor import AudioProcessor
+from .src.audio.backends import create_backend
+from .src.audio.streaming import StreamingTranscriber, read_ahead
+from .src.audio.transcript import Transcript
+from .src.audio.vad import VoiceActivityDetector
 from .src.nlp.summarizer import ContentSummarizer
 from .src.nlp.action_item_extractor import ActionItemExtractor
 from .src.integrations.task_manager import TaskManager
 from .src.integrations.calendar_integration import CalendarIntegration
 from .src.config.settings import Settings
 from .src.utils.helpers import extract_email_addresses
+from .src.utils.cache import ResultCache
+from .src.utils.checkpoint import JobCheckpoint
+from .src.utils.metrics import MetricsCollector
+from .src.utils.search_index import TranscriptIndex, meeting_key
+from .src.utils.stage_pipeline import Stage, StagePipeline
 
 class AudioSummarizer:
     """Main class that orchestrates the audio summarization process."""
@@ -20,9 +33,42 @@ class AudioSummarizer:
         self.setup_logging()
         
         self.audio_processor = AudioProcessor()
-        self.transcriber = AudioTranscriber(language=self.settings.DEFAULT_LANGUAGE)
-        self.summarizer = ContentSummarizer(model_name=self.settings.SUMMARIZER_MODEL)
+        self.transcriber = AudioTranscriber(
+            language=self.settings.DEFAULT_LANGUAGE,
+            chunk_seconds=self.settings.TRANSCRIPTION_CHUNK_SECONDS,
+            max_workers=self.settings.TRANSCRIPTION_WORKERS,
+            max_retries=self.settings.TRANSCRIPTION_MAX_RETRIES,
+            backend=self.create_transcription_backend(),
+            vad=self.create_vad()
+        )
+        self.summarizer = ContentSummarizer(
+            model_name=self.settings.SUMMARIZER_MODEL,
+            chunk_tokens=self.settings.SUMMARY_CHUNK_TOKENS,
+            batch_size=self.settings.SUMMARY_BATCH_SIZE,
+            reduce_depth=self.settings.SUMMARY_REDUCE_DEPTH,
+            mode=self.settings.SUMMARIZER_MODE,
+            num_threads=self.settings.SUMMARIZER_NUM_THREADS,
+            distilled_model=self.settings.SUMMARIZER_DISTILLED_MODEL,
+            onnx_dir=self.settings.SUMMARIZER_ONNX_DIR,
+            max_batch=self.settings.SUMMARY_MAX_BATCH if self.settings.SUMMARY_MICRO_BATCHING else 0,
+            max_wait_ms=self.settings.SUMMARY_MAX_WAIT_MS
+        )
         self.action_extractor = ActionItemExtractor()
+        self.metrics = MetricsCollector()
+
+        self.cache = None
+        if self.settings.CACHE_DIR:
+            self.cache = ResultCache(
+                self.settings.CACHE_DIR,
+                max_bytes=self.settings.CACHE_MAX_MB * 1024 * 1024
+            )
+
+        self.search_index = None
+        if self.settings.SEARCH_INDEX_DIR:
+            self.search_index = TranscriptIndex(
+                self.settings.SEARCH_INDEX_DIR,
+                merge_factor=self.settings.SEARCH_MERGE_FACTOR
+            )
 
         self.task_manager = None
         self.calendar_integration = None
@@ -30,15 +76,50 @@ class AudioSummarizer:
         if self.settings.TASK_MANAGER_API_KEY:
             self.task_manager = TaskManager(
                 self.settings.TASK_MANAGER_API_KEY,
-                self.settings.TASK_MANAGER_URL
+                self.settings.TASK_MANAGER_URL,
+                timeout=self.settings.TASK_MANAGER_TIMEOUT,
+                max_workers=self.settings.TASK_MANAGER_MAX_WORKERS,
+                max_retries=self.settings.TASK_MANAGER_MAX_RETRIES,
+                batch_endpoint=self.settings.TASK_MANAGER_BATCH_ENDPOINT
             )
             
         if self.settings.CALENDAR_API_KEY:
             self.calendar_integration = CalendarIntegration(
                 self.settings.CALENDAR_API_KEY,
-                self.settings.CALENDAR_SERVICE
+                self.settings.CALENDAR_SERVICE,
+                timeout=self.settings.CALENDAR_TIMEOUT,
+                max_workers=self.settings.CALENDAR_MAX_WORKERS,
+                max_retries=self.settings.CALENDAR_MAX_RETRIES,
+                availability_ttl=self.settings.CALENDAR_AVAILABILITY_TTL
             )
     
+    def create_transcription_backend(self):
+        """Build the speech-to-text backend selected in settings."""
+        options = {}
+        if self.settings.TRANSCRIPTION_BACKEND == "local":
+            options = {
+                "model_name": self.settings.LOCAL_ASR_MODEL,
+                "batch_size": self.settings.ASR_BATCH_SIZE,
+                "num_threads": self.settings.ASR_NUM_THREADS
+            }
+        return create_backend(self.settings.TRANSCRIPTION_BACKEND, **options)
+    
+    def create_vad(self) -> Optional[VoiceActivityDetector]:
+        """Build the voice activity detector, or None when VAD is disabled."""
+        if not self.settings.VAD_ENABLED:
+            return None
+        return VoiceActivityDetector(
+            energy_margin_db=self.settings.VAD_ENERGY_MARGIN_DB,
+            min_silence_ms=self.settings.VAD_MIN_SILENCE_MS,
+            padding_ms=self.settings.VAD_PADDING_MS
+        )
+    
+    def preload_models(self):
+        """Load every model this summarizer uses into the shared model registry."""
+        self.summarizer.load_model()
+        self.action_extractor.load_model()
+        self.transcriber.backend.load_model()
+    
     def setup_logging(self):
         """Configure logging for the application."""
         logging.basicConfig(
@@ -48,91 +129,550 @@ class AudioSummarizer:
         )
         self.logger = logging.getLogger(__name__)
 
-    def process_audio_file(self, file_path: str, create_tasks: bool = True, schedule_followup: bool = False) -> Dict:
-        """Process an audio file and generate summary, action items, and integrations."""
+    def stage_config(self, stage: str) -> Dict:
+        """Settings that affect a cacheable stage's output."""
+        if stage == "transcript":
+            return {
+                "language": self.settings.DEFAULT_LANGUAGE,
+                "backend": self.settings.TRANSCRIPTION_BACKEND,
+                "local_model": self.settings.LOCAL_ASR_MODEL if self.settings.TRANSCRIPTION_BACKEND == "local" else None,
+                "chunk_seconds": self.settings.TRANSCRIPTION_CHUNK_SECONDS,
+                "sample_rate": self.settings.TARGET_SAMPLE_RATE,
+                "vad": [
+                    self.settings.VAD_ENERGY_MARGIN_DB,
+                    self.settings.VAD_MIN_SILENCE_MS,
+                    self.settings.VAD_PADDING_MS
+                ] if self.settings.VAD_ENABLED else None,
+                "format": "segments"
+            }
+        if stage == "analysis":
+            return {
+                "model": self.summarizer.model_name,
+                "mode": self.summarizer.mode,
+                "max_length": self.settings.MAX_SUMMARY_LENGTH,
+                "min_length": self.settings.MIN_SUMMARY_LENGTH,
+                "chunk_tokens": self.settings.SUMMARY_CHUNK_TOKENS,
+                "reduce_depth": self.settings.SUMMARY_REDUCE_DEPTH
+            }
+        if stage == "action_items":
+            return {"model": self.action_extractor.model_name, "format": "joined-segments"}
+        raise ValueError(f"Unknown stage: {stage}")
+    
+    def _cache_get(self, stage: str, input_hash: Optional[str]):
+        if self.cache is None:
+            return None
+        value = self.cache.get(stage, ResultCache.stage_key(stage, input_hash, self.stage_config(stage)))
+        if value is not None:
+            self.logger.info(f"Using cached {stage} result")
+        return value
+    
+    def _cache_set(self, stage: str, input_hash: Optional[str], value):
+        if self.cache is not None:
+            self.cache.set(stage, ResultCache.stage_key(stage, input_hash, self.stage_config(stage)), value)
+    
+    def instrumented(self, name: str, func: Callable[[Dict], Any]) -> Callable[[Dict], Any]:
+        """Wrap a job stage so each run is measured and recorded in the job's metrics."""
+        def run(job: Dict):
+            with self.metrics.stage(name, {"file_path": job["file_path"]}) as measurement:
+                value = func(job)
+            job["metrics"]["stages"][name] = measurement
+            return value
+        return run
+    
+    def _record_size(self, job: Dict, name: str, value: float):
+        job["metrics"][name] = value
+        self.metrics.observe_size(name, value)
+    
+    def export_metrics(self):
+        """Write the aggregated metrics to METRICS_FILE, if configured."""
+        if not self.settings.METRICS_FILE:
+            return
         try:
-            audio_path = file_path
-            if not file_path.lower().endswith('.wav'):
-                audio_path = self.audio_processor.convert_to_wav(file_path)
-                if not audio_path:
-                    raise ValueError(f"Failed to convert audio file: {file_path}")
-            
-            normalized_path = self.audio_processor.normalize_audio(audio_path)
-            if not normalized_path:
-                raise ValueError(f"Failed to normalize audio file: {audio_path}")
-            
-            transcript = self.transcriber.transcribe_file(normalized_path)
-            if not transcript:
-                raise ValueError(f"Failed to transcribe audio file: {normalized_path}")
+            self.metrics.write(self.settings.METRICS_FILE.format(pid=os.getpid()))
+        except Exception as e:
+            self.logger.error(f"Error writing metrics file: {str(e)}")
+    
+    def _cached(self, stage: str, input_hash: Optional[str], compute):
+        """Return a stage result from the cache, computing and storing it on a miss."""
+        value = self._cache_get(stage, input_hash)
+        if value is None:
+            value = compute()
+            self._cache_set(stage, input_hash, value)
+        return value
+    
+    def open_checkpoint(self, file_path: str, resume: bool = False) -> Optional[JobCheckpoint]:
+        """The job directory for a file under CHECKPOINT_DIR, or None if checkpointing is off.
+        
+        Unless ``resume`` is set, whatever an earlier run left there is
+        discarded. Jobs for the same file running at once get separate
+        directories.
+        """
+        if not self.settings.CHECKPOINT_DIR:
+            return None
+        return JobCheckpoint.open_for(
+            self.settings.CHECKPOINT_DIR,
+            file_path,
+            {stage: self.stage_config(stage) for stage in ("transcript", "analysis", "action_items")},
+            resume
+        )
+    
+    def close_checkpoint(self, job: Dict, error: Optional[BaseException] = None):
+        """Delete a completed job's directory; keep a failed one to resume from."""
+        checkpoint = job.get("checkpoint")
+        if checkpoint is None:
+            return
+        if error is None:
+            checkpoint.remove()
+        else:
+            checkpoint.release()
+            self.logger.info(f"Intermediate results kept in {checkpoint.directory}; run again with resume to continue")
+    
+    def index_results(self, file_path: str, results: Dict):
+        """Add a completed file's results to the search index, if one is configured.
+        
+        The meeting is keyed by the input file's absolute path, so processing
+        a file again, or indexing its results file later, replaces its
+        earlier entry. A failure is logged rather than failing the job.
+        """
+        if self.search_index is None:
+            return
+        try:
+            self.search_index.add(meeting_key(results, file_path), results)
+        except Exception as e:
+            self.logger.error(f"Error indexing results for {file_path}: {str(e)}")
+    
+    def _checkpointed(self, job: Dict, stage: str, compute):
+        """Return a stage result saved by an earlier run of the job, computing and saving it otherwise."""
+        checkpoint = job.get("checkpoint")
+        if checkpoint is None:
+            return compute()
+        if checkpoint.has(stage):
+            self.logger.info(f"Resuming with checkpointed {stage} result")
+            return checkpoint.load(stage)
+        value = compute()
+        checkpoint.save(stage, value)
+        return value
+    
+    def decode_stage(self, job: Dict) -> Dict:
+        """Hash and decode the job's audio, unless its transcript is already cached or checkpointed."""
+        file_path = job["file_path"]
+        job["audio_hash"] = ResultCache.hash_file(file_path) if self.cache else None
+        if "checkpoint" not in job:
+            job["checkpoint"] = self.open_checkpoint(file_path, job.get("resume", False))
+        checkpoint = job["checkpoint"]
+        
+        transcript = self._cache_get("transcript", job["audio_hash"])
+        if transcript is None and checkpoint is not None:
+            transcript = checkpoint.load("transcript")
+        if transcript is not None:
+            job["transcript"] = Transcript.from_dict(transcript)
+            return job
+        
+        prepared = checkpoint.load_audio() if checkpoint is not None else None
+        if prepared is not None:
+            self.logger.info("Resuming with checkpointed audio")
+            job["audio"] = prepared
+            self._record_size(job, "audio_seconds", prepared.duration_seconds)
+            return job
+        
+        buffer = self.audio_processor.load_audio(file_path)
+        if buffer is None:
+            raise ValueError(f"Failed to load audio file: {file_path}")
+        
+        prepared = self.audio_processor.prepare_buffer(buffer, self.settings.TARGET_SAMPLE_RATE)
+        if prepared is None:
+            raise ValueError(f"Failed to prepare audio file: {file_path}")
+        
+        if checkpoint is not None:
+            checkpoint.save_audio(prepared)
+        job["audio"] = prepared
+        self._record_size(job, "audio_seconds", prepared.duration_seconds)
+        return job
+    
+    def transcribe_stage(self, job: Dict) -> Dict:
+        """Transcribe the decoded audio and release it."""
+        if "transcript" not in job:
+            checkpoint = job.get("checkpoint")
+            completed, on_chunk = None, None
+            if checkpoint is not None:
+                completed = {record["index"]: record["text"] for record in checkpoint.read("chunks")}
+                on_chunk = lambda index, text: checkpoint.append("chunks", {"index": index, "text": text})
             
-            summary = self.summarizer.summarize(
-                transcript,
+            transcript = self.transcriber.transcribe_timed(job.pop("audio"), completed, on_chunk)
+            if transcript is None or not transcript.text:
+                raise ValueError(f"Failed to transcribe audio file: {job['file_path']}")
+            self._cache_set("transcript", job["audio_hash"], transcript.to_dict())
+            if checkpoint is not None:
+                checkpoint.save("transcript", transcript.to_dict())
+                checkpoint.discard("audio", "chunks")
+            job["transcript"] = transcript
+        
+        # Also the namespace for task idempotency keys, so it is needed with the cache off too.
+        job["transcript_hash"] = ResultCache.hash_text(job["transcript"].text)
+        self._record_size(job, "transcript_tokens", job["transcript"].word_count())
+        return job
+    
+    def summarize_transcript(self, job: Dict) -> Dict:
+        """Summary and key points for the job's transcript."""
+        checkpoint = job.get("checkpoint")
+        resume = {}
+        if checkpoint is not None:
+            resume = {
+                "completed_chunks": [summary for group in checkpoint.read("chunk_summaries") for summary in group],
+                "on_chunk_summaries": lambda summaries: checkpoint.append("chunk_summaries", summaries)
+            }
+        
+        analysis = self._checkpointed(job, "analysis", lambda: self._cached(
+            "analysis",
+            job["transcript_hash"],
+            lambda: self.summarizer.analyze_segments(
+                job["transcript"].texts(),
                 max_length=self.settings.MAX_SUMMARY_LENGTH,
-                min_length=self.settings.MIN_SUMMARY_LENGTH
+                min_length=self.settings.MIN_SUMMARY_LENGTH,
+                **resume
             )
+        ))
+        if checkpoint is not None:
+            checkpoint.discard("chunk_summaries")
+        return analysis
+    
+    def extract_action_items(self, job: Dict) -> List[Dict]:
+        """Action items for the job's transcript."""
+        return self._checkpointed(job, "action_items", lambda: self._cached(
+            "action_items",
+            job["transcript_hash"],
+            lambda: self.action_extractor.extract_action_items_from_segments(job["transcript"])
+        ))
+    
+    def create_tasks(self, job: Dict) -> List[Dict]:
+        """Create tasks for the job's action items when requested and configured.
+        
+        Tasks created by an interrupted run of the job are not created again.
+        """
+        if job["create_tasks"] and self.task_manager and job["action_items"]:
+            return self._checkpointed(job, "tasks", lambda: self.task_manager.create_tasks_from_action_items(
+                job["action_items"],
+                namespace=job["transcript_hash"]
+            ))
+        return []
+    
+    def schedule_followup(self, job: Dict) -> Optional[Dict]:
+        """Schedule a follow-up meeting when requested and configured."""
+        if not (job["schedule_followup"] and self.calendar_integration):
+            return None
+        return self._checkpointed(job, "calendar_event", lambda: self._create_followup(job))
+    
+    def _create_followup(self, job: Dict) -> Optional[Dict]:
+        attendees = extract_email_addresses(job["transcript"].text)
+        
+        tomorrow = datetime.now().replace(hour=10, minute=0) + timedelta(days=1)
+        return self.calendar_integration.create_followup_meeting(
+            summary="Follow-up: " + job["analysis"]["summary"][:50] + "...",
+            start_time=tomorrow,
+            attendees=attendees,
+            find_free_slot=True
+        )
+    
+    @staticmethod
+    def available_results(job: Dict) -> Dict:
+        """The result fields the job's finished stages have produced so far."""
+        if "results" in job:
+            return job["results"]
+        results = {"source_file": os.path.abspath(job["file_path"])}
+        if "transcript" in job:
+            results["transcript"] = job["transcript"].text
+            results["segments"] = job["transcript"]
+        if "analysis" in job:
+            results["summary"] = job["analysis"]["summary"]
+            results["key_points"] = job["analysis"]["key_points"]
+        if "action_items" in job:
+            results["action_items"] = job["action_items"]
+        return results
+    
+    def build_results(self, job: Dict, tasks: List[Dict], calendar_event: Optional[Dict]) -> Dict:
+        results = {
+            "source_file": os.path.abspath(job["file_path"]),
+            "transcript": job["transcript"].text,
+            # Plain dicts, so the results serialize like any other dict; the
+            # Transcript itself is only handed to on_field as it finishes.
+            "segments": job["transcript"].to_list(),
+            "summary": job["analysis"]["summary"],
+            "key_points": job["analysis"]["key_points"],
+            "action_items": job["action_items"],
+            "tasks": tasks,
+            "calendar_event": calendar_event
+        }
+        if self.settings.METRICS_ENABLED:
+            # The job's own dict, so stages that finish after this still show up.
+            results["metrics"] = job["metrics"]
+        return results
+    
+    def analyze_stage(self, job: Dict) -> Dict:
+        """Summarize the transcript and extract key points and action items."""
+        job["analysis"] = self.summarize_transcript(job)
+        job["action_items"] = self.extract_action_items(job)
+        return job
+    
+    def integrate_stage(self, job: Dict) -> Dict:
+        """Create tasks and follow-up meetings, then assemble the results."""
+        job["results"] = self.build_results(job, self.create_tasks(job), self.schedule_followup(job))
+        return job
+    
+    def stages(self) -> List[Stage]:
+        """The processing stages, with the concurrency configured for pipelined runs."""
+        return [
+            Stage("decode", self.instrumented("decode", self.decode_stage), self.settings.PIPELINE_DECODE_WORKERS),
+            Stage("transcribe", self.instrumented("transcribe", self.transcribe_stage), self.settings.PIPELINE_TRANSCRIBE_WORKERS),
+            Stage("analyze", self.instrumented("analyze", self.analyze_stage), self.settings.PIPELINE_ANALYZE_WORKERS),
+            Stage("integrate", self.instrumented("integrate", self.integrate_stage), self.settings.PIPELINE_INTEGRATE_WORKERS)
+        ]
+    
+    @staticmethod
+    def new_job(file_path: str, create_tasks: bool = True, schedule_followup: bool = False, resume: bool = False) -> Dict:
+        return {
+            "file_path": file_path,
+            "create_tasks": create_tasks,
+            "schedule_followup": schedule_followup,
+            "resume": resume,
+            "metrics": {"stages": {}}
+        }
+
+    def process_audio_file(
+        self,
+        file_path: str,
+        create_tasks: bool = True,
+        schedule_followup: bool = False,
+        on_field: Optional[Callable[[str, Any], None]] = None,
+        on_stage: Optional[Callable[[str, float], None]] = None,
+        resume: bool = False
+    ) -> Dict:
+        """Process an audio file and generate summary, action items, and integrations.
+        
+        ``on_field`` receives each result field as soon as the stage that
+        produces it finishes, for example to stream it to a ResultWriter.
+        ``on_stage`` receives each stage's name as it finishes and the
+        fraction of stages done. With CHECKPOINT_DIR set, ``resume``
+        continues from what an earlier, failed run of the file completed.
+        """
+        job = self.new_job(file_path, create_tasks, schedule_followup, resume)
+        try:
+            emitted = set()
+            stages = self.stages()
+            for position, stage in enumerate(stages, 1):
+                job = stage.func(job)
+                if on_stage:
+                    on_stage(stage.name, position / len(stages))
+                if on_field:
+                    for key, value in self.available_results(job).items():
+                        if key not in emitted:
+                            emitted.add(key)
+                            on_field(key, value)
+            self.close_checkpoint(job)
+            self.index_results(file_path, job["results"])
+            return job["results"]
             
-            key_points = self.summarizer.extract_key_points(transcript)
-            
-            action_items = self.action_extractor.extract_action_items(transcript)
-            
-            tasks = []
-            if create_tasks and self.task_manager and action_items:
-                tasks = self.task_manager.create_tasks_from_action_items(action_items)
-            
-            calendar_event = None
-            if schedule_followup and self.calendar_integration:
-                attendees = extract_email_addresses(transcript)
-                
-                tomorrow = datetime.now().replace(hour=10, minute=0) + timedelta(days=1)
-                calendar_event = self.calendar_integration.create_followup_meeting(
-                    summary="Follow-up: " + summary[:50] + "...",
-                    start_time=tomorrow,
-                    attendees=attendees
-                )
-            
-            results = {
-                "transcript": transcript,
-                "summary": summary,
-                "key_points": key_points,
-                "action_items": action_items,
-                "tasks": tasks,
-                "calendar_event": calendar_event
+        except Exception as e:
+            self.logger.error(f"Error processing audio file: {str(e)}")
+            self.close_checkpoint(job, e)
+            raise
+        finally:
+            self.export_metrics()
+    
+    def process_audio_files(
+        self,
+        file_paths: List[str],
+        create_tasks: bool = True,
+        schedule_followup: bool = False,
+        on_result: Optional[Callable[[Dict], None]] = None,
+        resume: bool = False
+    ) -> List[Dict]:
+        """Process many files with decoding, transcription and analysis overlapping.
+        
+        Returns one ``{"file_path", "results", "error", "failed_stage",
+        "timings"}`` record per file, in input order. ``on_result`` receives
+        each record as soon as its file is done.
+        """
+        pipeline = StagePipeline(self.stages(), queue_size=self.settings.PIPELINE_QUEUE_SIZE)
+        
+        def to_record(job: Dict) -> Dict:
+            error = job["error"]
+            if error is not None:
+                self.logger.error(f"Error processing audio file {job['item']['file_path']}: {str(error)}")
+            return {
+                "file_path": job["item"]["file_path"],
+                "results": job["value"]["results"] if error is None else None,
+                "error": str(error) if error is not None else None,
+                "failed_stage": job["failed_stage"],
+                "timings": job["timings"]
             }
+        
+        def on_complete(job: Dict):
+            self.close_checkpoint(job["item"], job["error"])
+            if job["error"] is None:
+                self.index_results(job["item"]["file_path"], job["value"]["results"])
+            self.export_metrics()
+            if on_result:
+                on_result(to_record(job))
+        
+        jobs = pipeline.run(
+            (self.new_job(path, create_tasks, schedule_followup, resume) for path in file_paths),
+            on_complete=on_complete
+        )
+        return [to_record(job) for job in jobs]
+
+    def process_stream(
+        self,
+        chunks: Iterable[bytes],
+        sample_rate: int = 16000,
+        sample_width: int = 2,
+        channels: int = 1
+    ) -> Iterator[Dict]:
+        """Transcribe and analyze a live PCM stream, yielding events as they are produced.
+        
+        Yields ``segment`` events for each transcribed window, ``action_items``
+        events with the items found in it, and a rolling ``summary`` event
+        every ``STREAM_SUMMARY_EVERY`` windows. The rolling summary condenses the
+        previous summary plus the new text, so its cost stays bounded however
+        long the stream runs. A ``final`` event closes the stream.
+        
+        ``chunks`` are read on a separate thread, up to STREAM_QUEUE_SIZE
+        ahead, so a live source keeps being drained while a window is
+        transcribed or summarized.
+        """
+        streamer = StreamingTranscriber(
+            self.transcriber,
+            sample_rate=sample_rate,
+            sample_width=sample_width,
+            channels=channels,
+            window_seconds=self.settings.STREAM_WINDOW_SECONDS,
+            prepare=partial(self.audio_processor.prepare_buffer, target_sample_rate=self.settings.TARGET_SAMPLE_RATE)
+        )
+        state = {"texts": [], "pending": [], "summary": "", "action_items": []}
+        
+        for chunk in read_ahead(chunks, self.settings.STREAM_QUEUE_SIZE):
+            for segment in streamer.feed(chunk):
+                yield from self._stream_events(segment, state)
+        for segment in streamer.flush():
+            yield from self._stream_events(segment, state)
+        
+        if state["pending"]:
+            yield self._update_rolling_summary(state)
+        yield {
+            "type": "final",
+            "transcript": " ".join(state["texts"]),
+            "summary": state["summary"],
+            "action_items": state["action_items"]
+        }
+    
+    def _stream_events(self, segment: Dict, state: Dict) -> Iterator[Dict]:
+        yield dict(segment, type="segment")
+        if not segment["text"]:
+            return
+        
+        state["texts"].append(segment["text"])
+        state["pending"].append(segment["text"])
+        
+        action_items = self.action_extractor.extract_action_items(segment["text"])
+        if action_items:
+            for item in action_items:
+                item["start"] = segment["start"]
+                item["end"] = segment["end"]
+            state["action_items"].extend(action_items)
+            yield {"type": "action_items", "start": segment["start"], "end": segment["end"], "items": action_items}
+        
+        if len(state["pending"]) >= self.settings.STREAM_SUMMARY_EVERY:
+            event = self._update_rolling_summary(state)
+            event["end"] = segment["end"]
+            yield event
+    
+    def _update_rolling_summary(self, state: Dict) -> Dict:
+        text = " ".join([state["summary"]] + state["pending"]).strip()
+        state["summary"] = self.summarizer.summarize(
+            text,
+            max_length=self.settings.MAX_SUMMARY_LENGTH,
+            min_length=self.settings.MIN_SUMMARY_LENGTH
+        )
+        state["pending"] = []
+        return {"type": "summary", "summary": state["summary"]}
+
+_shared_executor = None
+_shared_executor_lock = threading.Lock()
+
+def get_shared_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Return the bounded executor shared by every async summarizer in the process."""
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="echoes")
+        return _shared_executor
+
+class AsyncAudioSummarizer(AudioSummarizer):
+    """AudioSummarizer with a native asyncio API.
+    
+    Blocking work runs on one bounded executor shared across jobs, so many
+    jobs can run in a single event loop without a thread per job. Within a
+    job, summarization and action item extraction run concurrently, as do
+    task creation and follow-up scheduling.
+    """
+    
+    def __init__(self, settings: Optional[Settings] = None, executor: Optional[ThreadPoolExecutor] = None):
+        super().__init__(settings)
+        self.executor = executor or get_shared_executor(self.settings.ASYNC_MAX_WORKERS)
+    
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args))
+    
+    async def _run_stage(self, name: str, job: Dict, *funcs: Callable[[Dict], Any]) -> List[Any]:
+        """Run ``funcs`` on the job concurrently, measured as the one stage ``name``.
+        
+        Stages keep the names the sequential and pipelined runs use, so a
+        job's metrics are labelled the same whichever way it was run.
+        """
+        with self.metrics.stage(name, {"file_path": job["file_path"]}) as measurement:
+            values = await asyncio.gather(*(self._run(func, job) for func in funcs))
+        job["metrics"]["stages"][name] = measurement
+        return values
+    
+    async def process_audio_file_async(
+        self,
+        file_path: str,
+        create_tasks: bool = True,
+        schedule_followup: bool = False,
+        resume: bool = False
+    ) -> Dict:
+        """Async version of process_audio_file."""
+        job = self.new_job(file_path, create_tasks, schedule_followup, resume)
+        try:
+            job = await self._run(self.instrumented("decode", self.decode_stage), job)
+            job = await self._run(self.instrumented("transcribe", self.transcribe_stage), job)
             
-            if audio_path != file_path:
-                Path(audio_path).unlink(missing_ok=True)
-            if normalized_path:
-                Path(normalized_path).unlink(missing_ok=True)
+            job["analysis"], job["action_items"] = await self._run_stage(
+                "analyze", job, self.summarize_transcript, self.extract_action_items
+            )
             
+            tasks, calendar_event = await self._run_stage(
+                "integrate", job, self.create_tasks, self.schedule_followup
+            )
+            results = self.build_results(job, tasks, calendar_event)
+            self.close_checkpoint(job)
+            await self._run(self.index_results, file_path, results)
             return results
             
         except Exception as e:
             self.logger.error(f"Error processing audio file: {str(e)}")
+            self.close_checkpoint(job, e)
             raise
+        finally:
+            self.export_metrics()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        # The executor is shared with other summarizers, so it stays running.
+        return False
 
-def create_async_summarizer():
+async def create_async_summarizer(settings: Optional[Settings] = None) -> AsyncAudioSummarizer:
     """Factory function for creating an async version of the summarizer."""
-    from functools import partial
-    import asyncio
-    from concurrent.futures import ThreadPoolExecutor
-    
-    class AsyncAudioSummarizer(AudioSummarizer):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            self.executor = ThreadPoolExecutor()
-        
-        async def process_audio_file_async(self, *args, **kwargs):
-            """Async version of process_audio_file."""
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(
-                self.executor,
-                partial(self.process_audio_file, *args, **kwargs)
-            )
-        
-        async def __aenter__(self):
-            return self
-        
-        async def __aexit__(self):
-            self.executor.shutdown(wait=True)
-    
-    return AsyncAudioSummarizer()
\ No newline at end of file
+    return AsyncAudioSummarizer(settings)
@@ -0,0 +1,86 @@
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+import spacy
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.nlp.action_item_extractor import ActionItemExtractor
+
+LEGACY_PATTERNS = [
+    r"need to (\w+)",
+    r"should (\w+)",
+    r"must (\w+)",
+    r"will (\w+)",
+    r"going to (\w+)"
+]
+
+SENTENCES = [
+    "We need to finalize the budget before Friday.",
+    "The design review went well and everyone agreed on the layout.",
+    "Maria will send the updated slides to the team.",
+    "Nobody had concerns about the vendor contract.",
+    "We should revisit the onboarding flow next sprint.",
+    "The team is going to migrate the database in March.",
+    "John must prepare the quarterly report.",
+    "There was a short discussion about hiring."
+]
+
+def make_transcript(sentence_count: int) -> str:
+    """Build a deterministic transcript of the given number of sentences."""
+    return " ".join(SENTENCES[i % len(SENTENCES)] for i in range(sentence_count))
+
+def legacy_extract(nlp, text: str):
+    """The original full-pipeline, per-pattern implementation, kept as the baseline."""
+    doc = nlp(text)
+    action_items = []
+    for sent in doc.sents:
+        sent_text = sent.text.lower()
+        for pattern in LEGACY_PATTERNS:
+            for match in re.finditer(pattern, sent_text):
+                action_items.append({"action": match.group(1), "context": sent.text, "priority": "medium"})
+    return action_items
+
+def time_call(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run_benchmark(model: str, sizes, repeat: int, batch_count: int, n_process: int):
+    legacy_nlp = spacy.load(model)
+    legacy_nlp.max_length = 10_000_000
+    extractor = ActionItemExtractor(model)
+    extractor.load_model()
+
+    print(f"{'sentences':>10} {'legacy (s)':>12} {'trimmed (s)':>12} {'speedup':>8}")
+    for size in sizes:
+        text = make_transcript(size)
+        legacy = time_call(lambda: legacy_extract(legacy_nlp, text), repeat)
+        trimmed = time_call(lambda: extractor.extract_action_items(text), repeat)
+        print(f"{size:>10} {legacy:>12.3f} {trimmed:>12.3f} {legacy / trimmed:>7.1f}x")
+
+    texts = [make_transcript(sizes[0])] * batch_count
+    serial = time_call(lambda: [extractor.extract_action_items(text) for text in texts], repeat)
+    batched = time_call(lambda: extractor.extract_action_items_batch(texts, n_process=n_process), repeat)
+    print(f"\n{batch_count} transcripts of {sizes[0]} sentences: "
+          f"serial {serial:.3f}s, nlp.pipe (n_process={n_process}) {batched:.3f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark action item extraction.")
+    parser.add_argument("--model", default="en_core_web_sm")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 2000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--batch-count", type=int, default=50)
+    parser.add_argument("--n-process", type=int, default=1)
+    args = parser.parse_args()
+
+    run_benchmark(args.model, args.sizes, args.repeat, args.batch_count, args.n_process)
+
+if __name__ == "__main__":
+    main()
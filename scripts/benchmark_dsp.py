@@ -0,0 +1,60 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from pydub import AudioSegment
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.data import generate_audio
+from src.audio import dsp
+from src.audio.audio_buffer import AudioBuffer
+from src.utils.metrics import PeakRSSMonitor
+
+def legacy_prepare(buffer: AudioBuffer, target_rate: int, target_db: float = -20.0) -> AudioBuffer:
+    """The pydub path: normalize at the source format, then let pydub convert it."""
+    audio = AudioSegment(
+        data=buffer.to_bytes(),
+        sample_width=buffer.sample_width,
+        frame_rate=buffer.sample_rate,
+        channels=buffer.channels
+    )
+    audio = audio.apply_gain(target_db - audio.dBFS)
+    audio = audio.set_channels(1).set_frame_rate(target_rate)
+    return AudioBuffer.from_bytes(audio.raw_data, audio.frame_rate, audio.sample_width, audio.channels)
+
+def measure(func, repeat: int):
+    best = float('inf')
+    peak = 0
+    for _ in range(repeat):
+        with PeakRSSMonitor(interval=0.002) as monitor:
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        peak = max(peak, monitor.peak_rss - monitor.start_rss)
+    return best, peak / 2 ** 20
+
+def run_benchmark(durations, source_rate: int, channels: int, target_rate: int, repeat: int):
+    print(f"Source {source_rate} Hz x {channels} channels -> {target_rate} Hz mono")
+    print(f"{'seconds':>8} {'pydub (s)':>10} {'numpy (s)':>10} {'speedup':>8} {'pydub MB':>9} {'numpy MB':>9}")
+    for duration in durations:
+        buffer = generate_audio(duration, sample_rate=source_rate, channels=channels, seed=duration)
+        legacy_time, legacy_mb = measure(lambda: legacy_prepare(buffer, target_rate), repeat)
+        numpy_time, numpy_mb = measure(lambda: dsp.prepare_for_recognition(buffer, target_rate), repeat)
+        print(f"{duration:>8} {legacy_time:>10.3f} {numpy_time:>10.3f} {legacy_time / numpy_time:>7.1f}x "
+              f"{legacy_mb:>9.1f} {numpy_mb:>9.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the pydub and NumPy audio preparation paths.")
+    parser.add_argument("--durations", type=int, nargs="+", default=[60, 600, 1800])
+    parser.add_argument("--source-rate", type=int, default=44100)
+    parser.add_argument("--channels", type=int, default=2)
+    parser.add_argument("--target-rate", type=int, default=16000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run_benchmark(args.durations, args.source_rate, args.channels, args.target_rate, args.repeat)
+
+if __name__ == "__main__":
+    main()
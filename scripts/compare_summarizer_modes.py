@@ -0,0 +1,53 @@
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.summarizer_modes import DEFAULT_TRANSCRIPT_DURATIONS, compare_modes, fixed_transcripts
+from src.nlp.summarizer import DISTILLED_MODEL, SUMMARIZER_MODES, ContentSummarizer
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare summarizer inference modes for speed, memory and agreement with the full model."
+    )
+    parser.add_argument("--modes", nargs="+", choices=SUMMARIZER_MODES, default=list(SUMMARIZER_MODES))
+    parser.add_argument("--baseline-mode", choices=SUMMARIZER_MODES, default="full",
+                        help="Mode whose summaries the others are scored against (default: full)")
+    parser.add_argument("--durations", type=int, nargs="+", default=DEFAULT_TRANSCRIPT_DURATIONS,
+                        help="Lengths in seconds of the generated transcripts")
+    parser.add_argument("--transcripts-dir", help="Compare on the .txt transcripts in this directory instead")
+    parser.add_argument("--model", default="facebook/bart-large-cnn")
+    parser.add_argument("--distilled-model", default=DISTILLED_MODEL)
+    parser.add_argument("--threads", type=int, default=0, help="Inference threads (default: library default)")
+    parser.add_argument("--onnx-dir", help="Directory to keep ONNX exports in between runs")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--output", help="Write the report, summaries included, as JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    transcripts = fixed_transcripts(args.durations, args.transcripts_dir)
+    if not transcripts:
+        print("Error: No transcripts to compare on")
+        sys.exit(1)
+
+    def create_summarizer(mode: str) -> ContentSummarizer:
+        return ContentSummarizer(
+            args.model,
+            mode=mode,
+            num_threads=args.threads,
+            distilled_model=args.distilled_model,
+            onnx_dir=args.onnx_dir
+        )
+
+    print(f"{len(transcripts)} transcripts, scored against {args.baseline_mode}")
+    report = compare_modes(args.modes, transcripts, create_summarizer, args.baseline_mode, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == "__main__":
+    main()
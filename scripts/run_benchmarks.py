@@ -0,0 +1,68 @@
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.suite import DEFAULT_DURATIONS, STAGES, BenchmarkSuite, compare_to_baseline, load_report, save_report
+
+DEFAULT_BASELINE = ROOT / "benchmarks" / "baseline.json"
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark each pipeline stage on generated meetings.")
+    parser.add_argument("--durations", type=int, nargs="+", default=DEFAULT_DURATIONS,
+                        help="Meeting lengths in seconds (default: 1 min, 10 min, 30 min, 2 h)")
+    parser.add_argument("--quick", action="store_true", help="Only run the 1 and 5 minute meetings")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--summarizer-model", default="facebook/bart-large-cnn")
+    parser.add_argument("--summarizer-mode", choices=["full", "quantized", "distilled", "onnx"], default="full")
+    parser.add_argument("--summarizer-threads", type=int, default=0)
+    parser.add_argument("--spacy-model", default="en_core_web_sm")
+    parser.add_argument("--workers", type=int, default=4, help="Transcription workers")
+    parser.add_argument("--stub-realtime-factor", type=float, default=0.0,
+                        help="Simulated ASR latency as a fraction of audio length")
+    parser.add_argument("--output", help="Write the report as JSON")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline report to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--time-tolerance", type=float, default=0.2)
+    parser.add_argument("--memory-tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    suite = BenchmarkSuite(
+        durations=[60, 300] if args.quick else args.durations,
+        stages=args.stages,
+        repeat=args.repeat,
+        summarizer_model=args.summarizer_model,
+        summarizer_mode=args.summarizer_mode,
+        summarizer_threads=args.summarizer_threads,
+        spacy_model=args.spacy_model,
+        transcription_workers=args.workers,
+        stub_realtime_factor=args.stub_realtime_factor
+    )
+    report = suite.run()
+
+    if args.output:
+        save_report(report, args.output)
+    if args.save_baseline:
+        save_report(report, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+
+    if not Path(args.baseline).exists():
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.")
+        return
+
+    regressions = compare_to_baseline(report, load_report(args.baseline), args.time_tolerance, args.memory_tolerance)
+    if regressions:
+        print("\nRegressions against baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print("\nNo regressions against baseline.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import logging
+import os
+import signal
+import threading
+from typing import Callable, Dict, Optional
+
+from .main import AudioSummarizer
+from .src.config.settings import Settings
+from .src.utils.job_queue import JobQueue
+from .src.utils.job_server import JobServer
+from .src.utils.model_registry import model_registry
+
+def validate_job(payload: Dict) -> Dict:
+    """Check a submitted job and fill in its defaults."""
+    if not isinstance(payload, dict):
+        raise ValueError("A job must be a JSON object")
+    file_path = payload.get("file_path")
+    if not isinstance(file_path, str) or not file_path:
+        raise ValueError("A job needs a file_path")
+    if not os.path.isfile(file_path):
+        raise ValueError(f"Input file not found: {file_path}")
+    return {
+        "file_path": os.path.abspath(file_path),
+        "create_tasks": bool(payload.get("create_tasks", False)),
+        "schedule_followup": bool(payload.get("schedule_followup", False)),
+        "resume": bool(payload.get("resume", False))
+    }
+
+def create_processor(summarizer: AudioSummarizer) -> Callable[[Dict, Callable[[str, float], None]], Dict]:
+    """Job function that runs one file through the shared, warm summarizer."""
+    def process(payload: Dict, progress: Callable[[str, float], None]) -> Dict:
+        return summarizer.process_audio_file(
+            payload["file_path"],
+            create_tasks=payload["create_tasks"],
+            schedule_followup=payload["schedule_followup"],
+            on_stage=progress,
+            resume=payload["resume"]
+        )
+    return process
+
+def create_server(
+    settings: Optional[Settings] = None,
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    socket_path: Optional[str] = None
+) -> JobServer:
+    """Build the service: one summarizer with its models loaded, a job queue and the API server."""
+    settings = settings or Settings()
+    summarizer = AudioSummarizer(settings)
+    summarizer.preload_models()
+
+    jobs = JobQueue(
+        create_processor(summarizer),
+        workers=settings.SERVICE_WORKERS,
+        max_queued=settings.SERVICE_QUEUE_SIZE,
+        keep_finished=settings.SERVICE_KEEP_JOBS
+    )
+    return JobServer(
+        jobs,
+        host=host or settings.SERVICE_HOST,
+        port=settings.SERVICE_PORT if port is None else port,
+        socket_path=socket_path or settings.SERVICE_SOCKET,
+        validate=validate_job,
+        metrics=summarizer.metrics.to_prometheus,
+        status=lambda: {
+            "models": [list(key) for key in model_registry.loaded()],
+            "summarizer_batches": summarizer.summarizer.batch_stats()
+        }
+    )
+
+def serve(server: JobServer, drain_timeout: Optional[float] = None):
+    """Serve until SIGTERM or SIGINT, then drain the queue and stop."""
+    logger = logging.getLogger(__name__)
+    stopping = threading.Event()
+
+    def stop(signum, frame):
+        if stopping.is_set():
+            return
+        stopping.set()
+        logger.info(f"Received signal {signum}, shutting down")
+        # shutdown blocks until serve_forever returns, so it cannot run on
+        # the thread that is serving.
+        threading.Thread(target=server.shutdown, args=(drain_timeout,), daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    server.serve_forever()
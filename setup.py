@@ -11,10 +11,14 @@ setup(
         "transformers>=4.15.0",
         "torch>=1.10.0",
         "numpy>=1.19.5",
+        "scipy>=1.7.0",
         "requests>=2.26.0",
         "python-dotenv>=0.19.0",
     ],
     extras_require={
+        "msgpack": [
+            "msgpack>=1.0.0",
+        ],
         "dev": [
             "pytest>=6.2.5",
             "pytest-cov>=2.12.0",
@@ -0,0 +1,108 @@
+import io
+import wave
+from typing import Optional
+
+import numpy as np
+
+SAMPLE_DTYPES = {
+    1: np.int8,
+    2: np.int16,
+    3: np.int32,  # 24-bit samples are held in int32 at their 24-bit scale
+    4: np.int32
+}
+
+class AudioBuffer:
+    """In-memory PCM audio: a (frames, channels) sample array plus its format."""
+
+    def __init__(self, samples: np.ndarray, sample_rate: int, sample_width: int = 2):
+        if sample_width not in SAMPLE_DTYPES:
+            raise ValueError(f"Unsupported sample width: {sample_width}")
+
+        samples = np.asarray(samples, dtype=SAMPLE_DTYPES[sample_width])
+        if samples.ndim == 1:
+            samples = samples.reshape(-1, 1)
+        if samples.ndim != 2:
+            raise ValueError(f"Expected 1-D or 2-D samples, got {samples.ndim}-D")
+
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+
+    @property
+    def channels(self) -> int:
+        return self.samples.shape[1]
+
+    @property
+    def frame_count(self) -> int:
+        return self.samples.shape[0]
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.frame_count / float(self.sample_rate) if self.sample_rate else 0.0
+
+    @classmethod
+    def from_bytes(cls, data: bytes, sample_rate: int, sample_width: int = 2, channels: int = 1) -> "AudioBuffer":
+        """Create a buffer from raw interleaved little-endian PCM bytes."""
+        usable = len(data) - len(data) % (sample_width * channels)
+        if sample_width == 3:
+            # Place each 3-byte sample in the top of an int32, then shift back to sign-extend.
+            raw = np.frombuffer(data[:usable], dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+            samples = ((raw[:, 0] << 8) | (raw[:, 1] << 16) | (raw[:, 2] << 24)) >> 8
+            return cls(samples.reshape(-1, channels), sample_rate, sample_width)
+
+        dtype = np.dtype(SAMPLE_DTYPES[sample_width]).newbyteorder('<')
+        samples = np.frombuffer(data[:usable], dtype=dtype).reshape(-1, channels)
+        return cls(samples, sample_rate, sample_width)
+
+    @classmethod
+    def from_wav(cls, source) -> "AudioBuffer":
+        """Read a WAV file from a path or file-like object."""
+        with wave.open(source, 'rb') as wav_file:
+            sample_width = wav_file.getsampwidth()
+            channels = wav_file.getnchannels()
+            sample_rate = wav_file.getframerate()
+            data = wav_file.readframes(wav_file.getnframes())
+
+        if sample_width == 1:
+            # 8-bit WAV is unsigned; shift to the signed layout used everywhere else.
+            data = (np.frombuffer(data, dtype=np.uint8).astype(np.int16) - 128).astype(np.int8).tobytes()
+
+        return cls.from_bytes(data, sample_rate, sample_width, channels)
+
+    def to_bytes(self) -> bytes:
+        """Return the samples as raw interleaved little-endian PCM bytes."""
+        dtype = np.dtype(SAMPLE_DTYPES[self.sample_width]).newbyteorder('<')
+        samples = np.ascontiguousarray(self.samples, dtype=dtype)
+        if self.sample_width == 3:
+            # Drop the high byte of each little-endian int32 to get packed 24-bit samples.
+            return samples.view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+        return samples.tobytes()
+
+    def to_wav_bytes(self) -> bytes:
+        """Encode the buffer as an in-memory WAV file."""
+        output = io.BytesIO()
+        self.save_wav(output)
+        return output.getvalue()
+
+    def save_wav(self, destination) -> None:
+        """Write the buffer as a WAV file to a path or file-like object."""
+        data = self.to_bytes()
+        if self.sample_width == 1:
+            data = (np.frombuffer(data, dtype=np.int8).astype(np.int16) + 128).astype(np.uint8).tobytes()
+
+        with wave.open(destination, 'wb') as wav_file:
+            wav_file.setnchannels(self.channels)
+            wav_file.setsampwidth(self.sample_width)
+            wav_file.setframerate(self.sample_rate)
+            wav_file.writeframes(data)
+
+    def to_mono(self) -> "AudioBuffer":
+        """Return a single-channel copy, averaging channels if needed."""
+        if self.channels == 1:
+            return self
+        mixed = self.samples.astype(np.float64).mean(axis=1)
+        return AudioBuffer(np.round(mixed), self.sample_rate, self.sample_width)
+
+    def slice(self, start_frame: int, end_frame: Optional[int] = None) -> "AudioBuffer":
+        """Return a view of the frames in ``[start_frame, end_frame)``."""
+        return AudioBuffer(self.samples[start_frame:end_frame], self.sample_rate, self.sample_width)
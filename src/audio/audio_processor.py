@@ -3,6 +3,9 @@ from pydub import AudioSegment
 from typing import Optional
 import logging
 
+from . import dsp
+from .audio_buffer import AudioBuffer
+
 class AudioProcessor:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -13,22 +16,60 @@ class AudioProcessor:
             'ogg': 'ogg'
         }
 
-    def convert_to_wav(self, file_path: str, output_path: Optional[str] = None) -> Optional[str]:
-        """Convert audio file to WAV format for transcription."""
+    def load_audio(self, file_path: str) -> Optional[AudioBuffer]:
+        """Decode an audio file into an in-memory PCM buffer."""
         try:
             file_ext = os.path.splitext(file_path)[1][1:].lower()
             if file_ext not in self.supported_formats:
                 self.logger.error(f"Unsupported file format: {file_ext}")
                 return None
 
+            if file_ext == 'wav':
+                return AudioBuffer.from_wav(file_path)
+
             audio = AudioSegment.from_file(file_path, format=self.supported_formats[file_ext])
-            
+            return AudioBuffer.from_bytes(
+                audio.raw_data,
+                sample_rate=audio.frame_rate,
+                sample_width=audio.sample_width,
+                channels=audio.channels
+            )
+
+        except Exception as e:
+            self.logger.error(f"Error loading audio: {str(e)}")
+            return None
+
+    def normalize_buffer(self, buffer: AudioBuffer, target_db: float = -20.0) -> Optional[AudioBuffer]:
+        """Normalize an in-memory buffer's volume to a target dB level."""
+        try:
+            return dsp.normalize(buffer, target_db)
+
+        except Exception as e:
+            self.logger.error(f"Error normalizing audio: {str(e)}")
+            return None
+
+    def prepare_buffer(self, buffer: AudioBuffer, target_sample_rate: int = 16000, target_db: float = -20.0) -> Optional[AudioBuffer]:
+        """Downmix to mono, resample to ``target_sample_rate`` and normalize for recognition."""
+        try:
+            return dsp.prepare_for_recognition(buffer, target_sample_rate, target_db)
+
+        except Exception as e:
+            self.logger.error(f"Error preparing audio: {str(e)}")
+            return None
+
+    def convert_to_wav(self, file_path: str, output_path: Optional[str] = None) -> Optional[str]:
+        """Convert audio file to WAV format for transcription."""
+        try:
+            buffer = self.load_audio(file_path)
+            if buffer is None:
+                return None
+
             if not output_path:
                 output_path = os.path.splitext(file_path)[0] + '.wav'
-            
-            audio.export(output_path, format='wav')
+
+            buffer.save_wav(output_path)
             return output_path
-        
+
         except Exception as e:
             self.logger.error(f"Error converting audio: {str(e)}")
             return None
@@ -36,14 +77,18 @@ class AudioProcessor:
     def normalize_audio(self, file_path: str, target_db: float = -20.0) -> Optional[str]:
         """Normalize audio volume to a target dB level."""
         try:
-            audio = AudioSegment.from_wav(file_path)
-            change_in_db = target_db - audio.dBFS
-            normalized_audio = audio.apply_gain(change_in_db)
-            
+            buffer = self.load_audio(file_path)
+            if buffer is None:
+                return None
+
+            normalized = self.normalize_buffer(buffer, target_db)
+            if normalized is None:
+                return None
+
             output_path = os.path.splitext(file_path)[0] + '_normalized.wav'
-            normalized_audio.export(output_path, format='wav')
+            normalized.save_wav(output_path)
             return output_path
-            
+
         except Exception as e:
             self.logger.error(f"Error normalizing audio: {str(e)}")
-            return None
\ No newline at end of file
+            return None
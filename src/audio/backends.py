@@ -0,0 +1,106 @@
+from typing import List, Optional
+
+import numpy as np
+import speech_recognition as sr
+
+from ..utils.model_registry import model_registry
+from .audio_buffer import AudioBuffer
+
+class TranscriptionBackend:
+    """Base class for the speech-to-text engines used by AudioTranscriber."""
+
+    supports_batching = False
+    batch_size = 1
+
+    def load_model(self):
+        """Load any model the backend needs; remote backends have none."""
+        return None
+
+    def transcribe(self, chunk: AudioBuffer, language: str) -> str:
+        """Recognize a single mono chunk. Returns an empty string for no speech."""
+        raise NotImplementedError
+
+    def transcribe_batch(self, chunks: List[AudioBuffer], language: str) -> List[str]:
+        """Recognize several chunks; backends that can batch override this."""
+        return [self.transcribe(chunk, language) for chunk in chunks]
+
+class GoogleBackend(TranscriptionBackend):
+    """Google Web Speech API through ``speech_recognition``."""
+
+    def __init__(self, recognizer: Optional[sr.Recognizer] = None):
+        self.recognizer = recognizer or sr.Recognizer()
+
+    def transcribe(self, chunk: AudioBuffer, language: str) -> str:
+        audio = sr.AudioData(chunk.to_bytes(), chunk.sample_rate, chunk.sample_width)
+        try:
+            return self.recognizer.recognize_google(audio, language=language)
+        except sr.UnknownValueError:
+            return ""
+
+class LocalBackend(TranscriptionBackend):
+    """Offline CPU recognition with a ``transformers`` ASR pipeline.
+
+    Chunks are passed to the pipeline as one list so they are padded and run
+    through the model ``batch_size`` at a time. The locale (``"en-US"``) is
+    passed to the model as its language code (``"en"``), except to
+    English-only ``.en`` models, which take none.
+    """
+
+    supports_batching = True
+
+    def __init__(self, model_name: str = "openai/whisper-base", batch_size: int = 8, num_threads: int = 0):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.num_threads = num_threads
+
+    @property
+    def pipeline(self):
+        return self.load_model()
+
+    def load_model(self):
+        """Return the shared ASR pipeline, loading it on first use."""
+        return model_registry.get(("asr", self.model_name), self._load_pipeline)
+
+    def _load_pipeline(self):
+        import torch
+        from transformers import pipeline
+
+        if self.num_threads:
+            torch.set_num_threads(self.num_threads)
+        return pipeline("automatic-speech-recognition", model=self.model_name, device=-1)
+
+    def transcribe(self, chunk: AudioBuffer, language: str) -> str:
+        return self.transcribe_batch([chunk], language)[0]
+
+    def transcribe_batch(self, chunks: List[AudioBuffer], language: str) -> List[str]:
+        inputs = [
+            {"raw": self._to_float(chunk), "sampling_rate": chunk.sample_rate}
+            for chunk in chunks
+        ]
+        options = {}
+        language_code = self._language_code(language)
+        if language_code:
+            options["generate_kwargs"] = {"language": language_code}
+        outputs = self.pipeline(inputs, batch_size=self.batch_size, **options)
+        return [output["text"].strip() for output in outputs]
+
+    def _language_code(self, language: Optional[str]) -> Optional[str]:
+        if not language or self.model_name.endswith(".en"):
+            return None
+        return language.split("-")[0].lower()
+
+    @staticmethod
+    def _to_float(chunk: AudioBuffer) -> np.ndarray:
+        scale = float(2 ** (8 * chunk.sample_width - 1))
+        return chunk.to_mono().samples[:, 0].astype(np.float32) / scale
+
+BACKENDS = {
+    "google": GoogleBackend,
+    "local": LocalBackend
+}
+
+def create_backend(name: str, **kwargs) -> TranscriptionBackend:
+    """Instantiate a transcription backend by its settings name."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown transcription backend: {name}")
+    return BACKENDS[name](**kwargs)
@@ -0,0 +1,138 @@
+from math import gcd
+from typing import Optional
+
+import numpy as np
+from scipy.signal import resample_poly
+
+from .audio_buffer import SAMPLE_DTYPES, AudioBuffer
+
+# Samples processed per step. Working in blocks keeps float temporaries at a
+# few megabytes, whatever the length of the recording.
+BLOCK_FRAMES = 1 << 20
+
+def full_scale(sample_width: int) -> float:
+    """The magnitude of a full-scale sample for a sample width."""
+    return float(2 ** (8 * sample_width - 1))
+
+def downmix(buffer: AudioBuffer) -> AudioBuffer:
+    """Average all channels into one."""
+    if buffer.channels == 1:
+        return buffer
+
+    out = np.empty(buffer.frame_count, dtype=SAMPLE_DTYPES[buffer.sample_width])
+    for start in range(0, buffer.frame_count, BLOCK_FRAMES):
+        block = buffer.samples[start:start + BLOCK_FRAMES]
+        # Summing columns is much faster than a mean over the short channel axis.
+        mixed = block[:, 0].astype(np.float32)
+        for channel in range(1, buffer.channels):
+            mixed += block[:, channel]
+        mixed *= np.float32(1.0 / buffer.channels)
+        out[start:start + BLOCK_FRAMES] = np.rint(mixed, out=mixed)
+    return AudioBuffer(out, buffer.sample_rate, buffer.sample_width)
+
+def resample(buffer: AudioBuffer, target_rate: int) -> AudioBuffer:
+    """Resample with a polyphase anti-aliasing filter.
+
+    The signal is filtered in blocks, each with enough neighbouring samples
+    on either side that the result matches resampling it in one piece.
+    """
+    if not target_rate or buffer.sample_rate == target_rate or buffer.frame_count == 0:
+        return buffer
+
+    divisor = gcd(target_rate, buffer.sample_rate)
+    up, down = target_rate // divisor, buffer.sample_rate // divisor
+    # resample_poly's default filter reaches 10 * max(up, down) upsampled
+    # samples either side of each output sample. The padding and the step
+    # are whole multiples of ``down`` so every block starts on an output sample.
+    reach = -(-10 * max(up, down) // up) + 1
+    pad = -(-reach // down) * down
+    step = max(1, BLOCK_FRAMES // down) * down
+
+    total = buffer.frame_count
+    out_total = -(-total * up // down)
+    limit = full_scale(buffer.sample_width)
+    dtype = SAMPLE_DTYPES[buffer.sample_width]
+    out = np.empty((out_total, buffer.channels), dtype=dtype)
+
+    for start in range(0, total, step):
+        end = min(start + step, total)
+        lo, hi = max(0, start - pad), min(total, end + pad)
+        block = buffer.samples[lo:hi].astype(np.float32)
+        resampled = resample_poly(block, up, down, axis=0)
+
+        out_start = start * up // down
+        out_end = out_total if end == total else end * up // down
+        offset = out_start - lo * up // down
+        kept = resampled[offset:offset + out_end - out_start]
+        np.rint(kept, out=kept)
+        np.clip(kept, -limit, limit - 1, out=kept)
+        out[out_start:out_end] = kept
+
+    return AudioBuffer(out, target_rate, buffer.sample_width)
+
+def loudness_dbfs(buffer: AudioBuffer) -> float:
+    """RMS level relative to full scale, as pydub's ``dBFS`` reports it."""
+    if buffer.frame_count == 0:
+        return float('-inf')
+
+    total = 0.0
+    for start in range(0, buffer.frame_count, BLOCK_FRAMES):
+        block = buffer.samples[start:start + BLOCK_FRAMES].astype(np.float64)
+        total += float(np.einsum('ij,ij->', block, block))
+    rms = np.sqrt(total / buffer.samples.size)
+    if rms == 0:
+        return float('-inf')
+    return float(20 * np.log10(rms / full_scale(buffer.sample_width)))
+
+def peak_dbfs(buffer: AudioBuffer) -> float:
+    """Highest absolute sample level relative to full scale."""
+    if buffer.frame_count == 0:
+        return float('-inf')
+    # min and max rather than abs(), which overflows on the most negative sample.
+    peak = max(-int(buffer.samples.min()), int(buffer.samples.max()))
+    if peak == 0:
+        return float('-inf')
+    return float(20 * np.log10(peak / full_scale(buffer.sample_width)))
+
+def apply_gain(buffer: AudioBuffer, gain_db: float, peak_limit_dbfs: Optional[float] = -1.0) -> AudioBuffer:
+    """Scale the buffer by ``gain_db``.
+
+    With ``peak_limit_dbfs``, the gain is reduced if needed so the loudest
+    sample lands at that level instead of clipping.
+    """
+    if peak_limit_dbfs is not None:
+        headroom = peak_limit_dbfs - peak_dbfs(buffer)
+        gain_db = min(gain_db, headroom)
+    if gain_db == 0:
+        return buffer
+
+    factor = np.float32(10 ** (gain_db / 20))
+    limit = full_scale(buffer.sample_width)
+    out = np.empty_like(buffer.samples)
+    for start in range(0, buffer.frame_count, BLOCK_FRAMES):
+        block = buffer.samples[start:start + BLOCK_FRAMES].astype(np.float32)
+        block *= factor
+        np.rint(block, out=block)
+        np.clip(block, -limit, limit - 1, out=block)
+        out[start:start + BLOCK_FRAMES] = block
+    return AudioBuffer(out, buffer.sample_rate, buffer.sample_width)
+
+def normalize(buffer: AudioBuffer, target_dbfs: float = -20.0, peak_limit_dbfs: Optional[float] = -1.0) -> AudioBuffer:
+    """Bring the buffer's RMS level to ``target_dbfs``; silent buffers are returned as is."""
+    level = loudness_dbfs(buffer)
+    if level == float('-inf'):
+        return buffer
+    return apply_gain(buffer, target_dbfs - level, peak_limit_dbfs)
+
+def prepare_for_recognition(
+    buffer: AudioBuffer,
+    target_rate: int = 16000,
+    target_dbfs: float = -20.0,
+    peak_limit_dbfs: Optional[float] = -1.0
+) -> AudioBuffer:
+    """Downmix, resample to ``target_rate`` and normalize, in that order.
+
+    Downmixing first means the resampler only filters one channel. A
+    ``target_rate`` of 0 keeps the source rate.
+    """
+    return normalize(resample(downmix(buffer), target_rate), target_dbfs, peak_limit_dbfs)
@@ -0,0 +1,49 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from .audio_buffer import AudioBuffer
+
+def frame_energy(buffer: AudioBuffer, frame_ms: int = 30) -> np.ndarray:
+    """Compute the RMS energy of each fixed-length frame of a buffer."""
+    frame_length = max(1, int(buffer.sample_rate * frame_ms / 1000))
+    samples = buffer.to_mono().samples[:, 0].astype(np.float32)
+
+    frame_count = len(samples) // frame_length
+    if frame_count == 0:
+        return np.zeros(0, dtype=np.float32)
+
+    frames = samples[:frame_count * frame_length].reshape(frame_count, frame_length)
+    return np.sqrt(np.mean(frames * frames, axis=1))
+
+def split_on_silence(
+    buffer: AudioBuffer,
+    max_chunk_seconds: float = 30.0,
+    min_chunk_seconds: float = 5.0,
+    frame_ms: int = 30
+) -> List[Tuple[int, int]]:
+    """Split a buffer into bounded chunks, cutting at the quietest frame of each window.
+
+    Returns ``(start_frame, end_frame)`` sample ranges that cover the whole buffer
+    in order. Every chunk is at most ``max_chunk_seconds`` long.
+    """
+    total = buffer.frame_count
+    max_frames = int(max_chunk_seconds * buffer.sample_rate)
+    if total <= max_frames:
+        return [(0, total)]
+
+    frame_length = max(1, int(buffer.sample_rate * frame_ms / 1000))
+    energy = frame_energy(buffer, frame_ms)
+    max_window = max(1, max_frames // frame_length)
+    min_window = min(max(1, int(min_chunk_seconds * buffer.sample_rate) // frame_length), max_window)
+
+    boundaries = []
+    start = 0
+    while total - start * frame_length > max_frames:
+        window = energy[start + min_window:start + max_window]
+        cut = start + min_window + int(np.argmin(window)) if len(window) else start + max_window
+        boundaries.append((start * frame_length, cut * frame_length))
+        start = cut
+
+    boundaries.append((start * frame_length, total))
+    return boundaries
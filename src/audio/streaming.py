@@ -0,0 +1,110 @@
+import queue
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from .audio_buffer import AudioBuffer
+from .transcriber import AudioTranscriber
+
+class StreamingTranscriber:
+    """Transcribe a live PCM stream in fixed-length windows as the audio arrives.
+
+    Raw interleaved PCM bytes are passed to :meth:`feed` in chunks of any size.
+    Every time a full window has accumulated it is transcribed and returned
+    as a ``{"start", "end", "text"}`` segment with offsets in seconds from the
+    start of the stream. :meth:`flush` transcribes whatever is left at the end.
+    ``prepare`` converts each window before recognition, e.g. to downmix,
+    resample and normalize it as files are; offsets stay in stream time.
+    """
+
+    def __init__(
+        self,
+        transcriber: AudioTranscriber,
+        sample_rate: int = 16000,
+        sample_width: int = 2,
+        channels: int = 1,
+        window_seconds: float = 10.0,
+        prepare: Optional[Callable[[AudioBuffer], Optional[AudioBuffer]]] = None
+    ):
+        self.transcriber = transcriber
+        self.prepare = prepare
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.channels = channels
+        self.frame_bytes = sample_width * channels
+        self.window_bytes = int(window_seconds * sample_rate) * self.frame_bytes
+        self._pending = bytearray()
+        self._frames_done = 0
+
+    def feed(self, data: bytes) -> List[Dict]:
+        """Add audio and return the segments for any windows it completed."""
+        self._pending.extend(data)
+        segments = []
+        while len(self._pending) >= self.window_bytes:
+            window = bytes(self._pending[:self.window_bytes])
+            del self._pending[:self.window_bytes]
+            segments.append(self._transcribe_window(window))
+        return segments
+
+    def flush(self) -> List[Dict]:
+        """Transcribe the final partial window, if there is one."""
+        usable = len(self._pending) - len(self._pending) % self.frame_bytes
+        window = bytes(self._pending[:usable])
+        self._pending.clear()
+        return [self._transcribe_window(window)] if window else []
+
+    def _transcribe_window(self, data: bytes) -> Dict:
+        buffer = AudioBuffer.from_bytes(data, self.sample_rate, self.sample_width, self.channels)
+        start = self._frames_done / float(self.sample_rate)
+        self._frames_done += buffer.frame_count
+
+        if self.prepare is not None:
+            buffer = self.prepare(buffer)
+        return {
+            "start": start,
+            "end": self._frames_done / float(self.sample_rate),
+            "text": (self.transcriber.transcribe_buffer(buffer) if buffer is not None else None) or ""
+        }
+
+_END = object()
+
+def read_ahead(chunks: Iterable[bytes], max_queued: int = 1024) -> Iterator[bytes]:
+    """Yield ``chunks`` as a background thread reads them, up to ``max_queued`` ahead.
+
+    Reading a live source such as a pipe keeps going while the caller is busy
+    with earlier audio, until ``max_queued`` chunks are waiting. An error
+    raised while reading is raised to the caller in the chunk's place.
+    """
+    buffered = queue.Queue(maxsize=max_queued)
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffered.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def read():
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+        except Exception as e:
+            put(e)
+            return
+        put(_END)
+
+    threading.Thread(target=read, name="stream-reader", daemon=True).start()
+    try:
+        while True:
+            item = buffered.get()
+            if item is _END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # Lets the reader stop if the caller gives up early.
+        stopped.set()
@@ -1,19 +1,171 @@
 import speech_recognition as sr
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 import logging
+import time
+
+from .audio_buffer import AudioBuffer
+from .backends import GoogleBackend, TranscriptionBackend
+from .segmentation import split_on_silence
+from .transcript import Transcript
+from .vad import VoiceActivityDetector
 
 class AudioTranscriber:
-    def __init__(self, language: str = "en-US"):
+    def __init__(
+        self,
+        language: str = "en-US",
+        chunk_seconds: float = 30.0,
+        max_workers: int = 4,
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
+        backend: Optional[TranscriptionBackend] = None,
+        vad: Optional[VoiceActivityDetector] = None
+    ):
         self.recognizer = sr.Recognizer()
+        self.backend = backend or GoogleBackend(self.recognizer)
         self.language = language
+        self.chunk_seconds = chunk_seconds
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.vad = vad
         self.logger = logging.getLogger(__name__)
 
     def transcribe_file(self, audio_file_path: str) -> Optional[str]:
         """Transcribe an audio file to text."""
+        transcript = self.transcribe_file_timed(audio_file_path)
+        return transcript.text if transcript is not None else None
+
+    def transcribe_file_timed(self, audio_file_path: str) -> Optional[Transcript]:
+        """Transcribe an audio file into time-aligned segments."""
         try:
+            if audio_file_path.lower().endswith('.wav'):
+                return self.transcribe_timed(AudioBuffer.from_wav(audio_file_path))
+
             with sr.AudioFile(audio_file_path) as source:
                 audio = self.recognizer.record(source)
-                return self.recognizer.recognize_google(audio, language=self.language)
+            buffer = AudioBuffer.from_bytes(audio.get_raw_data(), audio.sample_rate, audio.sample_width)
+            return self.transcribe_timed(buffer)
         except Exception as e:
             self.logger.error(f"Transcription error: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+
+    def transcribe_buffer(self, buffer: AudioBuffer) -> Optional[str]:
+        """Transcribe an in-memory PCM buffer to text."""
+        transcript = self.transcribe_timed(buffer)
+        return transcript.text if transcript is not None else None
+
+    def transcribe_timed(
+        self,
+        buffer: AudioBuffer,
+        completed: Optional[Dict[int, str]] = None,
+        on_chunk: Optional[Callable[[int, str], None]] = None
+    ) -> Optional[Transcript]:
+        """Transcribe an in-memory PCM buffer into time-aligned segments."""
+        segments = self.transcribe_segments(buffer, completed, on_chunk)
+        if segments is None:
+            return None
+        return Transcript.from_segments(segments)
+
+    def transcribe_segments(
+        self,
+        buffer: AudioBuffer,
+        completed: Optional[Dict[int, str]] = None,
+        on_chunk: Optional[Callable[[int, str], None]] = None
+    ) -> Optional[List[Dict]]:
+        """Transcribe a buffer in silence-aligned chunks, recognized in parallel.
+
+        Backends that support batching get the chunks in batches of their
+        ``batch_size``; other backends get one chunk per pool worker.
+
+        With a ``vad``, non-speech regions are removed before chunking, so
+        only speech is sent for recognition; segment offsets still refer to
+        the original audio.
+
+        Returns one ``{"start", "end", "text"}`` dict per chunk, in order, with
+        offsets in seconds. Chunks that still fail after retries carry an
+        ``"error"`` key and empty text; ``None`` is returned if every chunk failed.
+        A buffer with no speech gives an empty list.
+
+        ``on_chunk`` receives each chunk's index and text as soon as it is
+        recognized. Chunks in ``completed``, by index, are not recognized
+        again, so a run that was interrupted can pick up where it stopped.
+        """
+        try:
+            mono = buffer.to_mono()
+            offsets = None
+            if self.vad is not None:
+                original_seconds = mono.duration_seconds
+                mono, offsets = self.vad.strip_silence(mono)
+                self.logger.info(f"Voice activity: kept {mono.duration_seconds:.1f}s of {original_seconds:.1f}s")
+                if mono.frame_count == 0:
+                    return []
+
+            boundaries = split_on_silence(mono, max_chunk_seconds=self.chunk_seconds)
+            texts: List[Optional[str]] = [None] * len(boundaries)
+            pending = []
+            for index in range(len(boundaries)):
+                if completed and index in completed:
+                    texts[index] = completed[index]
+                else:
+                    pending.append(index)
+            chunks = [mono.slice(*boundaries[index]) for index in pending]
+
+            def record(indices: List[int], results: List[Optional[str]]):
+                for index, text in zip(indices, results):
+                    texts[index] = text
+                    if on_chunk and text is not None:
+                        on_chunk(index, text)
+
+            if self.backend.supports_batching:
+                for start in range(0, len(chunks), self.backend.batch_size):
+                    record(
+                        pending[start:start + self.backend.batch_size],
+                        self._recognize_batch(chunks[start:start + self.backend.batch_size])
+                    )
+            elif len(chunks) == 1:
+                record(pending, [self._recognize_with_retries(chunks[0])])
+            elif chunks:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    for index, text in zip(pending, executor.map(self._recognize_with_retries, chunks)):
+                        record([index], [text])
+        except Exception as e:
+            self.logger.error(f"Transcription error: {str(e)}")
+            return None
+
+        segments = []
+        for (start, end), text in zip(boundaries, texts):
+            if offsets is not None:
+                start, end = offsets.to_original(start), offsets.to_original(end, is_end=True)
+            segment = {
+                "start": start / float(mono.sample_rate),
+                "end": end / float(mono.sample_rate),
+                "text": text or ""
+            }
+            if text is None:
+                segment["error"] = "recognition failed"
+            segments.append(segment)
+
+        if all("error" in segment for segment in segments):
+            return None
+        return segments
+
+    def _recognize_batch(self, chunks: List[AudioBuffer]) -> List[Optional[str]]:
+        """Recognize a batch in one backend call, falling back to per-chunk retries."""
+        try:
+            return self.backend.transcribe_batch(chunks, self.language)
+        except Exception as e:
+            self.logger.warning(f"Batch recognition failed, retrying chunks individually: {str(e)}")
+            return [self._recognize_with_retries(chunk) for chunk in chunks]
+
+    def _recognize_with_retries(self, chunk: AudioBuffer) -> Optional[str]:
+        """Recognize a single chunk, retrying transient failures with backoff."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self.backend.transcribe(chunk, self.language)
+            except Exception as e:
+                self.logger.warning(f"Chunk recognition failed (attempt {attempt + 1}): {str(e)}")
+                if attempt < self.max_retries:
+                    time.sleep(self.retry_backoff * (2 ** attempt))
+
+        return None
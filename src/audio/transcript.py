@@ -0,0 +1,180 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+class Segment:
+    """One time-aligned piece of a transcript, with offsets in seconds."""
+
+    __slots__ = ("start", "end", "text")
+
+    def __init__(self, start: float, end: float, text: str):
+        self.start = start
+        self.end = end
+        self.text = text
+
+    def to_dict(self) -> Dict:
+        return {"start": self.start, "end": self.end, "text": self.text}
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Segment):
+            return NotImplemented
+        return (self.start, self.end, self.text) == (other.start, other.end, other.text)
+
+    def __repr__(self) -> str:
+        return f"Segment({self.start:.2f}, {self.end:.2f}, {self.text!r})"
+
+class Transcript:
+    """Time-aligned transcript segments in a compact, array-backed layout.
+
+    The segment texts are stored once, joined by single spaces into one
+    string, and NumPy arrays hold each segment's start and end time and its
+    character span in that string. Slicing by index or by time range returns
+    a view that shares this storage, so no text is copied until it is read.
+    Segments must be in time order.
+    """
+
+    def __init__(self, text: str, starts: np.ndarray, ends: np.ndarray, char_starts: np.ndarray, char_ends: np.ndarray):
+        self._text = text
+        self.starts = starts
+        self.ends = ends
+        self._char_starts = char_starts
+        self._char_ends = char_ends
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[Union[Dict, Segment]]) -> "Transcript":
+        """Build a transcript from ``{"start", "end", "text"}`` dicts or Segments."""
+        texts, starts, ends, char_starts, char_ends = [], [], [], [], []
+        position = 0
+        for segment in segments:
+            if isinstance(segment, dict):
+                start, end, text = segment["start"], segment["end"], (segment.get("text") or "").strip()
+            else:
+                start, end, text = segment.start, segment.end, segment.text.strip()
+
+            if text:
+                if texts:
+                    position += 1
+                texts.append(text)
+            starts.append(start)
+            ends.append(end)
+            char_starts.append(position)
+            position += len(text)
+            char_ends.append(position)
+
+        return cls(
+            " ".join(texts),
+            np.array(starts, dtype=np.float64),
+            np.array(ends, dtype=np.float64),
+            np.array(char_starts, dtype=np.int64),
+            np.array(char_ends, dtype=np.int64)
+        )
+
+    @classmethod
+    def from_text(cls, text: str, duration: float = 0.0) -> "Transcript":
+        """Wrap untimed text as a single segment."""
+        return cls.from_segments([Segment(0.0, duration, text)])
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Transcript":
+        """Rebuild a transcript stored with :meth:`to_dict`."""
+        return cls(
+            data["text"],
+            np.array(data["starts"], dtype=np.float64),
+            np.array(data["ends"], dtype=np.float64),
+            np.array(data["char_starts"], dtype=np.int64),
+            np.array(data["char_ends"], dtype=np.int64)
+        )
+
+    def to_dict(self) -> Dict:
+        """Column-wise JSON-serializable form, smaller than a list of segment dicts."""
+        if len(self) and (self._char_starts[0] != 0 or self._char_ends[-1] != len(self._text)):
+            # A view's spans point into its parent's text; store it on its own.
+            return Transcript.from_segments(self).to_dict()
+        return {
+            "text": self._text,
+            "starts": self.starts.tolist(),
+            "ends": self.ends.tolist(),
+            "char_starts": self._char_starts.tolist(),
+            "char_ends": self._char_ends.tolist()
+        }
+
+    @property
+    def text(self) -> str:
+        """The segment texts joined by single spaces."""
+        if not len(self):
+            return ""
+        start, end = int(self._char_starts[0]), int(self._char_ends[-1])
+        if start == 0 and end == len(self._text):
+            return self._text
+        return self._text[start:end].lstrip(" ")
+
+    @property
+    def start(self) -> float:
+        return float(self.starts[0]) if len(self) else 0.0
+
+    @property
+    def end(self) -> float:
+        return float(self.ends[-1]) if len(self) else 0.0
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Segment, "Transcript"]:
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                raise ValueError("Transcript slices must be contiguous")
+            return Transcript(
+                self._text,
+                self.starts[index],
+                self.ends[index],
+                self._char_starts[index],
+                self._char_ends[index]
+            )
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Transcript segment index out of range")
+        return Segment(
+            float(self.starts[index]),
+            float(self.ends[index]),
+            self._text[self._char_starts[index]:self._char_ends[index]]
+        )
+
+    def __iter__(self) -> Iterator[Segment]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def texts(self) -> Iterator[str]:
+        """Yield each non-empty segment text in order."""
+        for start, end in zip(self._char_starts.tolist(), self._char_ends.tolist()):
+            if end > start:
+                yield self._text[start:end]
+
+    def iter_dicts(self) -> Iterator[Dict]:
+        """Yield each segment as a ``{"start", "end", "text"}`` dict."""
+        for segment in self:
+            yield segment.to_dict()
+
+    def between(self, start: float, end: float) -> "Transcript":
+        """The segments that overlap ``[start, end)`` seconds, as a view."""
+        first = int(np.searchsorted(self.ends, start, side='right'))
+        last = int(np.searchsorted(self.starts, end, side='left'))
+        return self[first:max(first, last)]
+
+    def index_at(self, seconds: float) -> Optional[int]:
+        """Index of the segment playing at ``seconds``, or None if none is."""
+        index = int(np.searchsorted(self.starts, seconds, side='right')) - 1
+        if index >= 0 and seconds < self.ends[index]:
+            return index
+        return None
+
+    def word_count(self) -> int:
+        return sum(len(text.split()) for text in self.texts())
+
+    def to_list(self) -> List[Dict]:
+        return list(self.iter_dicts())
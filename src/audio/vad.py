@@ -0,0 +1,154 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from .audio_buffer import AudioBuffer
+
+class OffsetMap:
+    """Map positions in silence-stripped audio back to the original recording.
+
+    Holds, for each kept region, where it starts in the stripped audio and in
+    the original. Positions are in sample frames unless a method says seconds.
+    """
+
+    def __init__(self, regions: List[Tuple[int, int]], sample_rate: int):
+        self.sample_rate = sample_rate
+        lengths = np.array([end - start for start, end in regions], dtype=np.int64)
+        self.original_starts = np.array([start for start, _ in regions], dtype=np.int64)
+        self.stripped_starts = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.int64) if regions else lengths
+        self.lengths = lengths
+
+    @property
+    def kept_frames(self) -> int:
+        return int(self.lengths.sum())
+
+    def to_original(self, frame: int, is_end: bool = False) -> int:
+        """Original position of a stripped-audio position.
+
+        A position on the seam between two regions belongs to the later region,
+        or to the earlier one when ``is_end`` is set, so a segment ending on a
+        seam does not stretch over the removed silence after it.
+        """
+        if not len(self.lengths):
+            return frame
+        side = 'left' if is_end else 'right'
+        index = max(int(np.searchsorted(self.stripped_starts, frame, side=side)) - 1, 0)
+        return int(self.original_starts[index] + frame - self.stripped_starts[index])
+
+    def to_original_seconds(self, seconds: float, is_end: bool = False) -> float:
+        frame = int(round(seconds * self.sample_rate))
+        return self.to_original(frame, is_end) / float(self.sample_rate)
+
+class VoiceActivityDetector:
+    """Energy and zero-crossing based speech detection over fixed-length frames.
+
+    The energy threshold adapts to each recording: ``energy_margin_db`` above
+    its noise floor (a low percentile of frame energy), but never more than
+    ``dynamic_range_db`` below its loud frames, so recordings without pauses
+    are not mistaken for noise. Quieter frames with a high zero-crossing rate
+    (unvoiced consonants such as "s" and "f") also count as speech when they
+    are within ``zcr_margin_db`` of the threshold.
+    """
+
+    def __init__(
+        self,
+        frame_ms: int = 30,
+        energy_margin_db: float = 10.0,
+        dynamic_range_db: float = 20.0,
+        min_energy_dbfs: float = -60.0,
+        zcr_threshold: float = 0.25,
+        zcr_margin_db: float = 6.0,
+        min_speech_ms: int = 150,
+        min_silence_ms: int = 600,
+        padding_ms: int = 200
+    ):
+        self.frame_ms = frame_ms
+        self.energy_margin_db = energy_margin_db
+        self.dynamic_range_db = dynamic_range_db
+        self.min_energy_dbfs = min_energy_dbfs
+        self.zcr_threshold = zcr_threshold
+        self.zcr_margin_db = zcr_margin_db
+        self.min_speech_ms = min_speech_ms
+        self.min_silence_ms = min_silence_ms
+        self.padding_ms = padding_ms
+
+    def frame_features(self, buffer: AudioBuffer) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-frame energy in dBFS and zero-crossing rate of a buffer's first channel."""
+        frame_length = self._frame_length(buffer)
+        frame_count = buffer.frame_count // frame_length
+        if frame_count == 0:
+            return np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.float32)
+
+        frames = buffer.samples[:frame_count * frame_length, 0].reshape(frame_count, frame_length)
+        floats = frames.astype(np.float32)
+        rms = np.sqrt(np.einsum('ij,ij->i', floats, floats) / frame_length)
+        scale = float(2 ** (8 * buffer.sample_width - 1))
+        energy = 20 * np.log10(np.maximum(rms, 1e-3) / scale)
+
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / float(frame_length)
+        return energy.astype(np.float32), zcr.astype(np.float32)
+
+    def speech_frames(self, buffer: AudioBuffer) -> np.ndarray:
+        """Boolean speech decision for each frame, before smoothing."""
+        energy, zcr = self.frame_features(buffer)
+        if not len(energy):
+            return np.zeros(0, dtype=bool)
+
+        noise_floor, loud = np.percentile(energy, [10, 90])
+        threshold = min(noise_floor + self.energy_margin_db, loud - self.dynamic_range_db)
+        threshold = max(threshold, self.min_energy_dbfs)
+
+        voiced = energy >= threshold
+        unvoiced = (energy >= threshold - self.zcr_margin_db) & (zcr >= self.zcr_threshold)
+        return voiced | unvoiced
+
+    def detect(self, buffer: AudioBuffer) -> List[Tuple[int, int]]:
+        """Return the ``(start_frame, end_frame)`` sample ranges that contain speech.
+
+        Pauses shorter than ``min_silence_ms`` are bridged, bursts shorter than
+        ``min_speech_ms`` are dropped, and every region is widened by
+        ``padding_ms`` on each side so word edges are not clipped.
+        """
+        mono = buffer.to_mono()
+        speech = self.speech_frames(mono)
+        if not speech.any():
+            return []
+
+        frame_length = self._frame_length(mono)
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], speech.astype(np.int8), [0]))))
+        starts, ends = edges[0::2], edges[1::2]
+
+        # Bridge short pauses, then drop short bursts.
+        gaps = starts[1:] - ends[:-1]
+        keep_gap = gaps * self.frame_ms >= self.min_silence_ms
+        starts = np.concatenate((starts[:1], starts[1:][keep_gap]))
+        ends = np.concatenate((ends[:-1][keep_gap], ends[-1:]))
+        long_enough = (ends - starts) * self.frame_ms >= self.min_speech_ms
+        starts, ends = starts[long_enough], ends[long_enough]
+
+        padding = int(self.padding_ms * mono.sample_rate / 1000)
+        regions = []
+        for start, end in zip(starts * frame_length, ends * frame_length):
+            start = max(0, int(start) - padding)
+            end = min(mono.frame_count, int(end) + padding)
+            if regions and start <= regions[-1][1]:
+                regions[-1] = (regions[-1][0], end)
+            else:
+                regions.append((start, end))
+        return regions
+
+    def strip_silence(self, buffer: AudioBuffer) -> Tuple[AudioBuffer, OffsetMap]:
+        """Return the speech regions joined into one buffer, and the map back to ``buffer``."""
+        regions = self.detect(buffer)
+        offsets = OffsetMap(regions, buffer.sample_rate)
+        if regions == [(0, buffer.frame_count)]:
+            return buffer, offsets
+
+        if not regions:
+            return buffer.slice(0, 0), offsets
+        samples = np.concatenate([buffer.samples[start:end] for start, end in regions])
+        return AudioBuffer(samples, buffer.sample_rate, buffer.sample_width), offsets
+
+    def _frame_length(self, buffer: AudioBuffer) -> int:
+        return max(1, int(buffer.sample_rate * self.frame_ms / 1000))
@@ -14,12 +14,78 @@ class Settings:
     TASK_MANAGER_URL = os.getenv("TASK_MANAGER_URL", "https://api.taskmanager.com")
     CALENDAR_SERVICE = os.getenv("CALENDAR_SERVICE", "google")
     
+    TASK_MANAGER_TIMEOUT = float(os.getenv("TASK_MANAGER_TIMEOUT", "10"))
+    TASK_MANAGER_MAX_WORKERS = int(os.getenv("TASK_MANAGER_MAX_WORKERS", "8"))
+    TASK_MANAGER_MAX_RETRIES = int(os.getenv("TASK_MANAGER_MAX_RETRIES", "3"))
+    TASK_MANAGER_BATCH_ENDPOINT = os.getenv("TASK_MANAGER_BATCH_ENDPOINT", "false").lower() == "true"
+    CALENDAR_TIMEOUT = float(os.getenv("CALENDAR_TIMEOUT", "10"))
+    CALENDAR_MAX_WORKERS = int(os.getenv("CALENDAR_MAX_WORKERS", "4"))
+    CALENDAR_MAX_RETRIES = int(os.getenv("CALENDAR_MAX_RETRIES", "3"))
+    CALENDAR_AVAILABILITY_TTL = float(os.getenv("CALENDAR_AVAILABILITY_TTL", "300"))
+    
     DEFAULT_LANGUAGE = os.getenv("DEFAULT_LANGUAGE", "en-US")
     MAX_AUDIO_LENGTH_MINUTES = int(os.getenv("MAX_AUDIO_LENGTH_MINUTES", "120"))
     
+    TARGET_SAMPLE_RATE = int(os.getenv("TARGET_SAMPLE_RATE", "16000"))
+    TRANSCRIPTION_CHUNK_SECONDS = float(os.getenv("TRANSCRIPTION_CHUNK_SECONDS", "30"))
+    VAD_ENABLED = os.getenv("VAD_ENABLED", "true").lower() == "true"
+    VAD_ENERGY_MARGIN_DB = float(os.getenv("VAD_ENERGY_MARGIN_DB", "10"))
+    VAD_MIN_SILENCE_MS = int(os.getenv("VAD_MIN_SILENCE_MS", "600"))
+    VAD_PADDING_MS = int(os.getenv("VAD_PADDING_MS", "200"))
+    TRANSCRIPTION_WORKERS = int(os.getenv("TRANSCRIPTION_WORKERS", "4"))
+    TRANSCRIPTION_MAX_RETRIES = int(os.getenv("TRANSCRIPTION_MAX_RETRIES", "2"))
+    TRANSCRIPTION_BACKEND = os.getenv("TRANSCRIPTION_BACKEND", "google")
+    LOCAL_ASR_MODEL = os.getenv("LOCAL_ASR_MODEL", "openai/whisper-base")
+    ASR_BATCH_SIZE = int(os.getenv("ASR_BATCH_SIZE", "8"))
+    ASR_NUM_THREADS = int(os.getenv("ASR_NUM_THREADS", "0"))
+    
     MAX_SUMMARY_LENGTH = int(os.getenv("MAX_SUMMARY_LENGTH", "130"))
     MIN_SUMMARY_LENGTH = int(os.getenv("MIN_SUMMARY_LENGTH", "30"))
     SUMMARIZER_MODEL = os.getenv("SUMMARIZER_MODEL", "facebook/bart-large-cnn")
+    SUMMARIZER_MODE = os.getenv("SUMMARIZER_MODE", "full")
+    SUMMARIZER_DISTILLED_MODEL = os.getenv("SUMMARIZER_DISTILLED_MODEL", "sshleifer/distilbart-cnn-12-6")
+    SUMMARIZER_NUM_THREADS = int(os.getenv("SUMMARIZER_NUM_THREADS", "0"))
+    SUMMARIZER_ONNX_DIR = os.getenv("SUMMARIZER_ONNX_DIR")
+    SUMMARY_CHUNK_TOKENS = int(os.getenv("SUMMARY_CHUNK_TOKENS", "900"))
+    SUMMARY_BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", "4"))
+    SUMMARY_REDUCE_DEPTH = int(os.getenv("SUMMARY_REDUCE_DEPTH", "3"))
+    SUMMARY_MICRO_BATCHING = os.getenv("SUMMARY_MICRO_BATCHING", "false").lower() == "true"
+    SUMMARY_MAX_BATCH = int(os.getenv("SUMMARY_MAX_BATCH", "16"))
+    SUMMARY_MAX_WAIT_MS = float(os.getenv("SUMMARY_MAX_WAIT_MS", "20"))
+    
+    STREAM_WINDOW_SECONDS = float(os.getenv("STREAM_WINDOW_SECONDS", "10"))
+    STREAM_SUMMARY_EVERY = int(os.getenv("STREAM_SUMMARY_EVERY", "3"))
+    STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", "1024"))
+    
+    BATCH_WORKERS = int(os.getenv("BATCH_WORKERS", "2"))
+    ASYNC_MAX_WORKERS = int(os.getenv("ASYNC_MAX_WORKERS", "4"))
+    PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "2"))
+    PIPELINE_DECODE_WORKERS = int(os.getenv("PIPELINE_DECODE_WORKERS", "2"))
+    PIPELINE_TRANSCRIBE_WORKERS = int(os.getenv("PIPELINE_TRANSCRIBE_WORKERS", "2"))
+    PIPELINE_ANALYZE_WORKERS = int(os.getenv("PIPELINE_ANALYZE_WORKERS", "1"))
+    PIPELINE_INTEGRATE_WORKERS = int(os.getenv("PIPELINE_INTEGRATE_WORKERS", "2"))
+    
+    CACHE_DIR = os.getenv("CACHE_DIR")
+    CACHE_MAX_MB = int(os.getenv("CACHE_MAX_MB", "512"))
+    
+    CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR")
+    
+    SEARCH_INDEX_DIR = os.getenv("SEARCH_INDEX_DIR")
+    SEARCH_MERGE_FACTOR = int(os.getenv("SEARCH_MERGE_FACTOR", "10"))
+    
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+    METRICS_FILE = os.getenv("METRICS_FILE")
+    
+    SERVICE_HOST = os.getenv("SERVICE_HOST", "127.0.0.1")
+    SERVICE_PORT = int(os.getenv("SERVICE_PORT", "8765"))
+    SERVICE_SOCKET = os.getenv("SERVICE_SOCKET")
+    SERVICE_WORKERS = int(os.getenv("SERVICE_WORKERS", "2"))
+    SERVICE_QUEUE_SIZE = int(os.getenv("SERVICE_QUEUE_SIZE", "64"))
+    SERVICE_KEEP_JOBS = int(os.getenv("SERVICE_KEEP_JOBS", "1000"))
+    SERVICE_DRAIN_TIMEOUT = float(os.getenv("SERVICE_DRAIN_TIMEOUT", "600"))
+
+    OUTPUT_FORMAT = os.getenv("OUTPUT_FORMAT", "json")
+    OUTPUT_GZIP = os.getenv("OUTPUT_GZIP", "false").lower() == "true"
     
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE = os.getenv("LOG_FILE", "audio_summarizer.log")
\ No newline at end of file
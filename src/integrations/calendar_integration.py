@@ -1,10 +1,26 @@
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 import logging
-from typing import Dict, List, Optional
-import requests
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .http_client import create_session, request_with_retries
+
+BusyTimes = List[Tuple[datetime, datetime]]
 
 class CalendarIntegration:
-    def __init__(self, api_key: str, calendar_service: str = "google"):
+    def __init__(
+        self,
+        api_key: str,
+        calendar_service: str = "google",
+        timeout: float = 10.0,
+        max_workers: int = 4,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        availability_ttl: float = 300.0
+    ):
         self.api_key = api_key
         self.calendar_service = calendar_service
         self.base_url = self._get_service_url()
@@ -12,6 +28,14 @@ class CalendarIntegration:
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.availability_ttl = availability_ttl
+        self.session = create_session(pool_size=max_workers)
+        self._availability_cache: Dict[Tuple, Tuple[float, BusyTimes]] = {}
+        self._availability_lock = threading.Lock()
 
     def _get_service_url(self) -> str:
         """Get the appropriate API URL for the calendar service."""
@@ -21,26 +45,121 @@ class CalendarIntegration:
         }
         return services.get(self.calendar_service, services["google"])
 
+    def _post(self, endpoint: str, payload: Dict) -> Dict:
+        response = request_with_retries(
+            self.session,
+            "POST",
+            f"{self.base_url}/{endpoint}",
+            headers=self.headers,
+            json=payload,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+            retry_backoff=self.retry_backoff
+        )
+        response.raise_for_status()
+        return response.json()
+
     def create_event(self, event_data: Dict) -> Optional[Dict]:
         """Create a calendar event from meeting summary data."""
         try:
-            endpoint = f"{self.base_url}/events"
-            response = requests.post(
-                endpoint,
-                headers=self.headers,
-                json=event_data
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post("events", event_data)
         except Exception as e:
             logging.error(f"Error creating calendar event: {str(e)}")
             return None
 
-    def create_followup_meeting(self, summary: str, start_time: datetime, duration_minutes: int = 30, attendees: List[str] = None) -> Optional[Dict]:
-        """Create a follow-up meeting based on action items."""
+    def create_events(self, events: List[Dict]) -> List[Optional[Dict]]:
+        """Create many events concurrently over the pooled session, preserving order."""
+        if not events:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(events))) as executor:
+            return list(executor.map(self.create_event, events))
+
+    def get_busy_times(self, attendees: List[str], time_min: datetime, time_max: datetime) -> Optional[BusyTimes]:
+        """Return the attendees' busy intervals in a window, cached for ``availability_ttl`` seconds.
+
+        Times are naive UTC datetimes. Returns None if availability could not
+        be fetched.
+        """
+        key = (tuple(sorted(attendees)), time_min.isoformat(), time_max.isoformat())
+        now = time.monotonic()
+        with self._availability_lock:
+            cached = self._availability_cache.get(key)
+            if cached and cached[0] > now:
+                return list(cached[1])
+
+        try:
+            busy = self._fetch_busy_times(attendees, time_min, time_max)
+        except Exception as e:
+            logging.error(f"Error fetching calendar availability: {str(e)}")
+            return None
+
+        with self._availability_lock:
+            self._availability_cache[key] = (now + self.availability_ttl, busy)
+        return list(busy)
+
+    def _fetch_busy_times(self, attendees: List[str], time_min: datetime, time_max: datetime) -> BusyTimes:
+        if self.calendar_service == "outlook":
+            data = self._post("getSchedule", {
+                "schedules": attendees,
+                "startTime": {"dateTime": time_min.isoformat(), "timeZone": "UTC"},
+                "endTime": {"dateTime": time_max.isoformat(), "timeZone": "UTC"}
+            })
+            return sorted(
+                (_parse_time(item["start"]["dateTime"]), _parse_time(item["end"]["dateTime"]))
+                for schedule in data.get("value", [])
+                for item in schedule.get("scheduleItems", [])
+            )
+
+        data = self._post("freeBusy", {
+            "timeMin": time_min.isoformat() + "Z",
+            "timeMax": time_max.isoformat() + "Z",
+            "timeZone": "UTC",
+            "items": [{"id": attendee} for attendee in attendees]
+        })
+        return sorted(
+            (_parse_time(interval["start"]), _parse_time(interval["end"]))
+            for calendar in data.get("calendars", {}).values()
+            for interval in calendar.get("busy", [])
+        )
+
+    def find_free_slot(
+        self,
+        attendees: List[str],
+        start_time: datetime,
+        duration_minutes: int = 30,
+        search_hours: int = 8,
+        step_minutes: int = 30,
+        booked: Optional[BusyTimes] = None
+    ) -> datetime:
+        """Return the first slot from ``start_time`` on where every attendee is free.
+
+        ``booked`` adds intervals that are known to be taken but may not be in
+        the cached availability yet. Falls back to ``start_time`` when
+        availability is unknown or no slot is free within ``search_hours``.
+        """
+        window_end = start_time + timedelta(hours=search_hours)
+        # Look up whole days so follow-ups on the same day share one cached lookup.
+        day_start = start_time.replace(hour=0, minute=0, second=0, microsecond=0)
+        day_end = day_start + timedelta(days=(window_end - day_start).days + 1)
+        busy = self.get_busy_times(attendees, day_start, day_end)
+        if busy is None:
+            return start_time
+        busy = sorted(busy + list(booked or []))
+
+        duration = timedelta(minutes=duration_minutes)
+        candidate = start_time
+        while candidate + duration <= window_end:
+            if all(end <= candidate or start >= candidate + duration for start, end in busy):
+                return candidate
+            candidate += timedelta(minutes=step_minutes)
+        return start_time
+
+    @staticmethod
+    def build_followup_event(summary: str, start_time: datetime, duration_minutes: int = 30, attendees: List[str] = None) -> Dict:
+        """Build the event payload for a follow-up meeting."""
         end_time = start_time + timedelta(minutes=duration_minutes)
-        
-        event_data = {
+
+        return {
             "summary": f"Follow-up: {summary}",
             "start": {
                 "dateTime": start_time.isoformat(),
@@ -52,5 +171,56 @@ class CalendarIntegration:
             },
             "attendees": [{"email": attendee} for attendee in (attendees or [])]
         }
-        
-        return self.create_event(event_data)
\ No newline at end of file
+
+    def create_followup_meeting(
+        self,
+        summary: str,
+        start_time: datetime,
+        duration_minutes: int = 30,
+        attendees: List[str] = None,
+        find_free_slot: bool = False
+    ) -> Optional[Dict]:
+        """Create a follow-up meeting based on action items.
+
+        With ``find_free_slot``, the meeting moves to the attendees' first
+        free slot at or after ``start_time``.
+        """
+        if find_free_slot and attendees:
+            start_time = self.find_free_slot(attendees, start_time, duration_minutes)
+
+        return self.create_event(self.build_followup_event(summary, start_time, duration_minutes, attendees))
+
+    def create_followup_meetings(self, meetings: List[Dict], find_free_slot: bool = True) -> List[Optional[Dict]]:
+        """Schedule many follow-ups at once.
+
+        Each meeting is a dict of ``create_followup_meeting`` keyword arguments.
+        Slots are chosen in order from the cached availability, so meetings
+        for the same attendees do not overlap each other. The events are then
+        created concurrently.
+        """
+        events = []
+        booked: Dict[str, BusyTimes] = {}
+        for meeting in meetings:
+            attendees = meeting.get("attendees") or []
+            duration = meeting.get("duration_minutes", 30)
+            start_time = meeting["start_time"]
+
+            if find_free_slot and attendees:
+                taken = [interval for attendee in attendees for interval in booked.get(attendee, [])]
+                start_time = self.find_free_slot(attendees, start_time, duration, booked=taken)
+                for attendee in attendees:
+                    booked.setdefault(attendee, []).append((start_time, start_time + timedelta(minutes=duration)))
+
+            events.append(self.build_followup_event(meeting["summary"], start_time, duration, attendees))
+
+        return self.create_events(events)
+
+def _parse_time(value: str) -> datetime:
+    """Parse an API timestamp into a naive UTC datetime."""
+    value = value.replace("Z", "+00:00")
+    # Graph returns seven fractional digits; datetime accepts at most six.
+    value = re.sub(r"(\.\d{6})\d+", r"\1", value)
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
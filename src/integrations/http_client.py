@@ -0,0 +1,52 @@
+import logging
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+def create_session(pool_size: int = 10) -> requests.Session:
+    """Create a keep-alive session whose connection pool fits ``pool_size`` concurrent requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def request_with_retries(
+    session: requests.Session,
+    method: str,
+    url: str,
+    headers: Optional[Dict] = None,
+    json: Optional[Dict] = None,
+    timeout: float = 10.0,
+    max_retries: int = 3,
+    retry_backoff: float = 0.5
+) -> requests.Response:
+    """Send a request, retrying connection errors, timeouts and retryable statuses.
+
+    Waits ``retry_backoff * 2 ** attempt`` seconds between attempts, or the
+    server's ``Retry-After`` when it sends one. The last response is returned
+    even if its status is still an error; the last exception is re-raised.
+    """
+    logger = logging.getLogger(__name__)
+
+    for attempt in range(max_retries + 1):
+        delay = retry_backoff * (2 ** attempt)
+        try:
+            response = session.request(method, url, headers=headers, json=json, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == max_retries:
+                raise
+            logger.warning(f"{method} {url} failed (attempt {attempt + 1}): {str(e)}")
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == max_retries:
+                return response
+            logger.warning(f"{method} {url} returned {response.status_code} (attempt {attempt + 1})")
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = float(retry_after)
+
+        time.sleep(delay)
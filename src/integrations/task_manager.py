@@ -1,35 +1,115 @@
-from typing import Dict, List
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+import hashlib
+import json
+import logging
+
+from .http_client import create_session, request_with_retries
 
 class TaskManager:
-    def __init__(self, api_key: str, base_url: str):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        timeout: float = 10.0,
+        max_workers: int = 8,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        batch_endpoint: bool = False
+    ):
         self.api_key = api_key
         self.base_url = base_url
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
-    
-    def create_task(self, task_data: Dict) -> Dict:
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.batch_endpoint = batch_endpoint
+        self.session = create_session(pool_size=max_workers)
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def idempotency_key(task_data: Dict, position: int = 0, namespace: str = "") -> str:
+        """Stable key for a task, so a retried or re-run submission cannot create duplicates."""
+        payload = json.dumps([namespace, position, task_data], sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def create_task(self, task_data: Dict, idempotency_key: Optional[str] = None) -> Dict:
         """Create a new task in the task management system."""
         endpoint = f"{self.base_url}/tasks"
-        response = requests.post(
+        headers = dict(self.headers)
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+
+        response = request_with_retries(
+            self.session,
+            "POST",
             endpoint,
-            headers=self.headers,
-            json=task_data
+            headers=headers,
+            json=task_data,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+            retry_backoff=self.retry_backoff
         )
+        response.raise_for_status()
         return response.json()
-    
-    def create_tasks_from_action_items(self, action_items: List[Dict]) -> List[Dict]:
-        """Create tasks from extracted action items."""
-        created_tasks = []
-        for item in action_items:
-            task_data = {
+
+    def create_tasks_from_action_items(self, action_items: List[Dict], namespace: str = "") -> List[Dict]:
+        """Create tasks from extracted action items.
+
+        Tasks are submitted concurrently over the pooled session, or in one
+        request when the backend has a batch endpoint. The result list matches
+        ``action_items`` one to one; an item that could not be created gets an
+        ``{"error", "title"}`` entry instead of aborting the rest.
+        """
+        tasks = [
+            {
                 "title": item["action"],
                 "description": item["context"],
                 "priority": item["priority"]
             }
-            created_task = self.create_task(task_data)
-            created_tasks.append(created_task)
-        
-        return created_tasks
\ No newline at end of file
+            for item in action_items
+        ]
+        keys = [self.idempotency_key(task, position, namespace) for position, task in enumerate(tasks)]
+        if not tasks:
+            return []
+
+        if self.batch_endpoint:
+            created = self._create_tasks_batch(tasks, keys)
+            if created is not None:
+                return created
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as executor:
+            return list(executor.map(self._create_task_or_error, tasks, keys))
+
+    def _create_task_or_error(self, task_data: Dict, idempotency_key: str) -> Dict:
+        try:
+            return self.create_task(task_data, idempotency_key)
+        except Exception as e:
+            self.logger.error(f"Error creating task '{task_data['title']}': {str(e)}")
+            return {"error": str(e), "title": task_data["title"]}
+
+    def _create_tasks_batch(self, tasks: List[Dict], keys: List[str]) -> Optional[List[Dict]]:
+        """Submit all tasks to the batch endpoint; None means fall back to single requests."""
+        try:
+            response = request_with_retries(
+                self.session,
+                "POST",
+                f"{self.base_url}/tasks/batch",
+                headers=self.headers,
+                json={"tasks": [dict(task, idempotency_key=key) for task, key in zip(tasks, keys)]},
+                timeout=self.timeout,
+                max_retries=self.max_retries,
+                retry_backoff=self.retry_backoff
+            )
+            response.raise_for_status()
+            created = response.json()["tasks"]
+            if len(created) != len(tasks):
+                raise ValueError(f"Batch endpoint returned {len(created)} results for {len(tasks)} tasks")
+            return created
+        except Exception as e:
+            self.logger.warning(f"Batch task creation failed, submitting individually: {str(e)}")
+            return None
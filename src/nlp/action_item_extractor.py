@@ -1,34 +1,121 @@
 import spacy
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Dict, Tuple
 import re
 
+from ..utils.model_registry import model_registry
+
+# Only sentence boundaries are needed, so the statistical components are
+# excluded and a rule-based sentencizer is added in their place.
+UNUSED_COMPONENTS = ["tok2vec", "tagger", "morphologizer", "parser", "attribute_ruler", "lemmatizer", "ner", "senter"]
+
+# One pass over each sentence for all trigger phrases. The lookahead keeps
+# matches zero-width so phrases that overlap ("will need to go") are all found,
+# as they were when each phrase was searched for separately.
+ACTION_PATTERN = re.compile(r"(?=(?:need to|should|must|will|going to) (\w+))")
+
 class ActionItemExtractor:
     def __init__(self, model: str = "en_core_web_sm"):
-        self.nlp = spacy.load(model)
-        
+        self.model_name = model
+
+    @property
+    def nlp(self):
+        return self.load_model()
+
+    def load_model(self):
+        """Return the shared spaCy pipeline, loading it on first use."""
+        return model_registry.get(("spacy", self.model_name, "sentencizer"), self._load_pipeline)
+
+    def _load_pipeline(self):
+        nlp = spacy.load(self.model_name, exclude=UNUSED_COMPONENTS)
+        if "sentencizer" not in nlp.pipe_names:
+            nlp.add_pipe("sentencizer")
+        # The length limit guards the parser and NER's memory use, which are not loaded.
+        nlp.max_length = max(nlp.max_length, 10_000_000)
+        return nlp
+
     def extract_action_items(self, text: str) -> List[Dict[str, str]]:
         """Extract action items from text."""
-        doc = self.nlp(text)
+        return self._action_items_from_doc(self.nlp(text))
+
+    def extract_action_items_batch(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 32,
+        n_process: int = 1
+    ) -> List[List[Dict[str, str]]]:
+        """Extract action items from many texts with ``nlp.pipe``, one list per text."""
+        docs = self.nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return [self._action_items_from_doc(doc) for doc in docs]
+
+    def extract_action_items_from_segments(
+        self,
+        segments: Iterable,
+        batch_size: int = 32,
+        carry_limit: int = 1000
+    ) -> List[Dict]:
+        """Extract action items from time-aligned segments, one ``nlp.pipe`` pass over them.
+
+        ``segments`` are objects with ``start``, ``end`` and ``text``, such as a
+        Transcript. A sentence left unfinished at the end of a segment is
+        completed with the start of the next, so a phrase split across the
+        boundary is still found. Each action item is tagged with the ``start``
+        of the first segment and the ``end`` of the last segment its sentence
+        spans.
+        """
+        texts = self._join_unfinished_sentences(segments, carry_limit)
+        action_items = []
+        for doc, (carry_start, carried_chars, start, end) in self.nlp.pipe(texts, as_tuples=True, batch_size=batch_size):
+            for sent in doc.sents:
+                for item in self._action_items_from_sentence(sent.text):
+                    item["start"] = carry_start if sent.start_char < carried_chars else start
+                    item["end"] = end
+                    action_items.append(item)
+        return action_items
+
+    @staticmethod
+    def _join_unfinished_sentences(segments: Iterable, carry_limit: int) -> Iterator[Tuple[str, Tuple]]:
+        """Yield ``(text, (carry_start, carried_chars, start, end))`` for each segment's text.
+
+        An unfinished last sentence is moved to the front of the next
+        segment's text, while shorter than ``carry_limit`` characters so that
+        unpunctuated input cannot pile up. ``carried_chars`` is how much of
+        the text came from earlier segments, the first of which began at
+        ``carry_start``.
+        """
+        carry, carry_start, carry_end = "", None, None
+        for segment in segments:
+            text = segment.text.strip() if segment.text else ""
+            if not text:
+                continue
+            carried_chars, first_start = 0, segment.start
+            if carry:
+                text = f"{carry} {text}"
+                carried_chars, first_start = len(carry), carry_start
+
+            tail = re.split(r'(?<=[.!?])\s+', text)[-1]
+            carry = ""
+            if not tail.endswith(('.', '!', '?')) and len(tail) < carry_limit:
+                carry = tail
+                carry_start = first_start if len(tail) == len(text) else segment.start
+                carry_end = segment.end
+                text = text[:-len(tail)].rstrip()
+            if text:
+                yield text, (first_start, carried_chars, segment.start, segment.end)
+
+        if carry:
+            yield carry, (carry_start, len(carry), carry_start, carry_end)
+
+    @classmethod
+    def _action_items_from_doc(cls, doc) -> List[Dict[str, str]]:
         action_items = []
-        
-        action_patterns = [
-            r"need to (\w+)",
-            r"should (\w+)",
-            r"must (\w+)",
-            r"will (\w+)",
-            r"going to (\w+)"
-        ]
-        
         for sent in doc.sents:
-            sent_text = sent.text.lower()
-            
-            for pattern in action_patterns:
-                matches = re.finditer(pattern, sent_text)
-                for match in matches:
-                    action_items.append({
-                        "action": match.group(1),
-                        "context": sent.text,
-                        "priority": "medium"
-                    })
-        
-        return action_items
\ No newline at end of file
+            action_items.extend(cls._action_items_from_sentence(sent.text))
+
+        return action_items
+
+    @staticmethod
+    def _action_items_from_sentence(sent_text: str) -> List[Dict[str, str]]:
+        return [
+            {"action": match.group(1), "context": sent_text, "priority": "medium"}
+            for match in ACTION_PATTERN.finditer(sent_text.lower())
+        ]
@@ -1,25 +1,337 @@
-from typing import List
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import math
+import os
+import re
 from transformers import pipeline
 
+from ..utils.micro_batcher import MicroBatcher
+from ..utils.model_registry import model_registry
+
+# First-level chunks are summarized this many pipeline batches at a time, so
+# long inputs are never held as one full list of chunks.
+MAP_GROUP_BATCHES = 8
+
+# How the summarization model runs on CPU: "full" precision, "quantized" with
+# dynamic int8 Linear layers, the "distilled" model, or an "onnx" export
+# under ONNX Runtime.
+SUMMARIZER_MODES = ("full", "quantized", "distilled", "onnx")
+
+DISTILLED_MODEL = "sshleifer/distilbart-cnn-12-6"
+
 class ContentSummarizer:
-    def __init__(self, model_name: str = "facebook/bart-large-cnn"):
-        self.summarizer = pipeline("summarization", model=model_name)
-        
+    def __init__(
+        self,
+        model_name: str = "facebook/bart-large-cnn",
+        chunk_tokens: int = 900,
+        batch_size: int = 4,
+        reduce_depth: int = 3,
+        mode: str = "full",
+        num_threads: int = 0,
+        distilled_model: str = DISTILLED_MODEL,
+        onnx_dir: Optional[str] = None,
+        max_batch: int = 0,
+        max_wait_ms: float = 20.0
+    ):
+        if mode not in SUMMARIZER_MODES:
+            raise ValueError(f"Unknown summarizer mode: {mode}")
+        self.model_name = distilled_model if mode == "distilled" else model_name
+        self.chunk_tokens = chunk_tokens
+        self.batch_size = batch_size
+        self.reduce_depth = reduce_depth
+        self.mode = mode
+        self.num_threads = num_threads
+        self.onnx_dir = onnx_dir
+        # With max_batch set, generation requests from concurrent jobs are
+        # gathered into shared batches instead of each running on its own.
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+
+    @property
+    def summarizer(self):
+        return self.load_model()
+
+    @property
+    def model_key(self) -> Tuple:
+        return ("summarization", self.model_name, self.mode)
+
+    @property
+    def batcher(self) -> Optional[MicroBatcher]:
+        """The micro-batcher shared by every summarizer of this model, or None without micro-batching.
+
+        The first summarizer to use it sets its ``max_batch`` and ``max_wait_ms``.
+        """
+        if not self.max_batch:
+            return None
+        return model_registry.batcher(self.model_key, lambda: MicroBatcher(
+            lambda texts, options: self._run_buckets(texts, *options),
+            max_batch=self.max_batch,
+            max_wait_ms=self.max_wait_ms
+        ))
+
+    def load_model(self):
+        """Return the shared summarization pipeline, loading it on first use."""
+        return model_registry.get(self.model_key, self._load_pipeline)
+
+    def _inference_lock(self):
+        # The pipeline's fast tokenizer changes its truncation and padding
+        # state on every call and fails ("Already borrowed") when two threads
+        # do so at once, so concurrent jobs take turns.
+        return model_registry.usage_lock(self.model_key)
+
+    def unload_model(self):
+        """Drop the shared pipeline, and stop its micro-batcher, so its memory can be reclaimed."""
+        model_registry.unload(self.model_key)
+
+    def _load_pipeline(self):
+        if self.num_threads:
+            import torch
+
+            torch.set_num_threads(self.num_threads)
+        if self.mode == "quantized":
+            return self._load_quantized()
+        if self.mode == "onnx":
+            return self._load_onnx()
+        return pipeline("summarization", model=self.model_name)
+
+    def _load_quantized(self):
+        """The model with its Linear layers dynamically quantized to int8."""
+        import torch
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+        model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name).eval()
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        return pipeline("summarization", model=model, tokenizer=AutoTokenizer.from_pretrained(self.model_name))
+
+    def _load_onnx(self):
+        """The model exported to ONNX and run by ONNX Runtime.
+
+        With ``onnx_dir`` the export is saved there and reused by later runs,
+        since exporting takes longer than loading.
+        """
+        import onnxruntime
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        from transformers import AutoTokenizer
+
+        options = onnxruntime.SessionOptions()
+        if self.num_threads:
+            options.intra_op_num_threads = self.num_threads
+            options.inter_op_num_threads = 1
+
+        export_dir = os.path.join(self.onnx_dir, self.model_name.replace("/", "--")) if self.onnx_dir else None
+        if export_dir and os.path.isdir(export_dir):
+            model = ORTModelForSeq2SeqLM.from_pretrained(export_dir, session_options=options)
+            tokenizer = AutoTokenizer.from_pretrained(export_dir)
+        else:
+            model = ORTModelForSeq2SeqLM.from_pretrained(self.model_name, export=True, session_options=options)
+            tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            if export_dir:
+                model.save_pretrained(export_dir)
+                tokenizer.save_pretrained(export_dir)
+        return pipeline("summarization", model=model, tokenizer=tokenizer)
+
     def summarize(self, text: str, max_length: int = 130, min_length: int = 30) -> str:
-        """Generate a summary of the input text."""
-        summary = self.summarizer(text, max_length=max_length, min_length=min_length, do_sample=False)
-        return summary[0]['summary_text']
+        """Generate a summary of the input text.
+
+        Text that fits in one model window is summarized directly. Longer text is
+        split into token-bounded chunks whose summaries are generated in batches
+        and then reduced, up to ``reduce_depth`` levels.
+        """
+        return self.analyze_segments([text], max_length, min_length)["summary"]
+
+    def analyze(self, text: str, max_length: int = 130, min_length: int = 30) -> Dict[str, Any]:
+        """Summarize text and extract key points from one generation pass.
+
+        Key points come from the first-level chunk summaries of a map-reduce
+        run, or from the summary itself when the text fits in one window.
+        """
+        return self.analyze_segments([text], max_length, min_length)
+
+    def analyze_segments(
+        self,
+        texts: Iterable[str],
+        max_length: int = 130,
+        min_length: int = 30,
+        completed_chunks: Optional[List[str]] = None,
+        on_chunk_summaries: Optional[Callable[[List[str]], None]] = None
+    ) -> Dict[str, Any]:
+        """Like :meth:`analyze`, reading the text as a stream of pieces such as transcript segments.
+
+        Pieces are chunked as they arrive and first-level chunks are summarized
+        a group at a time, so the whole text is never joined into one string.
+        ``on_chunk_summaries`` receives each group's chunk summaries as they
+        are generated; passing them back as ``completed_chunks`` skips those
+        chunks when an interrupted run is repeated.
+        """
+        # The first few sentences decide whether the text is short enough for
+        # its own sentences to be the key points.
+        head: List[str] = []
+
+        def track(texts: Iterable[str]) -> Iterator[str]:
+            for text in texts:
+                if len(head) <= 5:
+                    head.extend(self._split_sentences(text))
+                yield text
+
+        chunks = self.iter_chunks(track(texts))
+        first = list(islice(chunks, 2))
+        if len(first) <= 1:
+            summary = self._generate(first or [""], max_length, min_length)[0]
+            chunk_summaries = [summary]
+        else:
+            summary, chunk_summaries = self._map_reduce(
+                chain(first, chunks), max_length, min_length, completed_chunks, on_chunk_summaries
+            )
+
+        if len(head) <= 5:
+            key_points = head
+        else:
+            key_points = [point for chunk_summary in chunk_summaries for point in self._split_sentences(chunk_summary)]
+        return {"summary": summary, "key_points": key_points}
+
+    def chunk_text(self, text: str) -> List[str]:
+        """Split text on sentence boundaries into chunks that fit the model window."""
+        return list(self.iter_chunks([text]))
+
+    def iter_chunks(self, texts: Iterable[str]) -> Iterator[str]:
+        """Yield model-window-sized chunks of a stream of texts, split on sentence boundaries."""
+        max_tokens = self._max_chunk_tokens()
+        current, current_tokens = [], 0
+
+        for sentences in self._iter_sentences(texts, carry_limit=4 * max_tokens):
+            with self._inference_lock():
+                input_ids = self.summarizer.tokenizer(sentences, add_special_tokens=False)["input_ids"]
+            token_counts = [len(ids) for ids in input_ids]
+            for sentence, tokens in zip(sentences, token_counts):
+                if tokens > max_tokens:
+                    if current:
+                        yield " ".join(current)
+                        current, current_tokens = [], 0
+                    yield from self._split_long_sentence(sentence, tokens, max_tokens)
+                    continue
+
+                if current_tokens + tokens > max_tokens:
+                    yield " ".join(current)
+                    current, current_tokens = [], 0
+                current.append(sentence)
+                current_tokens += tokens
+
+        if current:
+            yield " ".join(current)
+
+    @staticmethod
+    def _iter_sentences(texts: Iterable[str], carry_limit: int) -> Iterator[List[str]]:
+        """Yield the sentences of each text, keeping a sentence that runs into the next text whole.
+
+        An unfinished sentence is carried into the next text only while it is
+        shorter than ``carry_limit`` characters, so unpunctuated input cannot
+        pile up into one huge sentence.
+        """
+        carry = ""
+        for text in texts:
+            text = f"{carry} {text.strip()}" if carry else text.strip()
+            sentences = [s for s in re.split(r'(?<=[.!?])\s+', text) if s]
+            carry = ""
+            if sentences and not sentences[-1].endswith(('.', '!', '?')) and len(sentences[-1]) < carry_limit:
+                carry = sentences.pop()
+            if sentences:
+                yield sentences
+        if carry:
+            yield [carry]
+
+    def _max_chunk_tokens(self) -> int:
+        # Leave room for the special tokens the pipeline adds around each input.
+        model_max = getattr(self.summarizer.tokenizer, "model_max_length", self.chunk_tokens + 2)
+        return max(1, min(self.chunk_tokens, model_max - 2))
+
+    @staticmethod
+    def _split_long_sentence(sentence: str, tokens: int, max_tokens: int) -> List[str]:
+        words = sentence.split()
+        parts = math.ceil(tokens / max_tokens) + 1
+        size = math.ceil(len(words) / parts)
+        return [" ".join(words[i:i + size]) for i in range(0, len(words), size)]
+
+    def _map_reduce(
+        self,
+        chunks: Iterable[str],
+        max_length: int,
+        min_length: int,
+        completed: Optional[List[str]] = None,
+        on_summaries: Optional[Callable[[List[str]], None]] = None
+    ) -> Tuple[str, List[str]]:
+        """Return the final summary and the first level of chunk summaries."""
+        group_size = max(1, self.batch_size * MAP_GROUP_BATCHES)
+        chunk_summaries = list(completed or [])
+        group = []
+
+        def summarize_group(group: List[str]):
+            summaries = self._generate(group, max_length, min_length)
+            chunk_summaries.extend(summaries)
+            if on_summaries:
+                on_summaries(summaries)
+
+        # Chunking is deterministic, so the first chunks are the ones already summarized.
+        for chunk in islice(chunks, len(chunk_summaries), None):
+            group.append(chunk)
+            if len(group) >= group_size:
+                summarize_group(group)
+                group = []
+        if group:
+            summarize_group(group)
+
+        chunks = self.chunk_text(" ".join(chunk_summaries))
+        for _ in range(self.reduce_depth - 1):
+            if len(chunks) <= 1:
+                break
+            chunks = self.chunk_text(" ".join(self._generate(chunks, max_length, min_length)))
+
+        summary = self._generate([" ".join(chunks)], max_length, min_length)[0]
+        return summary, chunk_summaries
+
+    def _generate(self, texts: List[str], max_length: int, min_length: int) -> List[str]:
+        """Summarize several inputs, through the micro-batcher when one is configured."""
+        batcher = self.batcher
+        if batcher is not None:
+            return batcher.submit(texts, key=(max_length, min_length, self.batch_size))
+        return self._run_pipeline(texts, max_length, min_length, self.batch_size)
+
+    def _run_pipeline(self, texts: List[str], max_length: int, min_length: int, batch_size: int) -> List[str]:
+        """Run the pipeline over several inputs as padded batches."""
+        with self._inference_lock():
+            outputs = self.summarizer(
+                texts,
+                max_length=max_length,
+                min_length=min_length,
+                do_sample=False,
+                truncation=True,
+                batch_size=batch_size
+            )
+        return [output['summary_text'] for output in outputs]
+
+    def _run_buckets(self, texts: List[str], max_length: int, min_length: int, batch_size: int) -> List[str]:
+        """Run a gathered batch, already sorted by length, as buckets of ``batch_size`` neighbours.
+
+        Each bucket is padded only to its own longest input, rather than the
+        whole batch to the longest input of any caller.
+        """
+        summaries = []
+        for start in range(0, len(texts), batch_size):
+            bucket = texts[start:start + batch_size]
+            summaries.extend(self._run_pipeline(bucket, max_length, min_length, batch_size=len(bucket)))
+        return summaries
+
+    def batch_stats(self) -> Optional[Dict]:
+        """Achieved micro-batch sizes, or None without micro-batching."""
+        batcher = self.batcher
+        return batcher.stats() if batcher is not None else None
 
     def extract_key_points(self, text: str) -> List[str]:
         """Extract key points from the text."""
-
-        sentences = text.split('.')
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
+        sentences = self._split_sentences(text)
         if len(sentences) > 5:
-            summary = self.summarize(' '.join(sentences))
-            key_points = summary.split('.')
-        else:
-            key_points = sentences
-            
-        return [point.strip() for point in key_points if point.strip()]
\ No newline at end of file
+            return self.analyze(text)["key_points"]
+        return sentences
+
+    @staticmethod
+    def _split_sentences(text: str) -> List[str]:
+        return [s.strip() for s in text.split('.') if s.strip()]
@@ -0,0 +1,160 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+class ResultCache:
+    """Content-addressed on-disk cache of per-stage processing results.
+
+    Entries live at ``<cache_dir>/<stage>/<key[:2]>/<key>.json``. Keys are built
+    with :meth:`stage_key` from the stage's inputs and the settings that affect
+    it, so changing one stage's configuration only invalidates that stage and
+    the stages fed by its output. Reads refresh an entry's mtime, and the
+    oldest entries are evicted once the cache grows past ``max_bytes``.
+
+    The cache's size is measured once and then kept up to date as entries
+    are stored, so only a store that takes it over budget scans the
+    directory. Entries other processes store are counted at that scan.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 512 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+        # Guards the counters and the running size, updated from worker threads.
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def hash_file(file_path: str, block_size: int = 1024 * 1024) -> str:
+        """Return the SHA-256 hex digest of a file's bytes."""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(block_size), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def stage_key(stage: str, input_hash: str, config: Optional[Dict] = None) -> str:
+        """Build the cache key for a stage from its input hash and configuration."""
+        payload = json.dumps([stage, input_hash, config or {}], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, stage: str, key: str) -> Path:
+        return self.cache_dir / stage / key[:2] / f"{key}.json"
+
+    def get(self, stage: str, key: str) -> Optional[Any]:
+        """Return a cached value, or None on a miss."""
+        path = self._entry_path(stage, key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses[stage] += 1
+            return None
+
+        with self._lock:
+            self.hits[stage] += 1
+        return value
+
+    def set(self, stage: str, key: str, value: Any) -> None:
+        """Store a JSON-serializable value and evict old entries if over budget."""
+        if self._total_bytes is None:
+            total = sum(stat.st_size for _, stat in self._entries())
+            with self._lock:
+                if self._total_bytes is None:
+                    self._total_bytes = total
+
+        path = self._entry_path(stage, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(value, f, ensure_ascii=False)
+            written = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            self._total_bytes += written - replaced
+            over_budget = self._total_bytes > self.max_bytes
+        if over_budget:
+            self.evict()
+
+    def _entries(self):
+        for path in self.cache_dir.glob("*/*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            yield path, stat
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits ``max_bytes``."""
+        entries = list(self._entries())
+        total = sum(stat.st_size for _, stat in entries)
+        removed = 0
+
+        for path, stat in sorted(entries, key=lambda entry: entry[1].st_mtime):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            removed += 1
+
+        with self._lock:
+            self._total_bytes = total
+        if removed:
+            self.logger.info(f"Evicted {removed} cache entries")
+        return removed
+
+    def clear(self) -> None:
+        for path, _ in list(self._entries()):
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Report hit/miss counts for this process plus on-disk usage per stage."""
+        stages = defaultdict(lambda: {"entries": 0, "bytes": 0})
+        for path, stat in self._entries():
+            stage = path.parent.parent.name
+            stages[stage]["entries"] += 1
+            stages[stage]["bytes"] += stat.st_size
+
+        with self._lock:
+            hits, misses = dict(self.hits), dict(self.misses)
+        for stage in set(hits) | set(misses):
+            stages[stage]["hits"] = hits.get(stage, 0)
+            stages[stage]["misses"] = misses.get(stage, 0)
+
+        return {
+            "cache_dir": str(self.cache_dir),
+            "max_bytes": self.max_bytes,
+            "total_bytes": sum(stage["bytes"] for stage in stages.values()),
+            "total_entries": sum(stage["entries"] for stage in stages.values()),
+            "hits": sum(hits.values()),
+            "misses": sum(misses.values()),
+            "stages": dict(stages)
+        }
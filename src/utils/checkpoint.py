@@ -0,0 +1,183 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..audio.audio_buffer import AudioBuffer
+
+class JobCheckpoint:
+    """A job directory holding one file's intermediate results, so a failed run can resume.
+
+    Stage results are JSON files written atomically (``<stage>.json``), the
+    prepared audio is a ``.npy`` array that is memory-mapped back, and
+    results that arrive piece by piece, such as recognized chunks or chunk
+    summaries, are appended to ``<stream>.jsonl`` as each completes. The
+    manifest records the settings the results were produced with; a
+    checkpoint made with other settings is discarded on open.
+
+    Use ``open_for`` to get a file's job directory: it never hands out a
+    directory that another job in this process is still using.
+    """
+
+    _claimed = set()
+    _claim_lock = threading.Lock()
+
+    def __init__(self, directory: str, config: Optional[Dict] = None):
+        self.directory = Path(directory)
+        self.config = json.loads(json.dumps(config or {}, default=str))
+        self.logger = logging.getLogger(__name__)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Left behind if an earlier run was killed mid-write.
+        for path in self.directory.glob("*.tmp"):
+            path.unlink(missing_ok=True)
+
+        manifest = self._read_json(self.directory / "manifest.json")
+        if manifest is not None and manifest.get("config") != self.config:
+            self.logger.info(f"Discarding checkpoint made with other settings: {self.directory}")
+            self.clear()
+        elif manifest is None:
+            self.clear()
+
+    @staticmethod
+    def directory_for(root: str, file_path: str) -> Path:
+        """The job directory under ``root`` for an input file.
+
+        The name comes from the file's path, size and modification time, so a
+        file that is replaced gets a fresh checkpoint.
+        """
+        stat = os.stat(file_path)
+        identity = f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        digest = hashlib.sha256(identity.encode('utf-8')).hexdigest()[:16]
+        return Path(root) / f"{Path(file_path).stem}-{digest}"
+
+    @classmethod
+    def open_for(cls, root: str, file_path: str, config: Optional[Dict] = None, resume: bool = False) -> "JobCheckpoint":
+        """Claim a job directory for an input file, to be released by ``remove`` or ``release``.
+
+        With ``resume``, the first directory an earlier run of the file left
+        behind that no live job holds is picked up; otherwise the file's
+        directory is started afresh. A job for a file whose directory is in
+        use gets a directory of its own, with a unique suffix.
+        """
+        base = cls.directory_for(root, file_path)
+        with cls._claim_lock:
+            candidates = [base]
+            if resume:
+                left_behind = [base, *sorted(base.parent.glob(f"{base.name}-*"))]
+                candidates = [path for path in left_behind if path.is_dir()] + candidates
+            directory = next((path for path in candidates if path not in cls._claimed), None)
+            if directory is None:
+                directory = base.with_name(f"{base.name}-{uuid.uuid4().hex[:8]}")
+            cls._claimed.add(directory)
+
+        try:
+            checkpoint = cls(directory, config)
+            if not resume:
+                checkpoint.clear()
+        except BaseException:
+            cls._release(directory)
+            raise
+        return checkpoint
+
+    def has(self, stage: str) -> bool:
+        return (self.directory / f"{stage}.json").exists()
+
+    def load(self, stage: str) -> Optional[Any]:
+        """A stage's saved result, or None if it has none or the file is unreadable."""
+        value = self._read_json(self.directory / f"{stage}.json")
+        return value["value"] if value is not None else None
+
+    def save(self, stage: str, value: Any):
+        # Wrapped so a stage whose result is None still counts as done.
+        self._write_atomic(f"{stage}.json", lambda f: f.write(json.dumps({"value": value}, ensure_ascii=False).encode('utf-8')))
+
+    def save_audio(self, buffer: AudioBuffer):
+        self._write_atomic("audio.npy", lambda f: np.save(f, buffer.samples))
+        self.save("audio", {"sample_rate": buffer.sample_rate, "sample_width": buffer.sample_width})
+
+    def load_audio(self) -> Optional[AudioBuffer]:
+        """The saved audio, memory-mapped rather than read into memory."""
+        audio_format = self.load("audio")
+        if audio_format is None:
+            return None
+        try:
+            samples = np.load(self.directory / "audio.npy", mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+        return AudioBuffer(samples, audio_format["sample_rate"], audio_format["sample_width"])
+
+    def append(self, stream: str, record: Any):
+        """Add one record to a stream, flushed to disk before returning."""
+        with open(self.directory / f"{stream}.jsonl", 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def read(self, stream: str) -> List[Any]:
+        """A stream's records, ignoring a last line cut short by a crash."""
+        records = []
+        try:
+            with open(self.directory / f"{stream}.jsonl", 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        break
+        except OSError:
+            pass
+        return records
+
+    def discard(self, *names: str):
+        """Remove saved results that later stages have superseded, e.g. the audio once transcribed."""
+        for name in names:
+            for path in self.directory.glob(f"{name}.*"):
+                path.unlink(missing_ok=True)
+
+    def clear(self):
+        """Start over: remove every saved result and write a fresh manifest."""
+        for path in self.directory.iterdir():
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+        self._write_atomic("manifest.json", lambda f: f.write(json.dumps({"config": self.config}).encode('utf-8')))
+
+    def remove(self):
+        """Delete the job directory once the job has completed."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.release()
+
+    def release(self):
+        """Keep the job directory but let a later job resume from it."""
+        self._release(self.directory)
+
+    @classmethod
+    def _release(cls, directory: Path):
+        with cls._claim_lock:
+            cls._claimed.discard(directory)
+
+    def _write_atomic(self, name: str, write):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, self.directory / name)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _read_json(path: Path) -> Optional[Dict]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
@@ -0,0 +1,172 @@
+import logging
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+_STOP = object()
+
+class JobQueue:
+    """Run submitted jobs on a fixed pool of worker threads and track each one.
+
+    ``process`` is called with a job's payload and a ``progress(stage,
+    fraction)`` callback and returns the job's result. At most ``max_queued``
+    jobs wait at a time; ``submit`` raises ``queue.Full`` beyond that rather
+    than letting work pile up. The most recent ``keep_finished`` finished
+    jobs are kept for status and result lookups.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[Dict, Callable[[str, float], None]], Any],
+        workers: int = 1,
+        max_queued: int = 64,
+        keep_finished: int = 1000
+    ):
+        if workers < 1:
+            raise ValueError("A job queue needs at least one worker")
+        self.process = process
+        self.workers = workers
+        self.max_queued = max_queued
+        self.keep_finished = keep_finished
+        self.logger = logging.getLogger(__name__)
+        # Capacity is enforced in submit, so stopping the workers never blocks.
+        self._queue = queue.Queue()
+        self._waiting = 0
+        self._jobs: Dict[str, Dict] = {}
+        self._finished = deque()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._draining = False
+
+    def start(self):
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    @property
+    def draining(self) -> bool:
+        return self._draining
+
+    def submit(self, payload: Dict) -> Dict:
+        """Queue a job and return its status.
+
+        Raises ``queue.Full`` when the queue is at capacity and RuntimeError
+        once the queue is draining.
+        """
+        job = {
+            "id": uuid.uuid4().hex,
+            "status": "queued",
+            "payload": payload,
+            "stage": None,
+            "progress": 0.0,
+            "submitted_at": datetime.now().isoformat(),
+            "started_at": None,
+            "finished_at": None,
+            "error": None,
+            "result": None
+        }
+        with self._lock:
+            if self._draining:
+                raise RuntimeError("The job queue is draining and accepts no new jobs")
+            if self._waiting >= self.max_queued:
+                raise queue.Full(f"{self._waiting} jobs are already queued")
+            self._waiting += 1
+            self._jobs[job["id"]] = job
+            self._queue.put(job)
+        return self._status(job)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Status of a job, or None if it is unknown or has been forgotten."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self._status(job) if job else None
+
+    def result(self, job_id: str) -> Optional[Dict]:
+        """The job's status with its ``result`` once it has completed."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return dict(self._status(job), result=job["result"])
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job that has not started yet."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job["status"] != "queued":
+                return False
+            self._waiting -= 1
+            self._finish(job, "cancelled")
+            return True
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counts = {"queued": 0, "running": 0, "completed": 0, "failed": 0, "cancelled": 0}
+            for job in self._jobs.values():
+                counts[job["status"]] += 1
+        return dict(counts, workers=self.workers, max_queued=self.max_queued, draining=self._draining)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Stop accepting jobs, let queued and running jobs finish, then stop the workers.
+
+        Returns False if ``timeout`` seconds pass first; the workers are
+        daemon threads, so whatever is left stops with the process.
+        """
+        with self._lock:
+            self._draining = True
+        for _ in self._threads:
+            self._queue.put(_STOP)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        return not any(thread.is_alive() for thread in self._threads)
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                break
+
+            with self._lock:
+                if job["status"] != "queued":
+                    continue
+                self._waiting -= 1
+                job["status"] = "running"
+                job["started_at"] = datetime.now().isoformat()
+
+            def progress(stage: str, fraction: float, job=job):
+                with self._lock:
+                    job["stage"] = stage
+                    job["progress"] = fraction
+
+            try:
+                result = self.process(job["payload"], progress)
+            except Exception as e:
+                self.logger.error(f"Job {job['id']} failed: {str(e)}")
+                with self._lock:
+                    job["error"] = str(e)
+                    self._finish(job, "failed")
+                continue
+
+            with self._lock:
+                job["result"] = result
+                job["progress"] = 1.0
+                self._finish(job, "completed")
+
+    def _finish(self, job: Dict, status: str):
+        # Called with the lock held.
+        job["status"] = status
+        job["finished_at"] = datetime.now().isoformat()
+        self._finished.append(job["id"])
+        while len(self._finished) > self.keep_finished:
+            self._jobs.pop(self._finished.popleft(), None)
+
+    @staticmethod
+    def _status(job: Dict) -> Dict:
+        return {key: value for key, value in job.items() if key not in ("payload", "result")}
@@ -0,0 +1,168 @@
+import json
+import logging
+import os
+import queue
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional
+
+from .job_queue import JobQueue
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """ThreadingHTTPServer's counterpart on a Unix domain socket."""
+
+    daemon_threads = True
+
+    def server_bind(self):
+        # A socket file left behind by an earlier run would make bind fail.
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+        super().server_bind()
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    """JSON API over the server's JobQueue.
+
+    ``POST /jobs`` submits a job, ``GET /jobs/<id>`` reports its status and
+    progress, ``GET /jobs/<id>/result`` returns its result once completed,
+    ``DELETE /jobs/<id>`` cancels it while still queued, ``GET /status``
+    reports the queue and ``GET /metrics`` the server's metrics, if any.
+    """
+
+    def do_GET(self):
+        parts = self._path_parts()
+        if parts == ["status"]:
+            return self._reply(200, self.server.status())
+        if parts == ["metrics"] and self.server.metrics is not None:
+            return self._reply_text(200, self.server.metrics())
+        if len(parts) == 2 and parts[0] == "jobs":
+            status = self.server.jobs.get(parts[1])
+            return self._reply(200, status) if status else self._not_found()
+        if len(parts) == 3 and parts[0] == "jobs" and parts[2] == "result":
+            job = self.server.jobs.result(parts[1])
+            if job is None:
+                return self._not_found()
+            if job["status"] != "completed":
+                return self._reply(409, {"error": f"Job is {job['status']}", "job": {k: v for k, v in job.items() if k != "result"}})
+            return self._reply(200, job)
+        self._not_found()
+
+    def do_POST(self):
+        if self._path_parts() != ["jobs"]:
+            return self._not_found()
+        try:
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+            payload = self.server.validate(payload)
+        except (ValueError, TypeError) as e:
+            return self._reply(400, {"error": str(e)})
+
+        try:
+            status = self.server.jobs.submit(payload)
+        except queue.Full as e:
+            return self._reply(503, {"error": f"Job queue is full: {str(e)}"}, retry_after=5)
+        except RuntimeError as e:
+            return self._reply(503, {"error": str(e)})
+        self._reply(202, status)
+
+    def do_DELETE(self):
+        parts = self._path_parts()
+        if len(parts) != 2 or parts[0] != "jobs":
+            return self._not_found()
+        if self.server.jobs.cancel(parts[1]):
+            return self._reply(200, self.server.jobs.get(parts[1]))
+        status = self.server.jobs.get(parts[1])
+        if status is None:
+            return self._not_found()
+        self._reply(409, {"error": f"Job is {status['status']}", "job": status})
+
+    def _path_parts(self):
+        return [part for part in self.path.split("?", 1)[0].split("/") if part]
+
+    def _not_found(self):
+        self._reply(404, {"error": "Not found"})
+
+    def _reply(self, code: int, payload: Dict, retry_after: Optional[int] = None):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if retry_after is not None:
+            self.send_header("Retry-After", str(retry_after))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _reply_text(self, code: int, text: str):
+        data = text.encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no address.
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        logging.getLogger(__name__).debug(f"{self.address_string()} {format % args}")
+
+class JobServer:
+    """Serve a JobQueue over HTTP on a TCP port or a Unix domain socket.
+
+    ``validate`` checks a submitted payload and returns it, raising
+    ValueError for a bad request. ``metrics`` returns the text served at
+    ``/metrics``. ``shutdown`` drains the queue before the server stops, so
+    jobs already accepted are finished and their status stays available
+    until then.
+    """
+
+    def __init__(
+        self,
+        jobs: JobQueue,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        socket_path: Optional[str] = None,
+        validate: Callable[[Dict], Dict] = lambda payload: payload,
+        metrics: Optional[Callable[[], str]] = None,
+        status: Optional[Callable[[], Dict]] = None
+    ):
+        self.jobs = jobs
+        self.socket_path = socket_path
+        self.logger = logging.getLogger(__name__)
+        if socket_path:
+            self.server = UnixHTTPServer(socket_path, JobRequestHandler)
+        else:
+            self.server = ThreadingHTTPServer((host, port), JobRequestHandler)
+            self.server.daemon_threads = True
+        self.server.jobs = jobs
+        self.server.validate = validate
+        self.server.metrics = metrics
+        self.server.status = lambda: dict(jobs.stats(), **(status() if status else {}))
+
+    @property
+    def address(self) -> str:
+        if self.socket_path:
+            return f"unix:{self.socket_path}"
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self):
+        """Start the workers and serve requests until ``shutdown`` completes."""
+        self.jobs.start()
+        try:
+            self.server.serve_forever(poll_interval=0.1)
+        finally:
+            self.server.server_close()
+            if self.socket_path and os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+    def shutdown(self, timeout: Optional[float] = None) -> bool:
+        """Drain the queue, then stop serving. Call it from another thread than ``serve_forever``.
+
+        Returns False if jobs were still running when ``timeout`` ran out.
+        """
+        self.logger.info("Draining job queue")
+        drained = self.jobs.drain(timeout)
+        if not drained:
+            self.logger.warning("Drain timed out with jobs still running")
+        self.server.shutdown()
+        return drained
@@ -0,0 +1,232 @@
+import logging
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+DURATION_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 1800.0)
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes, where /proc is available."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+def max_rss() -> int:
+    """The process's lifetime peak RSS in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+class PeakRSSMonitor:
+    """Sample RSS on a background thread to find the peak while a block runs.
+
+    ``ru_maxrss`` only ever grows, so it cannot attribute a peak to one stage
+    once an earlier stage has used more. Where RSS cannot be sampled the
+    lifetime peak is reported instead.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.start_rss = 0
+        self.peak_rss = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak_rss = max(self.peak_rss, current_rss() or 0)
+
+    def __enter__(self) -> "PeakRSSMonitor":
+        rss = current_rss()
+        if rss is not None:
+            self.start_rss = self.peak_rss = rss
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._thread is None:
+            self.peak_rss = max_rss()
+            return
+        self._stop.set()
+        self._thread.join()
+        self.peak_rss = max(self.peak_rss, current_rss() or 0)
+
+class MetricsHook:
+    """Receives stage events from a MetricsCollector; subclass to feed a tracer.
+
+    ``context`` is the dict passed to ``MetricsCollector.stage`` (for example
+    the file being processed) and is the same object in both calls, so a hook
+    can keep its span there.
+    """
+
+    def stage_started(self, stage: str, context: Dict):
+        pass
+
+    def stage_finished(self, stage: str, context: Dict, measurement: Dict, error: Optional[BaseException]):
+        pass
+
+class MetricsCollector:
+    """Measure processing stages and aggregate them for export.
+
+    Each stage records wall time, CPU time and peak RSS. CPU time is the
+    process's, so it includes the worker threads a stage fans out to, and
+    stages that overlap in a pipelined run each see the other's CPU use.
+    Totals are exported in the Prometheus text format or as OpenMetrics.
+    """
+
+    def __init__(self, namespace: str = "echoes", memory_interval: float = 0.01):
+        self.namespace = namespace
+        self.memory_interval = memory_interval
+        self.hooks: List[MetricsHook] = []
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Drop every aggregated value."""
+        with self._lock:
+            self._stages: Dict[str, Dict] = {}
+            self._sizes: Dict[str, float] = {}
+
+    def add_hook(self, hook: MetricsHook):
+        self.hooks.append(hook)
+
+    @contextmanager
+    def stage(self, name: str, context: Optional[Dict] = None) -> Iterator[Dict]:
+        """Measure the enclosed block as one run of stage ``name``.
+
+        Yields the measurement dict, which holds ``wall_seconds``,
+        ``cpu_seconds`` and ``peak_rss_bytes`` once the block exits.
+        """
+        context = context if context is not None else {}
+        measurement: Dict = {}
+        error = None
+        self._call_hooks("stage_started", name, context)
+        monitor = PeakRSSMonitor(self.memory_interval)
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            with monitor:
+                yield measurement
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            measurement["wall_seconds"] = time.perf_counter() - start_wall
+            measurement["cpu_seconds"] = time.process_time() - start_cpu
+            measurement["peak_rss_bytes"] = monitor.peak_rss
+            self._observe(name, measurement, error is not None)
+            self._call_hooks("stage_finished", name, context, measurement, error)
+
+    def observe_size(self, name: str, value: float):
+        """Add to an input size counter, such as ``audio_seconds``."""
+        with self._lock:
+            self._sizes[name] = self._sizes.get(name, 0.0) + value
+
+    def _observe(self, name: str, measurement: Dict, failed: bool):
+        with self._lock:
+            totals = self._stages.setdefault(name, {
+                "count": 0,
+                "errors": 0,
+                "wall_seconds": 0.0,
+                "cpu_seconds": 0.0,
+                "peak_rss_bytes": 0,
+                "buckets": [0] * len(DURATION_BUCKETS)
+            })
+            totals["count"] += 1
+            totals["errors"] += int(failed)
+            totals["wall_seconds"] += measurement["wall_seconds"]
+            totals["cpu_seconds"] += measurement["cpu_seconds"]
+            totals["peak_rss_bytes"] = max(totals["peak_rss_bytes"], measurement["peak_rss_bytes"])
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if measurement["wall_seconds"] <= bound:
+                    totals["buckets"][i] += 1
+
+    def _call_hooks(self, method: str, *args):
+        for hook in self.hooks:
+            try:
+                getattr(hook, method)(*args)
+            except Exception as e:
+                self.logger.error(f"Metrics hook {type(hook).__name__}.{method} failed: {str(e)}")
+
+    def snapshot(self) -> Dict:
+        """Aggregated totals per stage and input size counters."""
+        with self._lock:
+            return {
+                "stages": {name: {k: v for k, v in totals.items() if k != "buckets"} for name, totals in self._stages.items()},
+                "sizes": dict(self._sizes)
+            }
+
+    def to_prometheus(self, openmetrics: bool = False) -> str:
+        """Render the totals in the Prometheus text format, or as OpenMetrics."""
+        prefix = self.namespace
+        lines = []
+
+        def family(name: str, kind: str, help_text: str):
+            # OpenMetrics names a counter family without the _total suffix its samples carry.
+            declared = f"{name}_total" if kind == "counter" and not openmetrics else name
+            lines.append(f"# HELP {declared} {help_text}")
+            lines.append(f"# TYPE {declared} {kind}")
+
+        with self._lock:
+            stages = sorted(self._stages.items())
+            sizes = sorted(self._sizes.items())
+
+            family(f"{prefix}_stage_duration_seconds", "histogram", "Wall time spent in each processing stage.")
+            for name, totals in stages:
+                for bound, count in zip(DURATION_BUCKETS, totals["buckets"]):
+                    lines.append(f'{prefix}_stage_duration_seconds_bucket{{stage="{name}",le="{bound}"}} {count}')
+                lines.append(f'{prefix}_stage_duration_seconds_bucket{{stage="{name}",le="+Inf"}} {totals["count"]}')
+                lines.append(f'{prefix}_stage_duration_seconds_sum{{stage="{name}"}} {totals["wall_seconds"]}')
+                lines.append(f'{prefix}_stage_duration_seconds_count{{stage="{name}"}} {totals["count"]}')
+
+            family(f"{prefix}_stage_cpu_seconds", "counter", "Process CPU time used while each stage ran.")
+            for name, totals in stages:
+                lines.append(f'{prefix}_stage_cpu_seconds_total{{stage="{name}"}} {totals["cpu_seconds"]}')
+
+            family(f"{prefix}_stage_errors", "counter", "Stage runs that raised an error.")
+            for name, totals in stages:
+                lines.append(f'{prefix}_stage_errors_total{{stage="{name}"}} {totals["errors"]}')
+
+            family(f"{prefix}_stage_peak_rss_bytes", "gauge", "Highest resident memory seen while each stage ran.")
+            for name, totals in stages:
+                lines.append(f'{prefix}_stage_peak_rss_bytes{{stage="{name}"}} {totals["peak_rss_bytes"]}')
+
+            for name, value in sizes:
+                family(f"{prefix}_{name}", "counter", f"Total {name.replace('_', ' ')} processed.")
+                lines.append(f"{prefix}_{name}_total {value}")
+
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str, openmetrics: Optional[bool] = None):
+        """Atomically write the metrics file, e.g. for node_exporter's textfile collector.
+
+        The format follows the extension (``.om`` or ``.openmetrics`` for
+        OpenMetrics) unless ``openmetrics`` is given.
+        """
+        if openmetrics is None:
+            openmetrics = path.endswith((".om", ".openmetrics"))
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # A temp file of its own per call: threads of one process write concurrently.
+        fd, tmp_path = tempfile.mkstemp(dir=directory or ".", prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.to_prometheus(openmetrics))
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -0,0 +1,141 @@
+import logging
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+class _Request:
+    __slots__ = ("key", "item", "future", "arrived", "caller")
+
+    def __init__(self, key: Hashable, item: Any, arrived: float, caller: object):
+        self.key = key
+        self.item = item
+        self.future = Future()
+        self.arrived = arrived
+        self.caller = caller
+
+class MicroBatcher:
+    """Gather items submitted from many threads and process them in batches.
+
+    A batch is started by the oldest waiting item and closes once it holds
+    ``max_batch`` items or ``max_wait_ms`` has passed since that item
+    arrived. Only items with the same ``key`` (for example the same
+    generation settings) share a batch. Each batch is sorted by ``length``
+    before ``process_batch`` sees it, so inputs padded together are of
+    similar size, and results are handed back in each caller's order.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any], Hashable], List[Any]],
+        max_batch: int = 16,
+        max_wait_ms: float = 20.0,
+        length: Callable[[Any], int] = len
+    ):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.process_batch = process_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.length = length
+        self.logger = logging.getLogger(__name__)
+        self._pending = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._stats = {"batches": 0, "items": 0, "callers": 0, "wait_seconds": 0.0, "sizes": Counter()}
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, items: List[Any], key: Hashable = None) -> List[Any]:
+        """Process ``items`` as part of whatever batches form, and return their results in order."""
+        futures = self.submit_async(items, key)
+        return [future.result() for future in futures]
+
+    def submit_async(self, items: List[Any], key: Hashable = None) -> List[Future]:
+        now = time.monotonic()
+        caller = object()
+        requests = [_Request(key, item, now, caller) for item in items]
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The batcher is closed")
+            self._pending.extend(requests)
+            self._condition.notify()
+        return [request.future for request in requests]
+
+    def stats(self) -> Dict:
+        """Batch counts and the distribution of achieved batch sizes."""
+        with self._condition:
+            batches = self._stats["batches"]
+            return {
+                "batches": batches,
+                "items": self._stats["items"],
+                "mean_batch_size": self._stats["items"] / batches if batches else 0.0,
+                "max_batch_size": max(self._stats["sizes"], default=0),
+                "mean_callers_per_batch": self._stats["callers"] / batches if batches else 0.0,
+                "mean_wait_ms": 1000 * self._stats["wait_seconds"] / self._stats["items"] if self._stats["items"] else 0.0,
+                "batch_sizes": dict(sorted(self._stats["sizes"].items()))
+            }
+
+    def close(self):
+        """Process what is already waiting, then stop the batching thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._process(batch)
+
+    def _next_batch(self) -> Optional[List[_Request]]:
+        with self._condition:
+            while not self._pending:
+                if self._closed:
+                    return None
+                self._condition.wait()
+
+            key = self._pending[0].key
+            deadline = self._pending[0].arrived + self.max_wait
+            while not self._closed and self._count(key) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            batch, rest = [], deque()
+            for request in self._pending:
+                if request.key == key and len(batch) < self.max_batch:
+                    batch.append(request)
+                else:
+                    rest.append(request)
+            self._pending = rest
+            return batch
+
+    def _count(self, key: Hashable) -> int:
+        return sum(1 for request in self._pending if request.key == key)
+
+    def _process(self, batch: List[_Request]):
+        started = time.monotonic()
+        batch.sort(key=lambda request: self.length(request.item))
+        try:
+            results = self.process_batch([request.item for request in batch], batch[0].key)
+            if len(results) != len(batch):
+                raise RuntimeError(f"Batch of {len(batch)} items returned {len(results)} results")
+        except Exception as e:
+            self.logger.error(f"Batch of {len(batch)} failed: {str(e)}")
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        with self._condition:
+            self._stats["batches"] += 1
+            self._stats["items"] += len(batch)
+            self._stats["callers"] += len({request.caller for request in batch})
+            self._stats["wait_seconds"] += sum(started - request.arrived for request in batch)
+            self._stats["sizes"][len(batch)] += 1
+        for request, result in zip(batch, results):
+            request.future.set_result(result)
@@ -0,0 +1,74 @@
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, List
+
+class ModelRegistry:
+    """Process-wide store of loaded models.
+
+    Each model is loaded by its ``loader`` the first time its key is requested
+    and then shared by every caller in the process. Loads of different keys can
+    run concurrently; concurrent requests for the same key wait for one load.
+    Models that must not be used from several threads at once are guarded by
+    their ``usage_lock``, and requests to a model can be gathered into shared
+    batches by its ``batcher``.
+    """
+
+    def __init__(self):
+        self._models: Dict[Hashable, Any] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._usage_locks: Dict[Hashable, threading.RLock] = {}
+        self._batchers: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the model for ``key``, loading it with ``loader`` on first use."""
+        if key in self._models:
+            return self._models[key]
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            if key not in self._models:
+                self.logger.info(f"Loading model {key}")
+                self._models[key] = loader()
+            return self._models[key]
+
+    def usage_lock(self, key: Hashable) -> threading.RLock:
+        """The lock every user of the model for ``key`` holds while calling it."""
+        with self._lock:
+            return self._usage_locks.setdefault(key, threading.RLock())
+
+    def batcher(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """The batcher every user of the model for ``key`` submits to, made by ``factory`` on first use.
+
+        It is closed when the model is unloaded.
+        """
+        with self._lock:
+            if key not in self._batchers:
+                self._batchers[key] = factory()
+            return self._batchers[key]
+
+    def is_loaded(self, key: Hashable) -> bool:
+        return key in self._models
+
+    def loaded(self) -> List[Hashable]:
+        return list(self._models)
+
+    def unload(self, key: Hashable) -> None:
+        with self._lock:
+            self._models.pop(key, None)
+            batcher = self._batchers.pop(key, None)
+        if batcher is not None:
+            batcher.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+            batchers = list(self._batchers.values())
+            self._batchers.clear()
+        for batcher in batchers:
+            batcher.close()
+
+model_registry = ModelRegistry()
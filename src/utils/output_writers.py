@@ -0,0 +1,218 @@
+import gzip
+import json
+from typing import Any, Dict, Iterable, Optional
+
+from ..audio.transcript import Transcript
+
+OUTPUT_FORMATS = ("json", "compact", "jsonl", "msgpack")
+
+_EXTENSIONS = {"json": ".json", "compact": ".json", "jsonl": ".jsonl", "msgpack": ".msgpack"}
+
+def output_extension(output_format: str = "json", compress: bool = False) -> str:
+    """File extension for results written in ``output_format``."""
+    if output_format not in _EXTENSIONS:
+        raise ValueError(f"Unknown output format: {output_format}")
+    return _EXTENSIONS[output_format] + (".gz" if compress else "")
+
+def create_writer(path: str, output_format: str = "json", compress: Optional[bool] = None) -> "ResultWriter":
+    """Writer for ``output_format``; gzip follows a ``.gz`` path unless ``compress`` is given."""
+    if compress is None:
+        compress = path.endswith(".gz")
+    if output_format == "json":
+        return JSONWriter(path, compress)
+    if output_format == "compact":
+        return JSONWriter(path, compress, compact=True)
+    if output_format == "jsonl":
+        return JSONLinesWriter(path, compress)
+    if output_format == "msgpack":
+        return MsgpackWriter(path, compress)
+    raise ValueError(f"Unknown output format: {output_format}")
+
+def read_results(path: str) -> Dict:
+    """Read a results file written in any output format back into a dict.
+
+    The format follows the file extension, gzipped for a ``.gz`` path.
+    Segments come back as a list of dicts whatever the format stored.
+    """
+    compressed = path.endswith(".gz")
+    base = path[:-3] if compressed else path
+    if base.endswith(".msgpack"):
+        import msgpack
+
+        with (gzip.open(path, 'rb') if compressed else open(path, 'rb')) as f:
+            results = {record["field"]: record["value"] for record in msgpack.Unpacker(f, raw=False)}
+        if isinstance(results.get("segments"), dict):
+            results["segments"] = Transcript.from_dict(results["segments"]).to_list()
+        return results
+
+    with (gzip.open(path, 'rt', encoding='utf-8') if compressed else open(path, 'r', encoding='utf-8')) as f:
+        if not base.endswith(".jsonl"):
+            return json.load(f)
+        results = {}
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record["field"] == "segments":
+                results.setdefault("segments", []).append(record["value"])
+            else:
+                results[record["field"]] = record["value"]
+        return results
+
+class ResultWriter:
+    """Write one file's results field by field, as each becomes available.
+
+    Open it as a context manager and call ``write_field`` for every result
+    field, or ``write`` to write a whole results dict. Transcript values are
+    written a segment at a time rather than converted to a list first, and
+    a ``segments`` list is laid out the same way.
+    """
+
+    binary = False
+
+    def __init__(self, path: str, compress: bool = False):
+        self.path = path
+        self.compress = compress
+        self._file = None
+        self._count = 0
+
+    def open(self) -> "ResultWriter":
+        if self.binary:
+            self._file = gzip.open(self.path, 'wb') if self.compress else open(self.path, 'wb')
+        elif self.compress:
+            self._file = gzip.open(self.path, 'wt', encoding='utf-8')
+        else:
+            self._file = open(self.path, 'w', encoding='utf-8')
+        self._count = 0
+        self._begin()
+        return self
+
+    def close(self):
+        if self._file is None:
+            return
+        try:
+            self._end()
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "ResultWriter":
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write_field(self, key: str, value: Any):
+        self._write_field(key, value)
+        self._count += 1
+
+    def write(self, results: Dict):
+        for key, value in results.items():
+            self.write_field(key, value)
+
+    def _begin(self):
+        pass
+
+    def _write_field(self, key: str, value: Any):
+        raise NotImplementedError
+
+    def _end(self):
+        pass
+
+    @staticmethod
+    def _segments(key: str, value: Any):
+        """The segment dicts of a transcript field, or None for any other field.
+
+        Segments arrive as a Transcript while a file is processed and as a
+        list of dicts in a finished results dict; both are written alike.
+        """
+        if isinstance(value, Transcript):
+            return value.iter_dicts()
+        if key == "segments" and isinstance(value, list):
+            return value
+        return None
+
+class JSONWriter(ResultWriter):
+    """One JSON object, indented or, with ``compact``, without any whitespace."""
+
+    def __init__(self, path: str, compress: bool = False, compact: bool = False):
+        super().__init__(path, compress)
+        self.compact = compact
+
+    def _begin(self):
+        self._file.write("{")
+
+    def _write_field(self, key: str, value: Any):
+        if self.compact:
+            self._file.write(("," if self._count else "") + json.dumps(key, ensure_ascii=False) + ":")
+        else:
+            self._file.write((",\n  " if self._count else "\n  ") + json.dumps(key, ensure_ascii=False) + ": ")
+
+        segments = self._segments(key, value)
+        if segments is not None:
+            self._write_segments(segments)
+        elif self.compact:
+            self._file.write(json.dumps(value, separators=(",", ":"), ensure_ascii=False))
+        else:
+            self._file.write(json.dumps(value, indent=2, ensure_ascii=False).replace("\n", "\n  "))
+
+    def _write_segments(self, segments: Iterable[Dict]):
+        """Write the segments as a JSON array; indented output puts each on its own line."""
+        separator, first = (",", "") if self.compact else (",\n    ", "\n    ")
+        self._file.write("[")
+        position = 0
+        for position, segment in enumerate(segments, 1):
+            self._file.write(separator if position > 1 else first)
+            if self.compact:
+                self._file.write(json.dumps(segment, separators=(",", ":"), ensure_ascii=False))
+            else:
+                self._file.write(json.dumps(segment, ensure_ascii=False))
+        self._file.write("\n  ]" if position and not self.compact else "]")
+
+    def _end(self):
+        self._file.write("}\n" if self.compact or not self._count else "\n}\n")
+
+class JSONLinesWriter(ResultWriter):
+    """One ``{"field", "value"}`` JSON object per line, flushed as it is written.
+
+    A transcript field is written one line per segment, each carrying the
+    field name, so a reader can follow the file while it is being written.
+    """
+
+    def _write_field(self, key: str, value: Any):
+        segments = self._segments(key, value)
+        if segments is not None:
+            for segment in segments:
+                self._write_line(key, segment)
+        else:
+            self._write_line(key, value)
+        self._file.flush()
+
+    def _write_line(self, key: str, value: Any):
+        self._file.write(json.dumps({"field": key, "value": value}, separators=(",", ":"), ensure_ascii=False) + "\n")
+
+class MsgpackWriter(ResultWriter):
+    """A stream of msgpack ``{"field", "value"}`` maps, read back with ``msgpack.Unpacker``.
+
+    Transcripts are stored column-wise, as ``Transcript.to_dict`` lays them
+    out, which is far smaller than a map per segment. Needs the optional
+    ``msgpack`` package.
+    """
+
+    binary = True
+
+    def __init__(self, path: str, compress: bool = False):
+        # Imported here, before any output is opened, so a missing package
+        # fails the run up front.
+        import msgpack
+
+        super().__init__(path, compress)
+        self._packer = msgpack.Packer(use_bin_type=True)
+
+    def _write_field(self, key: str, value: Any):
+        if key == "segments" and isinstance(value, list):
+            value = Transcript.from_segments(value)
+        if isinstance(value, Transcript):
+            value = value.to_dict()
+        self._file.write(self._packer.pack({"field": key, "value": value}))
+        self._file.flush()
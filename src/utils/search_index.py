@@ -0,0 +1,504 @@
+import json
+import logging
+import math
+import os
+import re
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from functools import reduce
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..audio.transcript import Transcript
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+SEARCH_FIELDS = ("transcript", "summary", "key_points", "action_items")
+
+_TOKEN = re.compile(r"\w+(?:'\w+)*")
+_QUERY_PART = re.compile(r'"([^"]*)"|(\S+)')
+
+# Phrase matching packs (document, position) into one int64 key.
+_POSITION_SPAN = 1 << 32
+
+# BM25 parameters.
+_K1 = 1.2
+_B = 0.75
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens, keeping contractions such as "don't" whole."""
+    return [token.lower() for token in _TOKEN.findall(text or "")]
+
+def parse_query(query: str) -> List[List[str]]:
+    """Split a query into clauses: each quoted phrase, and each bare word, is one clause.
+
+    A bare word that tokenizes into several tokens, such as "follow-up", is
+    matched as a phrase.
+    """
+    clauses = []
+    for phrase, word in _QUERY_PART.findall(query):
+        tokens = tokenize(phrase or word)
+        if tokens:
+            clauses.append(tokens)
+    return clauses
+
+def meeting_key(results: Dict, default: str) -> str:
+    """The key a meeting is indexed under: the absolute path of its source audio.
+
+    ``default`` is used for results written before ``source_file`` was
+    recorded, such as the path of the results file itself.
+    """
+    return os.path.abspath(results.get("source_file") or default)
+
+def documents_from_results(results: Dict) -> Iterator[Dict]:
+    """The searchable pieces of one meeting's results.
+
+    Each transcript segment, the summary, each key point and each action
+    item becomes one document, numbered within its field by ``segment``.
+    """
+    segments = results.get("segments")
+    if isinstance(segments, Transcript):
+        segments = segments.iter_dicts()
+    elif not segments and results.get("transcript"):
+        segments = [{"start": None, "end": None, "text": results["transcript"]}]
+
+    for index, segment in enumerate(segments or []):
+        yield {"field": "transcript", "segment": index, "start": segment.get("start"), "end": segment.get("end"), "text": segment.get("text", "")}
+    if results.get("summary"):
+        yield {"field": "summary", "segment": 0, "start": None, "end": None, "text": results["summary"]}
+    for index, point in enumerate(results.get("key_points") or []):
+        yield {"field": "key_points", "segment": index, "start": None, "end": None, "text": point}
+    for index, item in enumerate(results.get("action_items") or []):
+        text = item.get("context") or item.get("action", "")
+        yield {"field": "action_items", "segment": index, "start": item.get("start"), "end": item.get("end"), "text": text}
+
+def _map_rows(path: Path, columns: int) -> np.ndarray:
+    if os.path.getsize(path) == 0:
+        return np.empty((0, columns), dtype=np.int64)
+    return np.memmap(path, dtype=np.int64, mode='r').reshape(-1, columns)
+
+class _Part:
+    """One immutable part of the index, opened for reading.
+
+    ``lexicon.json`` maps each term to its ``[first, end, document
+    frequency]`` rows in ``postings.bin``, which holds ``(document,
+    position)`` int64 pairs sorted by document and position. ``docs.bin``
+    holds an ``(id, offset, field, length)`` row per document, pointing into
+    ``docs.jsonl``. Both binary files are memory-mapped, so only the rows a
+    query touches are read.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        with open(directory / "lexicon.json", 'r', encoding='utf-8') as f:
+            self.lexicon = json.load(f)
+        self.postings = _map_rows(directory / "postings.bin", 2)
+        self.docs = _map_rows(directory / "docs.bin", 4)
+        # Kept open, so a part a merge deletes stays readable until it is closed.
+        self._fd = os.open(directory / "docs.jsonl", os.O_RDONLY)
+        self._size = os.fstat(self._fd).st_size
+
+    def postings_for(self, term: str) -> np.ndarray:
+        rows = self.lexicon.get(term)
+        if rows is None:
+            return self.postings[:0]
+        return self.postings[rows[0]:rows[1]]
+
+    def rows_for(self, doc_ids: np.ndarray) -> np.ndarray:
+        return np.searchsorted(self.docs[:, 0], doc_ids)
+
+    def line(self, row: int) -> bytes:
+        start = int(self.docs[row, 1])
+        end = int(self.docs[row + 1, 1]) if row + 1 < len(self.docs) else self._size
+        # pread does not move a shared file position, so threads can share the descriptor.
+        return os.pread(self._fd, end - start, start)
+
+    def record(self, row: int) -> Dict:
+        return json.loads(self.line(row))
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __del__(self):
+        self.close()
+
+class _Meetings:
+    """Each meeting's current document range, to tell live documents from replaced ones."""
+
+    def __init__(self, meetings: Dict[str, Dict]):
+        ordered = sorted(meetings.items(), key=lambda item: item[1]["start"])
+        self.keys = [key for key, _ in ordered]
+        self.starts = np.array([value["start"] for _, value in ordered], dtype=np.int64)
+        self.ends = np.array([value["end"] for _, value in ordered], dtype=np.int64)
+
+    def owners(self, ids: np.ndarray) -> np.ndarray:
+        """Position in ``keys`` of each document's meeting, or -1 for a replaced document."""
+        owners = np.searchsorted(self.starts, ids, side='right') - 1
+        live = owners >= 0
+        live[live] &= ids[live] < self.ends[owners[live]]
+        return np.where(live, owners, -1)
+
+class TranscriptIndex:
+    """Incremental on-disk inverted index over processed meetings.
+
+    ``add`` indexes one meeting's results as a new immutable part; parts
+    are merged in tiers of ``merge_factor``, so each posting is rewritten
+    only a logarithmic number of times as the index grows. Adding a meeting
+    again replaces its earlier documents, which are dropped at the next
+    merge. Writers in any number of threads or processes are serialized by
+    a lock file, and readers pick up a new ``manifest.json`` on their next
+    query.
+
+    ``search`` takes keywords and quoted phrases, all of which must match,
+    and returns the best-matching segments ranked by BM25;
+    ``search_meetings`` groups the same matches by meeting.
+    """
+
+    def __init__(self, directory: str, merge_factor: int = 10):
+        if merge_factor < 2:
+            raise ValueError("merge_factor must be at least 2")
+        self.directory = Path(directory)
+        self.merge_factor = merge_factor
+        self.logger = logging.getLogger(__name__)
+        (self.directory / "parts").mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._parts: Dict[str, _Part] = {}
+        self._view = None
+        self._version = None
+
+    def add(self, meeting: str, results: Dict, source: Optional[str] = None) -> int:
+        """Index a meeting's results, replacing any earlier version, and return its document count."""
+        with self._writing() as manifest:
+            start = manifest["next_doc"]
+            records = (
+                dict(document, meeting=meeting, source=source or meeting)
+                for document in documents_from_results(results)
+                if document["text"]
+            )
+            part = self._write_part(manifest, enumerate(records, start))
+
+            self._forget(manifest, meeting)
+            count = part["docs"] if part else 0
+            manifest["meetings"][meeting] = {
+                "source": source or meeting,
+                "start": start,
+                "end": start + count,
+                "tokens": part["tokens"] if part else 0,
+                "indexed_at": datetime.now().isoformat()
+            }
+            manifest["next_doc"] = start + count
+            manifest["documents"] += count
+            manifest["tokens"] += manifest["meetings"][meeting]["tokens"]
+            if part:
+                manifest["parts"].append(part)
+                self._merge_tiers(manifest)
+        return count
+
+    def remove(self, meeting: str) -> bool:
+        """Drop a meeting from search results; its documents are deleted at the next merge."""
+        with self._writing() as manifest:
+            return self._forget(manifest, meeting)
+
+    def optimize(self):
+        """Merge every part into one, dropping the documents of removed or replaced meetings."""
+        with self._writing() as manifest:
+            if manifest["parts"]:
+                manifest["parts"] = [self._merge(manifest, manifest["parts"])]
+
+    def search(self, query: str, limit: int = 20, fields: Optional[Iterable[str]] = None) -> List[Dict]:
+        """The best-matching documents, each with its meeting, field, segment, times, text and score."""
+        matches = self._match(query, fields)
+        if matches is None:
+            return []
+        _, parts, ids, rows, scores = matches
+        order = np.argsort(-scores, kind='stable')[:limit]
+        return [dict(parts[i].record(int(rows[i])), score=round(float(scores[i]), 4)) for i in order]
+
+    def search_meetings(self, query: str, limit: int = 20, fields: Optional[Iterable[str]] = None) -> List[Dict]:
+        """Meetings matching the query, each with its hit count, total score and best hit."""
+        matches = self._match(query, fields)
+        if matches is None:
+            return []
+        (manifest, _, meetings), parts, ids, rows, scores = matches
+        owners = meetings.owners(ids)
+        totals, best = {}, {}
+        for index, owner in enumerate(owners.tolist()):
+            hits, score = totals.get(owner, (0, 0.0))
+            totals[owner] = (hits + 1, score + float(scores[index]))
+            if owner not in best or scores[index] > scores[best[owner]]:
+                best[owner] = index
+
+        ranked = sorted(totals, key=lambda owner: -totals[owner][1])[:limit]
+        results = []
+        for owner in ranked:
+            meeting = meetings.keys[owner]
+            index = best[owner]
+            results.append({
+                "meeting": meeting,
+                "source": manifest["meetings"][meeting]["source"],
+                "hits": totals[owner][0],
+                "score": round(totals[owner][1], 4),
+                "best": dict(parts[index].record(int(rows[index])), score=round(float(scores[index]), 4))
+            })
+        return results
+
+    def stats(self) -> Dict:
+        manifest, _, _ = self._refresh()
+        return {
+            "meetings": len(manifest["meetings"]),
+            "documents": manifest["documents"],
+            "parts": len(manifest["parts"]),
+            "size_bytes": sum(path.stat().st_size for path in (self.directory / "parts").rglob("*") if path.is_file())
+        }
+
+    def close(self):
+        with self._lock:
+            for part in self._parts.values():
+                part.close()
+            self._parts = {}
+            self._view = None
+
+    # Reading
+
+    def _refresh(self) -> Tuple[Dict, List[_Part], _Meetings]:
+        """The current manifest, its open parts and meetings, reloaded if a writer has changed the index.
+
+        A query works from one such snapshot throughout. Parts that drop out
+        of the index are closed once no query still holds them.
+        """
+        path = self.directory / "manifest.json"
+        try:
+            # The manifest is replaced, not rewritten, so its inode changes with every write.
+            stat = path.stat()
+            version = (stat.st_ino, stat.st_mtime_ns)
+        except FileNotFoundError:
+            version = None
+        with self._lock:
+            if self._view is not None and version == self._version:
+                return self._view
+            for attempt in range(3):
+                manifest = self._read_manifest()
+                names = [part["name"] for part in manifest["parts"]]
+                try:
+                    parts = {name: self._parts.get(name) or _Part(self.directory / "parts" / name) for name in names}
+                    break
+                except FileNotFoundError:
+                    # Another process merged these parts away after the manifest was read.
+                    if attempt == 2:
+                        raise
+            self._parts = parts
+            self._view = (manifest, [self._parts[name] for name in names], _Meetings(manifest["meetings"]))
+            self._version = version
+            return self._view
+
+    def _match(self, query: str, fields: Optional[Iterable[str]]):
+        """Every live document matching all clauses, with its part, row and BM25 score."""
+        clauses = parse_query(query)
+        if not clauses:
+            return None
+        view = self._refresh()
+        manifest, parts, meetings = view
+        field_codes = [SEARCH_FIELDS.index(field) for field in fields] if fields else None
+
+        per_part, frequencies = [], [0] * len(clauses)
+        for part in parts:
+            matched = []
+            for position, clause in enumerate(clauses):
+                ids, counts = self._match_clause(part, clause)
+                live = meetings.owners(ids) >= 0
+                ids, counts = ids[live], counts[live]
+                frequencies[position] += len(ids)
+                matched.append((ids, counts))
+            common = reduce(np.intersect1d, (ids for ids, _ in matched))
+            if len(common):
+                per_part.append((part, common, [counts[np.searchsorted(ids, common)] for ids, counts in matched]))
+
+        total = max(manifest["documents"], 1)
+        average_length = manifest["tokens"] / total if manifest["tokens"] else 1.0
+        weights = [math.log(1 + (total - df + 0.5) / (df + 0.5)) for df in frequencies]
+
+        owners, all_ids, all_rows, all_scores = [], [], [], []
+        for part, ids, counts in per_part:
+            rows = part.rows_for(ids)
+            if field_codes is not None:
+                keep = np.isin(part.docs[rows, 2], field_codes)
+                ids, rows, counts = ids[keep], rows[keep], [tf[keep] for tf in counts]
+            lengths = part.docs[rows, 3].astype(np.float64)
+            norm = _K1 * (1 - _B + _B * lengths / average_length)
+            scores = sum(weight * tf * (_K1 + 1) / (tf + norm) for weight, tf in zip(weights, counts))
+            owners.extend([part] * len(ids))
+            all_ids.append(ids)
+            all_rows.append(rows)
+            all_scores.append(np.asarray(scores, dtype=np.float64))
+        if not owners:
+            return None
+        return view, owners, np.concatenate(all_ids), np.concatenate(all_rows), np.concatenate(all_scores)
+
+    @staticmethod
+    def _match_clause(part: _Part, tokens: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Ids of the part's documents containing the term or phrase, and how often each does."""
+        if len(tokens) == 1:
+            return np.unique(part.postings_for(tokens[0])[:, 0], return_counts=True)
+
+        keys = None
+        for offset, token in enumerate(tokens):
+            postings = part.postings_for(token)
+            # A phrase matches where each token's position, less its offset in
+            # the phrase, lines up with the first token's.
+            token_keys = postings[:, 0] * _POSITION_SPAN + (postings[:, 1] - offset)
+            keys = token_keys if keys is None else np.intersect1d(keys, token_keys, assume_unique=True)
+            if not len(keys):
+                break
+        return np.unique(keys // _POSITION_SPAN, return_counts=True)
+
+    # Writing
+
+    @contextmanager
+    def _writing(self):
+        """Hold the write lock with a fresh copy of the manifest, saving it on success."""
+        with self._lock, open(self.directory / "lock", 'w') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                manifest = self._read_manifest()
+                yield manifest
+                self._write_manifest(manifest)
+                self._remove_unused_parts(manifest)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read_manifest(self) -> Dict:
+        try:
+            with open(self.directory / "manifest.json", 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"version": 1, "next_doc": 0, "next_part": 0, "documents": 0, "tokens": 0, "parts": [], "meetings": {}}
+
+    def _write_manifest(self, manifest: Dict):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False)
+            os.replace(tmp_path, self.directory / "manifest.json")
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _remove_unused_parts(self, manifest: Dict):
+        # Also clears parts left half-written by a writer that crashed.
+        names = {part["name"] for part in manifest["parts"]}
+        for path in (self.directory / "parts").iterdir():
+            if path.name not in names:
+                shutil.rmtree(path, ignore_errors=True)
+
+    @staticmethod
+    def _forget(manifest: Dict, meeting: str) -> bool:
+        previous = manifest["meetings"].pop(meeting, None)
+        if previous is None:
+            return False
+        manifest["documents"] -= previous["end"] - previous["start"]
+        manifest["tokens"] -= previous["tokens"]
+        return True
+
+    def _level(self, part: Dict) -> int:
+        return int(math.log(max(part["meetings"], 1), self.merge_factor))
+
+    def _merge_tiers(self, manifest: Dict):
+        """Merge the newest ``merge_factor`` parts whenever they are all of one size tier."""
+        parts = manifest["parts"]
+        while len(parts) >= self.merge_factor:
+            tail = parts[-self.merge_factor:]
+            if len({self._level(part) for part in tail}) != 1:
+                break
+            parts[-self.merge_factor:] = [self._merge(manifest, tail)]
+
+    def _new_part_directory(self, manifest: Dict) -> Tuple[str, Path]:
+        name = f"{manifest['next_part']:08d}"
+        manifest["next_part"] += 1
+        directory = self.directory / "parts" / name
+        directory.mkdir()
+        return name, directory
+
+    def _write_part(self, manifest: Dict, documents: Iterable[Tuple[int, Dict]]) -> Optional[Dict]:
+        """Write a part holding ``documents``; None if there were none."""
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        rows = []
+        name, directory = self._new_part_directory(manifest)
+        with open(directory / "docs.jsonl", 'wb') as f:
+            for doc_id, record in documents:
+                tokens = tokenize(record["text"])
+                rows.append((doc_id, f.tell(), SEARCH_FIELDS.index(record["field"]), len(tokens)))
+                f.write((json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8'))
+                for position, token in enumerate(tokens):
+                    postings.setdefault(token, []).append((doc_id, position))
+        if not rows:
+            shutil.rmtree(directory)
+            return None
+
+        lexicon, offset = {}, 0
+        with open(directory / "postings.bin", 'wb') as f:
+            for term in sorted(postings):
+                pairs = np.array(postings[term], dtype=np.int64)
+                lexicon[term] = [offset, offset + len(pairs), len(np.unique(pairs[:, 0]))]
+                offset += len(pairs)
+                f.write(pairs.tobytes())
+        np.array(rows, dtype=np.int64).tofile(directory / "docs.bin")
+        with open(directory / "lexicon.json", 'w', encoding='utf-8') as f:
+            json.dump(lexicon, f, ensure_ascii=False)
+        return {"name": name, "meetings": 1, "docs": len(rows), "tokens": int(sum(row[3] for row in rows))}
+
+    def _merge(self, manifest: Dict, parts: List[Dict]) -> Dict:
+        """Write one part holding the live documents of ``parts``, streaming postings term by term."""
+        # Liveness follows the manifest being written, not the last one read.
+        meetings = _Meetings(manifest["meetings"])
+        sources = [_Part(self.directory / "parts" / part["name"]) for part in parts]
+        name, directory = self._new_part_directory(manifest)
+        try:
+            docs, lexicon, offset = [], {}, 0
+            with open(directory / "docs.jsonl", 'wb') as out:
+                for source in sources:
+                    live = meetings.owners(np.asarray(source.docs[:, 0])) >= 0
+                    for row in np.flatnonzero(live).tolist():
+                        doc_id, _, field, length = source.docs[row].tolist()
+                        docs.append((doc_id, out.tell(), field, length))
+                        out.write(source.line(row))
+
+            with open(directory / "postings.bin", 'wb') as out:
+                for term in sorted(set().union(*(source.lexicon for source in sources))):
+                    pieces = []
+                    for source in sources:
+                        postings = source.postings_for(term)
+                        if len(postings):
+                            pieces.append(postings[meetings.owners(np.asarray(postings[:, 0])) >= 0])
+                    merged = np.concatenate(pieces) if pieces else None
+                    if merged is None or not len(merged):
+                        continue
+                    frequency = int(np.count_nonzero(np.diff(merged[:, 0]))) + 1
+                    lexicon[term] = [offset, offset + len(merged), frequency]
+                    offset += len(merged)
+                    out.write(np.ascontiguousarray(merged).tobytes())
+
+            np.array(docs, dtype=np.int64).reshape(-1, 4).tofile(directory / "docs.bin")
+            with open(directory / "lexicon.json", 'w', encoding='utf-8') as f:
+                json.dump(lexicon, f, ensure_ascii=False)
+        finally:
+            for source in sources:
+                source.close()
+
+        return {
+            "name": name,
+            "meetings": sum(part["meetings"] for part in parts),
+            "docs": len(docs),
+            "tokens": int(sum(doc[3] for doc in docs))
+        }
@@ -0,0 +1,110 @@
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+_DONE = object()
+
+class Stage:
+    """A named processing step and the number of threads that run it."""
+
+    def __init__(self, name: str, func: Callable[[Any], Any], concurrency: int = 1):
+        if concurrency < 1:
+            raise ValueError(f"Stage {name} needs at least one worker")
+        self.name = name
+        self.func = func
+        self.concurrency = concurrency
+
+class StagePipeline:
+    """Run items through a sequence of stages that overlap across items.
+
+    Stages are connected by bounded queues, so a slow stage applies
+    backpressure to the stages before it instead of letting work pile up in
+    memory. Each stage runs on its own pool of ``concurrency`` threads. An item
+    that fails in one stage skips the remaining stages and is reported with
+    the error and the name of the stage that raised it.
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = 2):
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = stages
+        self.queue_size = queue_size
+        self.logger = logging.getLogger(__name__)
+
+    def run(self, items: Iterable[Any], on_complete: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """Process ``items`` and return one job record per item, in input order.
+
+        Each record holds the original ``item``, the final ``value``, the
+        ``error`` (or None), the ``failed_stage`` and per-stage ``timings``.
+        ``on_complete`` is called with each record as soon as it finishes.
+        """
+        items = list(items)
+        results: List[Optional[Dict]] = [None] * len(items)
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        remaining = [stage.concurrency for stage in self.stages]
+        lock = threading.Lock()
+
+        def finish(job: Dict):
+            results[job["index"]] = job
+            if on_complete is None:
+                return
+            try:
+                on_complete(job)
+            except Exception as e:
+                self.logger.error(f"Pipeline completion callback failed: {str(e)}")
+
+        def work(position: int):
+            stage = self.stages[position]
+            inbox = queues[position]
+            is_last = position == len(self.stages) - 1
+
+            while True:
+                job = inbox.get()
+                if job is _DONE:
+                    break
+
+                if job["error"] is None:
+                    start = time.perf_counter()
+                    try:
+                        job["value"] = stage.func(job["value"])
+                    except Exception as e:
+                        job["error"] = e
+                        job["failed_stage"] = stage.name
+                    job["timings"][stage.name] = time.perf_counter() - start
+
+                if is_last:
+                    finish(job)
+                else:
+                    queues[position + 1].put(job)
+
+            with lock:
+                remaining[position] -= 1
+                last_worker = remaining[position] == 0
+            if last_worker and not is_last:
+                for _ in range(self.stages[position + 1].concurrency):
+                    queues[position + 1].put(_DONE)
+
+        threads = []
+        for position, stage in enumerate(self.stages):
+            for number in range(stage.concurrency):
+                thread = threading.Thread(target=work, args=(position,), name=f"{stage.name}-{number}", daemon=True)
+                thread.start()
+                threads.append(thread)
+
+        for index, item in enumerate(items):
+            queues[0].put({
+                "index": index,
+                "item": item,
+                "value": item,
+                "error": None,
+                "failed_stage": None,
+                "timings": {}
+            })
+        for _ in range(self.stages[0].concurrency):
+            queues[0].put(_DONE)
+
+        for thread in threads:
+            thread.join()
+        return results
@@ -0,0 +1,18 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+@pytest.fixture
+def import_app():
+    """Import a top-level module (main, cli, batch, service) as part of the repository package.
+
+    Those modules use package-relative imports, so they are imported by the
+    repository directory's name rather than on their own.
+    """
+    if str(ROOT.parent) not in sys.path:
+        sys.path.insert(0, str(ROOT.parent))
+    return lambda name: importlib.import_module(f"{ROOT.name}.{name}")
@@ -0,0 +1,129 @@
+import json
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from src.utils.output_writers import read_results
+
+class FakeSummarizer:
+    """Stands in for AudioSummarizer: files named ``broken*`` fail to decode, others get canned results."""
+
+    processed = []
+
+    def __init__(self, settings=None):
+        self.settings = settings
+
+    def preload_models(self):
+        pass
+
+    def process_audio_file(self, file_path, create_tasks=True, schedule_followup=False, on_field=None, on_stage=None, resume=False):
+        if Path(file_path).stem.startswith("broken"):
+            raise ValueError(f"Failed to load audio file: {file_path}")
+        FakeSummarizer.processed.append(Path(file_path).name)
+        results = {
+            "source_file": str(file_path),
+            "transcript": "We need to ship it.",
+            "segments": [{"start": 0.0, "end": 2.0, "text": "We need to ship it."}],
+            "summary": "Shipping.",
+            "action_items": [{"action": "ship", "context": "We need to ship it.", "priority": "medium", "start": 0.0, "end": 2.0}]
+        }
+        if on_field:
+            for key, value in results.items():
+                on_field(key, value)
+        return results
+
+    def process_audio_files(self, file_paths, create_tasks=True, schedule_followup=False, on_result=None, resume=False):
+        records = []
+        for file_path in file_paths:
+            record = {"file_path": file_path, "results": None, "error": None, "failed_stage": None, "timings": {"decode": 0.01}}
+            try:
+                record["results"] = self.process_audio_file(file_path)
+                record["timings"]["analyze"] = 0.02
+            except ValueError as e:
+                record["error"] = str(e)
+                record["failed_stage"] = "decode"
+            records.append(record)
+            if on_result:
+                on_result(record)
+        return records
+
+@pytest.fixture
+def batch(import_app, monkeypatch):
+    module = import_app("batch")
+    monkeypatch.setattr(module, "AudioSummarizer", FakeSummarizer)
+    FakeSummarizer.processed = []
+    return module
+
+@pytest.fixture
+def recordings(tmp_path):
+    directory = tmp_path / "recordings"
+    (directory / "archive").mkdir(parents=True)
+    for name in ("standup.wav", "broken.wav", "review.MP3", "notes.txt", "archive/planning.ogg"):
+        (directory / name).write_bytes(b"audio")
+    return directory
+
+def test_collect_audio_files_expands_directories_and_globs(batch, recordings):
+    names = lambda files: [path.name for path in files]
+    assert names(batch.collect_audio_files([str(recordings)])) == ["broken.wav", "review.MP3", "standup.wav"]
+    assert "planning.ogg" in names(batch.collect_audio_files([str(recordings)], recursive=True))
+    assert names(batch.collect_audio_files([str(recordings / "**" / "*.ogg"), str(recordings / "archive")])) == ["planning.ogg"]
+
+def test_output_path_for(batch, tmp_path):
+    input_path = tmp_path / "standup.wav"
+    assert batch.output_path_for(input_path) == tmp_path / "standup_summary.json"
+    assert batch.output_path_for(input_path, str(tmp_path / "out"), ".jsonl.gz") == tmp_path / "out" / "standup_summary.jsonl.gz"
+
+def test_run_batch_writes_results_and_records_failures(batch, recordings, tmp_path):
+    files = [recordings / "standup.wav", recordings / "broken.wav"]
+    manifest = batch.run_batch(files, output_dir=str(tmp_path / "out"), workers=1, progress=lambda line: None)
+
+    assert (manifest["total"], manifest["processed"], manifest["skipped"], manifest["failed"]) == (2, 1, 0, 1)
+    broken, standup = manifest["files"]
+    assert broken["status"] == "failed" and "broken.wav" in broken["error"]
+    assert not Path(broken["output"]).exists()
+    assert standup["output"] == str(tmp_path / "out" / "standup_summary.json")
+    assert read_results(standup["output"])["summary"] == "Shipping."
+
+def test_resume_skips_files_with_output(batch, recordings, tmp_path):
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    (output_dir / "standup_summary.jsonl").write_text("{}\n")
+    files = [recordings / "standup.wav", recordings / "review.MP3"]
+
+    manifest = batch.run_batch(files, output_dir=str(output_dir), workers=1, resume=True, output_format="jsonl", progress=lambda line: None)
+    assert FakeSummarizer.processed == ["review.MP3"]
+    assert [record["status"] for record in manifest["files"]] == ["processed", "skipped"]
+    assert (manifest["processed"], manifest["skipped"]) == (1, 1)
+    assert read_results(str(output_dir / "review_summary.jsonl"))["segments"][0]["text"] == "We need to ship it."
+
+def test_pipelined_run_records_failed_stage(batch, recordings, tmp_path):
+    files = [recordings / "broken.wav", recordings / "standup.wav"]
+    manifest = batch.run_batch(files, output_dir=str(tmp_path / "out"), pipelined=True, compress=True, progress=lambda line: None)
+
+    broken, standup = manifest["files"]
+    assert broken["status"] == "failed" and broken["failed_stage"] == "decode"
+    assert standup["status"] == "processed" and set(standup["stage_seconds"]) == {"decode", "analyze"}
+    assert read_results(standup["output"])["source_file"] == str(recordings / "standup.wav")
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="workers only inherit the fake summarizer when forked")
+def test_process_pool_matches_serial_run(batch, recordings, tmp_path):
+    files = batch.collect_audio_files([str(recordings)])
+    pooled = batch.run_batch(files, output_dir=str(tmp_path / "pooled"), workers=2, progress=lambda line: None)
+    serial = batch.run_batch(files, output_dir=str(tmp_path / "serial"), workers=1, progress=lambda line: None)
+
+    assert [(record["input"], record["status"]) for record in pooled["files"]] == [(record["input"], record["status"]) for record in serial["files"]]
+    assert read_results(str(tmp_path / "pooled" / "review_summary.json")) == read_results(str(tmp_path / "serial" / "review_summary.json"))
+
+def test_batch_main_saves_manifest_and_exits_on_failure(batch, import_app, recordings, tmp_path, capsys):
+    cli = import_app("cli")
+    output_dir = tmp_path / "out"
+    with pytest.raises(SystemExit) as exit_info:
+        cli.batch_main([str(recordings), "--output-dir", str(output_dir), "--workers", "1", "--format", "jsonl"])
+    assert exit_info.value.code == 1
+
+    with open(output_dir / "batch_manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert (manifest["processed"], manifest["failed"]) == (2, 1)
+    assert (output_dir / "standup_summary.jsonl").exists()
+    assert "2 processed, 0 skipped, 1 failed" in capsys.readouterr().out
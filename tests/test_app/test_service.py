@@ -0,0 +1,74 @@
+import http.client
+import json
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from benchmarks.stubs import StubBackend
+from src.audio.audio_buffer import AudioBuffer
+
+@pytest.fixture
+def service(import_app, monkeypatch):
+    module = import_app("service")
+
+    class StubbedSummarizer(module.AudioSummarizer):
+        """The real summarizer with canned transcription and summarization in place of the models."""
+
+        def __init__(self, settings=None):
+            super().__init__(settings)
+            self.transcriber.backend = StubBackend()
+            self.summarizer.analyze_segments = lambda texts, **kwargs: {"summary": "Budget review.", "key_points": ["Budget."]}
+
+        def preload_models(self):
+            pass
+
+    monkeypatch.setattr(module, "AudioSummarizer", StubbedSummarizer)
+    return module
+
+@pytest.fixture
+def settings(import_app, tmp_path):
+    settings = import_app("src.config.settings").Settings()
+    settings.LOG_FILE = str(tmp_path / "service.log")
+    settings.VAD_ENABLED = False
+    for name in ("CACHE_DIR", "CHECKPOINT_DIR", "SEARCH_INDEX_DIR", "TASK_MANAGER_API_KEY", "CALENDAR_API_KEY"):
+        setattr(settings, name, None)
+    return settings
+
+def request(connection, method, path, body=None):
+    connection.request(method, path, body=json.dumps(body) if body is not None else None)
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+def test_job_runs_through_the_real_processor(service, settings, tmp_path):
+    wav_path = tmp_path / "meeting.wav"
+    t = np.arange(3 * 16000) / 16000
+    AudioBuffer((np.sin(2 * np.pi * 440 * t) * 8000).astype(np.int16), 16000).save_wav(str(wav_path))
+
+    server = service.create_server(settings, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    connection = http.client.HTTPConnection(*server.server.server_address[:2])
+    try:
+        assert request(connection, "POST", "/jobs", {})[0] == 400
+        status, body = request(connection, "POST", "/jobs", {"file_path": str(tmp_path / "missing.wav")})
+        assert status == 400 and "not found" in body["error"]
+
+        status, job = request(connection, "POST", "/jobs", {"file_path": str(wav_path)})
+        assert status == 202
+        deadline = time.monotonic() + 10
+        while job["status"] in ("queued", "running") and time.monotonic() < deadline:
+            time.sleep(0.05)
+            job = request(connection, "GET", f"/jobs/{job['id']}")[1]
+
+        assert job["status"] == "completed", job.get("error")
+        assert (job["stage"], job["progress"]) == ("integrate", 1.0)
+        status, body = request(connection, "GET", f"/jobs/{job['id']}/result")
+        results = body["result"]
+        assert results["source_file"] == str(wav_path)
+        assert results["summary"] == "Budget review."
+        assert results["segments"] == [{"start": 0.0, "end": 3.0, "text": results["transcript"]}]
+    finally:
+        server.shutdown(timeout=5)
+        thread.join(5)
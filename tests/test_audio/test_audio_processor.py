@@ -0,0 +1,100 @@
+import os
+import wave
+
+import numpy as np
+import pytest
+
+from src.audio.audio_buffer import AudioBuffer
+from src.audio.audio_processor import AudioProcessor
+
+def create_tone_buffer(duration: float = 1.0, sample_rate: int = 16000, channels: int = 1, amplitude: float = 0.1) -> AudioBuffer:
+    """Create an in-memory buffer holding a 440 Hz tone."""
+    t = np.linspace(0, duration, int(sample_rate * duration), False)
+    tone = (np.sin(2 * np.pi * 440 * t) * amplitude * 32767).astype(np.int16)
+    return AudioBuffer(np.repeat(tone[:, None], channels, axis=1), sample_rate)
+
+@pytest.fixture
+def processor():
+    return AudioProcessor()
+
+def test_wav_round_trip(tmp_path):
+    buffer = create_tone_buffer(channels=2)
+    wav_path = os.path.join(tmp_path, "tone.wav")
+    buffer.save_wav(wav_path)
+
+    with wave.open(wav_path, 'rb') as wav_file:
+        assert wav_file.getnchannels() == 2
+        assert wav_file.getframerate() == 16000
+
+    loaded = AudioBuffer.from_wav(wav_path)
+    assert loaded.channels == 2
+    assert loaded.duration_seconds == pytest.approx(1.0)
+    assert np.array_equal(loaded.samples, buffer.samples)
+
+def test_24_bit_wav_round_trip(tmp_path):
+    samples = np.array([[0, 1], [-1, 8388607], [-8388608, -300]])
+    wav_path = os.path.join(tmp_path, "tone24.wav")
+    AudioBuffer(samples, 16000, sample_width=3).save_wav(wav_path)
+
+    with wave.open(wav_path, 'rb') as wav_file:
+        assert wav_file.getsampwidth() == 3
+        assert len(wav_file.readframes(wav_file.getnframes())) == samples.size * 3
+
+    loaded = AudioBuffer.from_wav(wav_path)
+    assert loaded.sample_width == 3
+    assert loaded.samples.tolist() == samples.tolist()
+
+def test_to_mono_and_slice():
+    buffer = create_tone_buffer(duration=2.0, channels=2)
+    mono = buffer.to_mono()
+    assert mono.channels == 1
+    assert mono.frame_count == buffer.frame_count
+
+    half = mono.slice(0, 16000)
+    assert half.duration_seconds == pytest.approx(1.0)
+
+def test_load_audio_wav(processor, tmp_path):
+    wav_path = os.path.join(tmp_path, "tone.wav")
+    create_tone_buffer().save_wav(wav_path)
+
+    buffer = processor.load_audio(wav_path)
+    assert buffer is not None
+    assert buffer.sample_rate == 16000
+    assert buffer.sample_width == 2
+
+def test_load_audio_unsupported_format(processor, tmp_path):
+    path = os.path.join(tmp_path, "notes.txt")
+    with open(path, 'w') as f:
+        f.write("not audio")
+
+    assert processor.load_audio(path) is None
+
+def test_normalize_buffer_in_memory(processor, tmp_path):
+    buffer = create_tone_buffer(amplitude=0.01)
+    normalized = processor.normalize_buffer(buffer, target_db=-20.0)
+
+    assert normalized is not None
+    assert normalized.frame_count == buffer.frame_count
+    rms = np.sqrt(np.mean(normalized.samples.astype(np.float64) ** 2))
+    assert 20 * np.log10(rms / 32768) == pytest.approx(-20.0, abs=0.5)
+    assert os.listdir(tmp_path) == []
+
+def test_normalize_silent_buffer(processor):
+    silent = AudioBuffer(np.zeros(16000, dtype=np.int16), 16000)
+    assert processor.normalize_buffer(silent) is silent
+
+def test_normalize_audio_writes_file_on_request(processor, tmp_path):
+    wav_path = os.path.join(tmp_path, "tone.wav")
+    create_tone_buffer(amplitude=0.01).save_wav(wav_path)
+
+    output_path = processor.normalize_audio(wav_path)
+    assert output_path.endswith("_normalized.wav")
+    assert os.path.exists(output_path)
+
+def test_prepare_buffer_resamples_to_mono(processor):
+    buffer = create_tone_buffer(sample_rate=44100, channels=2)
+    prepared = processor.prepare_buffer(buffer, target_sample_rate=16000)
+
+    assert prepared.channels == 1
+    assert prepared.sample_rate == 16000
+    assert prepared.duration_seconds == pytest.approx(1.0)
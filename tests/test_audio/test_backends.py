@@ -0,0 +1,70 @@
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import numpy as np
+import pytest
+
+from src.audio.audio_buffer import AudioBuffer
+from src.audio.backends import GoogleBackend, LocalBackend, TranscriptionBackend, create_backend
+from src.audio.transcriber import AudioTranscriber
+
+class RecordingBackend(TranscriptionBackend):
+    """Batching backend that records the batch sizes it receives."""
+
+    supports_batching = True
+
+    def __init__(self, batch_size: int = 3):
+        self.batch_size = batch_size
+        self.batches = []
+
+    def transcribe_batch(self, chunks, language):
+        self.batches.append(len(chunks))
+        return [f"segment {len(self.batches)}.{index}" for index in range(len(chunks))]
+
+def create_noise_buffer(duration: float, sample_rate: int = 8000) -> AudioBuffer:
+    rng = np.random.default_rng(0)
+    return AudioBuffer(rng.integers(-3000, 3000, int(duration * sample_rate)), sample_rate)
+
+def test_create_backend_known_names():
+    assert isinstance(create_backend("google"), GoogleBackend)
+
+def test_create_backend_unknown_name():
+    with pytest.raises(ValueError):
+        create_backend("carrier-pigeon")
+
+def test_batching_backend_receives_batches():
+    backend = RecordingBackend(batch_size=3)
+    transcriber = AudioTranscriber(chunk_seconds=1.0, backend=backend)
+
+    segments = transcriber.transcribe_segments(create_noise_buffer(7.0))
+
+    assert sum(backend.batches) == len(segments)
+    assert max(backend.batches) == 3
+    assert [segment["text"] for segment in segments][:3] == ["segment 1.0", "segment 1.1", "segment 1.2"]
+
+def test_failed_batch_falls_back_to_single_chunks():
+    class FlakyBatchBackend(RecordingBackend):
+        def transcribe_batch(self, chunks, language):
+            raise RuntimeError("out of memory")
+
+        def transcribe(self, chunk, language):
+            return "single"
+
+    transcriber = AudioTranscriber(chunk_seconds=1.0, backend=FlakyBatchBackend(), retry_backoff=0)
+    assert transcriber.transcribe_buffer(create_noise_buffer(2.5)).split() == ["single"] * 3
+
+@pytest.mark.parametrize("model_name,language,expected", [
+    ("openai/whisper-base", "en-US", {"generate_kwargs": {"language": "en"}}),
+    ("openai/whisper-base", "de", {"generate_kwargs": {"language": "de"}}),
+    ("openai/whisper-base.en", "en-US", {})
+])
+def test_local_backend_passes_language_to_pipeline(model_name, language, expected):
+    pipeline = MagicMock(return_value=[{"text": " hello "}, {"text": "world"}])
+    backend = LocalBackend(model_name=model_name, batch_size=2)
+    chunks = [create_noise_buffer(1.0), create_noise_buffer(0.5)]
+
+    with patch.object(LocalBackend, "pipeline", new_callable=PropertyMock, return_value=pipeline):
+        assert backend.transcribe_batch(chunks, language) == ["hello", "world"]
+
+    inputs = pipeline.call_args.args[0]
+    assert [item["sampling_rate"] for item in inputs] == [8000, 8000]
+    assert pipeline.call_args.kwargs == dict(expected, batch_size=2)
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from scipy.signal import resample_poly
+
+from src.audio import dsp
+from src.audio.audio_buffer import AudioBuffer
+
+def noise_buffer(frames: int = 44100, channels: int = 2, sample_rate: int = 44100, scale: float = 3000.0) -> AudioBuffer:
+    rng = np.random.default_rng(0)
+    return AudioBuffer(rng.normal(0, scale, (frames, channels)).astype(np.int16), sample_rate)
+
+def test_downmix_averages_channels():
+    buffer = AudioBuffer(np.array([[100, 300], [-50, 50], [7, 8]], dtype=np.int16), 16000)
+    mono = dsp.downmix(buffer)
+    assert mono.channels == 1
+    assert mono.samples[:, 0].tolist() == [200, 0, 8]
+
+def test_resample_changes_rate_and_length():
+    buffer = noise_buffer()
+    resampled = dsp.resample(buffer, 16000)
+    assert resampled.sample_rate == 16000
+    assert resampled.frame_count == 16000
+    assert resampled.channels == 2
+    assert resampled.samples.dtype == np.int16
+
+def test_blockwise_resample_matches_one_pass(monkeypatch):
+    buffer = noise_buffer(frames=100003)
+    monkeypatch.setattr(dsp, "BLOCK_FRAMES", 5000)
+    blockwise = dsp.resample(buffer, 16000)
+
+    expected = np.clip(np.rint(resample_poly(buffer.samples.astype(np.float32), 160, 441, axis=0)), -32768, 32767)
+    assert np.array_equal(blockwise.samples, expected)
+
+def test_resample_is_noop_at_target_rate():
+    buffer = noise_buffer(sample_rate=16000)
+    assert dsp.resample(buffer, 16000) is buffer
+    assert dsp.resample(buffer, 0) is buffer
+
+def test_loudness_matches_rms():
+    buffer = noise_buffer()
+    rms = np.sqrt(np.mean(buffer.samples.astype(np.float64) ** 2))
+    assert dsp.loudness_dbfs(buffer) == pytest.approx(20 * np.log10(rms / 32768))
+
+def test_normalize_reaches_target_level():
+    normalized = dsp.normalize(noise_buffer(), target_dbfs=-30.0)
+    assert dsp.loudness_dbfs(normalized) == pytest.approx(-30.0, abs=0.01)
+
+def test_gain_is_limited_to_peak():
+    buffer = noise_buffer(scale=8000.0)
+    louder = dsp.apply_gain(buffer, 20.0, peak_limit_dbfs=-1.0)
+    assert dsp.peak_dbfs(louder) == pytest.approx(-1.0, abs=0.01)
+
+def test_silence_is_left_alone():
+    silent = AudioBuffer(np.zeros((1000, 1), dtype=np.int16), 16000)
+    assert dsp.loudness_dbfs(silent) == float('-inf')
+    assert dsp.normalize(silent) is silent
+
+def test_prepare_for_recognition():
+    prepared = dsp.prepare_for_recognition(noise_buffer(), target_rate=16000)
+    assert prepared.channels == 1
+    assert prepared.sample_rate == 16000
+    assert dsp.loudness_dbfs(prepared) == pytest.approx(-20.0, abs=0.01)
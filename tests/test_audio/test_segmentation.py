@@ -0,0 +1,41 @@
+import numpy as np
+
+from src.audio.audio_buffer import AudioBuffer
+from src.audio.segmentation import frame_energy, split_on_silence
+
+def create_speech_like_buffer(pattern, sample_rate: int = 8000) -> AudioBuffer:
+    """Create a buffer of alternating tone/silence blocks, given as (seconds, loud) pairs."""
+    blocks = []
+    for seconds, loud in pattern:
+        t = np.arange(int(seconds * sample_rate)) / sample_rate
+        amplitude = 8000 if loud else 0
+        blocks.append((np.sin(2 * np.pi * 220 * t) * amplitude).astype(np.int16))
+    return AudioBuffer(np.concatenate(blocks), sample_rate)
+
+def test_frame_energy_shape():
+    buffer = create_speech_like_buffer([(1.0, True)])
+    energy = frame_energy(buffer, frame_ms=20)
+    assert len(energy) == 50
+    assert np.all(energy > 0)
+
+def test_short_buffer_is_single_chunk():
+    buffer = create_speech_like_buffer([(3.0, True)])
+    assert split_on_silence(buffer, max_chunk_seconds=10.0) == [(0, buffer.frame_count)]
+
+def test_chunks_cover_buffer_and_respect_max_length():
+    buffer = create_speech_like_buffer([(7.0, True), (1.0, False)] * 5)
+    boundaries = split_on_silence(buffer, max_chunk_seconds=10.0, min_chunk_seconds=2.0)
+
+    assert boundaries[0][0] == 0
+    assert boundaries[-1][1] == buffer.frame_count
+    for (_, end), (next_start, _) in zip(boundaries, boundaries[1:]):
+        assert end == next_start
+    assert all(end - start <= 10 * buffer.sample_rate for start, end in boundaries)
+
+def test_cuts_land_in_silence():
+    buffer = create_speech_like_buffer([(7.0, True), (1.0, False)] * 5)
+    boundaries = split_on_silence(buffer, max_chunk_seconds=10.0, min_chunk_seconds=2.0)
+
+    for _, end in boundaries[:-1]:
+        position = (end / buffer.sample_rate) % 8.0
+        assert 7.0 <= position <= 8.0
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from src.audio.backends import TranscriptionBackend
+from src.audio.streaming import StreamingTranscriber, read_ahead
+from src.audio.transcriber import AudioTranscriber
+
+class CountingBackend(TranscriptionBackend):
+    """Backend that reports the duration of each chunk it is given."""
+
+    def transcribe(self, chunk, language):
+        return f"{chunk.duration_seconds:.1f}s"
+
+@pytest.fixture
+def streamer():
+    transcriber = AudioTranscriber(chunk_seconds=30.0, backend=CountingBackend())
+    return StreamingTranscriber(transcriber, sample_rate=8000, window_seconds=2.0)
+
+def make_pcm(seconds: float, sample_rate: int = 8000) -> bytes:
+    rng = np.random.default_rng(1)
+    return rng.integers(-2000, 2000, int(seconds * sample_rate)).astype('<i2').tobytes()
+
+def test_windows_are_emitted_as_audio_arrives(streamer):
+    pcm = make_pcm(5.0)
+    segments = []
+    for offset in range(0, len(pcm), 3001):
+        segments.extend(streamer.feed(pcm[offset:offset + 3001]))
+
+    assert [segment["text"] for segment in segments] == ["2.0s", "2.0s"]
+    assert [(segment["start"], segment["end"]) for segment in segments] == [(0.0, 2.0), (2.0, 4.0)]
+
+def test_flush_transcribes_partial_window(streamer):
+    streamer.feed(make_pcm(5.0))
+    remaining = streamer.flush()
+
+    assert len(remaining) == 1
+    assert remaining[0]["start"] == 4.0
+    assert remaining[0]["end"] == pytest.approx(5.0)
+    assert streamer.flush() == []
+
+def test_odd_trailing_byte_is_dropped(streamer):
+    streamer.feed(make_pcm(0.5) + b"\x01")
+    segments = streamer.flush()
+    assert segments[0]["end"] == pytest.approx(0.5)
+
+def test_windows_are_prepared_before_recognition():
+    from src.audio.audio_processor import AudioProcessor
+
+    transcriber = AudioTranscriber(chunk_seconds=30.0, backend=CountingBackend())
+    seen = []
+    def prepare(buffer):
+        prepared = AudioProcessor().prepare_buffer(buffer, target_sample_rate=16000)
+        seen.append(prepared.sample_rate)
+        return prepared
+
+    streamer = StreamingTranscriber(transcriber, sample_rate=8000, window_seconds=2.0, prepare=prepare)
+    segments = streamer.feed(make_pcm(2.0))
+
+    assert seen == [16000]
+    assert segments == [{"start": 0.0, "end": 2.0, "text": "2.0s"}]
+
+
+def test_read_ahead_keeps_reading_while_the_consumer_is_busy():
+    import threading
+
+    read_all = threading.Event()
+
+    def source():
+        for index in range(5):
+            yield bytes([index])
+        read_all.set()
+
+    chunks = read_ahead(source(), max_queued=8)
+    assert next(chunks) == b"\x00"
+    # The consumer is busy with the first chunk; the rest are still read.
+    assert read_all.wait(2)
+    assert list(chunks) == [b"\x01", b"\x02", b"\x03", b"\x04"]
+
+def test_read_ahead_raises_read_errors():
+    def source():
+        yield b"ok"
+        raise OSError("pipe closed")
+
+    chunks = read_ahead(source(), max_queued=1)
+    assert next(chunks) == b"ok"
+    with pytest.raises(OSError):
+        next(chunks)
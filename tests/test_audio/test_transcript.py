@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from src.audio.transcript import Segment, Transcript
+
+@pytest.fixture
+def transcript():
+    return Transcript.from_segments([
+        {"start": 0.0, "end": 30.0, "text": "Welcome everyone."},
+        {"start": 30.0, "end": 60.0, "text": ""},
+        {"start": 60.0, "end": 90.0, "text": "We need to ship the release."},
+        {"start": 90.0, "end": 120.0, "text": " Maria will review it. "}
+    ])
+
+def test_text_joins_non_empty_segments(transcript):
+    assert transcript.text == "Welcome everyone. We need to ship the release. Maria will review it."
+    assert list(transcript.texts()) == ["Welcome everyone.", "We need to ship the release.", "Maria will review it."]
+    assert len(transcript) == 4
+
+def test_indexing_returns_segments(transcript):
+    assert transcript[0] == Segment(0.0, 30.0, "Welcome everyone.")
+    assert transcript[1].text == ""
+    assert transcript[-1].text == "Maria will review it."
+    with pytest.raises(IndexError):
+        transcript[4]
+
+def test_time_range_is_a_view(transcript):
+    middle = transcript.between(45.0, 100.0)
+    assert [segment.start for segment in middle] == [30.0, 60.0, 90.0]
+    assert middle.text == "We need to ship the release. Maria will review it."
+    assert middle.starts.base is transcript.starts
+
+    assert len(transcript.between(500.0, 600.0)) == 0
+    assert transcript.between(500.0, 600.0).text == ""
+
+def test_index_at(transcript):
+    assert transcript.index_at(75.0) == 2
+    assert transcript.index_at(120.0) is None
+    assert transcript.index_at(-1.0) is None
+
+def test_dict_round_trip_through_json(transcript):
+    restored = Transcript.from_dict(json.loads(json.dumps(transcript.to_dict())))
+    assert list(restored) == list(transcript)
+    assert restored.text == transcript.text
+
+def test_view_serializes_on_its_own(transcript):
+    view = transcript[2:]
+    restored = Transcript.from_dict(view.to_dict())
+    assert restored.text == "We need to ship the release. Maria will review it."
+    assert list(restored) == list(view)
+
+def test_from_text_and_counts():
+    transcript = Transcript.from_text("one two three", duration=4.0)
+    assert transcript.duration == 4.0
+    assert transcript.word_count() == 3
+    assert transcript.to_list() == [{"start": 0.0, "end": 4.0, "text": "one two three"}]
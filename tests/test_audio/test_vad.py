@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from src.audio.audio_buffer import AudioBuffer
+from src.audio.backends import TranscriptionBackend
+from src.audio.transcriber import AudioTranscriber
+from src.audio.vad import OffsetMap, VoiceActivityDetector
+
+SAMPLE_RATE = 16000
+
+def meeting_buffer(layout):
+    """Build a buffer from ``(seconds, is_speech)`` parts: tones for speech, faint noise otherwise."""
+    rng = np.random.default_rng(0)
+    parts = []
+    for seconds, is_speech in layout:
+        frames = int(seconds * SAMPLE_RATE)
+        if is_speech:
+            t = np.arange(frames) / SAMPLE_RATE
+            parts.append(6000 * np.sin(2 * np.pi * 180 * t) + rng.normal(0, 200, frames))
+        else:
+            parts.append(rng.normal(0, 30, frames))
+    return AudioBuffer(np.concatenate(parts).astype(np.int16), SAMPLE_RATE)
+
+class DurationBackend(TranscriptionBackend):
+    """Records how much audio it was sent and echoes each chunk's length."""
+
+    def __init__(self):
+        self.seconds = 0.0
+
+    def transcribe(self, chunk, language):
+        self.seconds += chunk.duration_seconds
+        return f"{chunk.duration_seconds:.1f}s"
+
+@pytest.fixture
+def vad():
+    return VoiceActivityDetector(padding_ms=100)
+
+def test_detects_speech_regions(vad):
+    buffer = meeting_buffer([(5, False), (3, True), (10, False), (4, True), (2, False)])
+    regions = vad.detect(buffer)
+
+    assert len(regions) == 2
+    (first_start, first_end), (second_start, second_end) = [
+        (start / SAMPLE_RATE, end / SAMPLE_RATE) for start, end in regions
+    ]
+    assert first_start == pytest.approx(5, abs=0.2)
+    assert first_end == pytest.approx(8, abs=0.2)
+    assert second_start == pytest.approx(18, abs=0.2)
+    assert second_end == pytest.approx(22, abs=0.2)
+
+def test_short_pauses_are_bridged(vad):
+    buffer = meeting_buffer([(2, False), (2, True), (0.3, False), (2, True), (2, False)])
+    assert len(vad.detect(buffer)) == 1
+
+def test_continuous_speech_is_kept_whole(vad):
+    buffer = meeting_buffer([(6, True)])
+    stripped, offsets = vad.strip_silence(buffer)
+    assert stripped.duration_seconds == pytest.approx(6, abs=0.1)
+
+def test_silence_only_gives_empty_buffer(vad):
+    silent = AudioBuffer(np.zeros(SAMPLE_RATE * 3, dtype=np.int16), SAMPLE_RATE)
+    stripped, offsets = vad.strip_silence(silent)
+    assert stripped.frame_count == 0
+    assert offsets.kept_frames == 0
+
+def test_offset_map_translates_positions():
+    offsets = OffsetMap([(100, 200), (500, 650)], sample_rate=100)
+    assert offsets.to_original(0) == 100
+    assert offsets.to_original(50) == 150
+    assert offsets.to_original(100) == 500
+    assert offsets.to_original(100, is_end=True) == 200
+    assert offsets.to_original(250) == 650
+    assert offsets.to_original_seconds(1.2) == pytest.approx(5.2)
+
+def test_transcriber_sends_only_speech_with_original_timestamps(vad):
+    buffer = meeting_buffer([(20, False), (4, True), (30, False), (5, True), (10, False)])
+    backend = DurationBackend()
+    transcriber = AudioTranscriber(chunk_seconds=30, backend=backend, vad=vad)
+
+    segments = transcriber.transcribe_segments(buffer)
+
+    assert backend.seconds < 10
+    assert segments[0]["start"] == pytest.approx(20, abs=0.2)
+    assert segments[-1]["end"] == pytest.approx(59, abs=0.2)
+
+def test_transcriber_returns_no_segments_for_silence(vad):
+    silent = AudioBuffer(np.zeros(SAMPLE_RATE * 3, dtype=np.int16), SAMPLE_RATE)
+    backend = DurationBackend()
+    transcriber = AudioTranscriber(backend=backend, vad=vad)
+
+    assert transcriber.transcribe_segments(silent) == []
+    assert backend.seconds == 0
@@ -0,0 +1,45 @@
+import numpy as np
+
+from benchmarks.data import generate_action_items, generate_audio, generate_transcript
+from benchmarks.suite import BenchmarkSuite, compare_to_baseline, measure
+
+def test_generated_inputs_are_deterministic():
+    first = generate_audio(5, seed=3)
+    second = generate_audio(5, seed=3)
+    assert first.frame_count == 5 * 16000
+    assert np.array_equal(first.samples, second.samples)
+    assert generate_transcript(120, seed=1) == generate_transcript(120, seed=1)
+
+def test_transcript_length_tracks_duration():
+    short = len(generate_transcript(60).split())
+    long = len(generate_transcript(600).split())
+    assert 150 <= short < 170
+    assert 1500 <= long < 1520
+
+def test_action_items_come_from_trigger_phrases():
+    items = generate_action_items("We need to ship it. Nothing else happened.")
+    assert [item["action"] for item in items] == ["ship"]
+
+def test_measure_reports_time_and_memory():
+    result = measure(lambda: sum(range(1000)), repeat=2)
+    assert result["wall_seconds"] >= 0
+    assert result["peak_rss_mb"] > 0
+
+def test_audio_stages_run_offline():
+    suite = BenchmarkSuite(durations=[20], stages=["normalize", "transcribe", "integrations"], progress=lambda line: None)
+    report = suite.run()
+    assert set(report["results"]) == {"normalize@20", "transcribe@20", "integrations@20"}
+    assert all("error" not in result for result in report["results"].values())
+
+def test_compare_flags_slower_and_larger_stages():
+    baseline = {"results": {
+        "transcribe@60": {"wall_seconds": 1.0, "peak_rss_mb": 100.0},
+        "summarize@60": {"error": "missing model"}
+    }}
+    report = {"results": {
+        "transcribe@60": {"wall_seconds": 1.5, "peak_rss_mb": 110.0},
+        "summarize@60": {"wall_seconds": 9.0, "peak_rss_mb": 900.0}
+    }}
+    regressions = compare_to_baseline(report, baseline, time_tolerance=0.2, memory_tolerance=0.2)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("transcribe@60: wall time")
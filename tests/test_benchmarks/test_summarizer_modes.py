@@ -0,0 +1,53 @@
+import pytest
+
+from benchmarks.summarizer_modes import compare_modes, fixed_transcripts, rouge_l, rouge_n, score_summary
+
+class FakeSummarizer:
+    """Summarizer stand-in whose output depends on its mode."""
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.model_name = f"fake-{mode}"
+        self.loaded = False
+
+    def load_model(self):
+        if self.mode == "onnx":
+            raise ImportError("No module named 'optimum'")
+        self.loaded = True
+
+    def unload_model(self):
+        self.loaded = False
+
+    def summarize(self, text):
+        words = text.split()[:8]
+        if self.mode == "distilled":
+            words = words[:4]
+        return " ".join(words)
+
+def test_rouge_scores_identical_text_as_one():
+    assert score_summary("The team ships Friday.", "the team ships friday") == {"rouge1": 1.0, "rouge2": 1.0, "rougeL": 1.0}
+
+def test_rouge_partial_overlap():
+    assert rouge_n("the cat sat", "the cat ran", 1) == pytest.approx(2 / 3)
+    assert rouge_n("the cat sat", "the cat ran", 2) == pytest.approx(1 / 2)
+    assert rouge_l("a b c d", "a c d e") == pytest.approx(3 / 4)
+    assert rouge_n("", "anything") == 0.0
+
+def test_fixed_transcripts_are_generated_or_read(tmp_path):
+    assert list(fixed_transcripts([60])) == ["generated_60s"]
+    (tmp_path / "standup.txt").write_text("We shipped it.", encoding='utf-8')
+    assert fixed_transcripts(directory=str(tmp_path)) == {"standup": "We shipped it."}
+
+def test_compare_scores_modes_against_baseline():
+    transcripts = fixed_transcripts([60])
+    report = compare_modes(["distilled", "onnx", "full"], transcripts, FakeSummarizer, progress=lambda line: None)
+
+    assert list(report["modes"]) == ["full", "distilled", "onnx"]
+    assert report["modes"]["full"]["rouge1"] == 1.0
+    assert 0 < report["modes"]["distilled"]["rouge1"] < 1.0
+    assert report["modes"]["distilled"]["transcripts"]["generated_60s"]["summary"]
+    assert report["modes"]["onnx"] == {"error": "No module named 'optimum'"}
+
+def test_compare_fails_without_baseline():
+    with pytest.raises(ImportError):
+        compare_modes(["full"], fixed_transcripts([60]), FakeSummarizer, baseline_mode="onnx", progress=lambda line: None)
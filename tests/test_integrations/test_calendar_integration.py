@@ -0,0 +1,98 @@
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.integrations.calendar_integration import CalendarIntegration
+
+class StubCalendarHandler(BaseHTTPRequestHandler):
+    """Google-style calendar stub with a fixed busy interval for every attendee."""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+
+        if self.path.endswith("/freeBusy"):
+            busy = [{"start": "2030-01-02T10:00:00Z", "end": "2030-01-02T11:00:00Z"}]
+            calendars = {item["id"]: {"busy": busy} for item in body["items"]}
+            return self._reply(200, {"calendars": calendars})
+
+        if server.fail_events:
+            return self._reply(400, {"error": "bad request"})
+        self._reply(200, {"id": f"event-{len(server.requests)}", "start": body["start"], "summary": body["summary"]})
+
+    def _reply(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubCalendarHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.fail_events = False
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def calendar(stub_server):
+    integration = CalendarIntegration("test_api_key", retry_backoff=0)
+    integration.base_url = f"http://127.0.0.1:{stub_server.server_address[1]}"
+    return integration
+
+def test_free_slot_skips_busy_interval(calendar):
+    slot = calendar.find_free_slot(["a@example.com"], datetime(2030, 1, 2, 10, 0), duration_minutes=30)
+    assert slot == datetime(2030, 1, 2, 11, 0)
+
+def test_availability_is_cached(calendar, stub_server):
+    calendar.find_free_slot(["a@example.com"], datetime(2030, 1, 2, 9, 0))
+    calendar.find_free_slot(["a@example.com"], datetime(2030, 1, 2, 14, 0))
+
+    assert stub_server.requests.count("/freeBusy") == 1
+
+def test_availability_cache_expires(calendar, stub_server):
+    calendar.availability_ttl = 0
+    window = (datetime(2030, 1, 2), datetime(2030, 1, 3))
+    calendar.get_busy_times(["a@example.com"], *window)
+    calendar.get_busy_times(["a@example.com"], *window)
+
+    assert stub_server.requests.count("/freeBusy") == 2
+
+def test_followup_meeting_moves_to_free_slot(calendar):
+    event = calendar.create_followup_meeting(
+        "Budget review",
+        datetime(2030, 1, 2, 10, 0),
+        attendees=["a@example.com"],
+        find_free_slot=True
+    )
+    assert event["start"]["dateTime"] == "2030-01-02T11:00:00"
+
+def test_batch_followups_do_not_overlap(calendar, stub_server):
+    meetings = [
+        {"summary": f"Meeting {i}", "start_time": datetime(2030, 1, 2, 10, 0), "attendees": ["a@example.com"]}
+        for i in range(3)
+    ]
+    events = calendar.create_followup_meetings(meetings)
+
+    starts = [event["start"]["dateTime"] for event in events]
+    assert starts == ["2030-01-02T11:00:00", "2030-01-02T11:30:00", "2030-01-02T12:00:00"]
+    assert stub_server.requests.count("/freeBusy") == 1
+    assert stub_server.requests.count("/events") == 3
+
+def test_failed_event_returns_none(calendar, stub_server):
+    stub_server.fail_events = True
+    assert calendar.create_events([{"summary": "x"}, {"summary": "y"}]) == [None, None]
@@ -1,6 +1,9 @@
 import pytest
 from src.integrations.task_manager import TaskManager
 from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
 
 @pytest.fixture
 def task_manager():
@@ -11,9 +14,9 @@ def test_task_manager_initialization(task_manager):
     assert task_manager.base_url == "https://api.example.com"
     assert "Bearer test_api_key" in task_manager.headers["Authorization"]
 
-@patch('requests.post')
-def test_create_task(mock_post, task_manager):
-    mock_post.return_value.json.return_value = {
+@patch('requests.Session.request')
+def test_create_task(mock_request, task_manager):
+    mock_request.return_value.json.return_value = {
         "id": "123",
         "title": "Test Task",
         "status": "created"
@@ -30,9 +33,9 @@ def test_create_task(mock_post, task_manager):
     assert result["title"] == "Test Task"
     assert result["status"] == "created"
 
-@patch('requests.post')
-def test_create_tasks_from_action_items(mock_post, task_manager):
-    mock_post.return_value.json.return_value = {
+@patch('requests.Session.request')
+def test_create_tasks_from_action_items(mock_request, task_manager):
+    mock_request.return_value.json.return_value = {
         "id": "123",
         "status": "created"
     }
@@ -54,4 +57,102 @@ def test_create_tasks_from_action_items(mock_post, task_manager):
     assert len(results) == 2
     assert all(isinstance(result, dict) for result in results)
     assert all("id" in result for result in results)
-    assert all("status" in result for result in results)
\ No newline at end of file
+    assert all("status" in result for result in results)
+
+class StubTaskHandler(BaseHTTPRequestHandler):
+    """Task API stub: fails each title listed in ``flaky`` once and ``broken`` always."""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.headers.get("Idempotency-Key"), body))
+
+        if self.path == "/tasks/batch":
+            if not server.batch_supported:
+                return self._reply(404, {"error": "not found"})
+            tasks = [{"id": task["idempotency_key"][:8], "title": task["title"]} for task in body["tasks"]]
+            return self._reply(200, {"tasks": tasks})
+
+        title = body["title"]
+        with server.lock:
+            if title in server.broken or server.flaky.pop(title, False):
+                return self._reply(503, {"error": "unavailable"})
+        self._reply(201, {"id": self.headers["Idempotency-Key"][:8], "title": title, "status": "created"})
+
+    def _reply(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubTaskHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.flaky = {}
+    server.broken = set()
+    server.batch_supported = False
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def make_action_items(count):
+    return [
+        {"action": f"task-{i}", "context": f"We need to do task {i}", "priority": "medium"}
+        for i in range(count)
+    ]
+
+def stub_task_manager(server, **kwargs):
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    return TaskManager("test_api_key", url, retry_backoff=0, **kwargs)
+
+def test_bulk_creation_against_stub_server(stub_server):
+    manager = stub_task_manager(stub_server, max_workers=4)
+    results = manager.create_tasks_from_action_items(make_action_items(12))
+
+    assert [result["title"] for result in results] == [f"task-{i}" for i in range(12)]
+    assert all(result["status"] == "created" for result in results)
+    keys = {key for _, key, _ in stub_server.requests}
+    assert len(keys) == 12
+
+def test_retry_reuses_idempotency_key(stub_server):
+    stub_server.flaky["task-1"] = True
+    manager = stub_task_manager(stub_server)
+    results = manager.create_tasks_from_action_items(make_action_items(3))
+
+    assert all("error" not in result for result in results)
+    retried = [key for _, key, body in stub_server.requests if body["title"] == "task-1"]
+    assert len(retried) == 2
+    assert retried[0] == retried[1]
+
+def test_failed_item_does_not_abort_others(stub_server):
+    stub_server.broken.add("task-2")
+    manager = stub_task_manager(stub_server, max_retries=1)
+    results = manager.create_tasks_from_action_items(make_action_items(4))
+
+    assert results[2] == {"error": results[2]["error"], "title": "task-2"}
+    assert all(results[i]["status"] == "created" for i in (0, 1, 3))
+
+def test_batch_endpoint_submits_once(stub_server):
+    stub_server.batch_supported = True
+    manager = stub_task_manager(stub_server, batch_endpoint=True)
+    results = manager.create_tasks_from_action_items(make_action_items(5))
+
+    assert len(results) == 5
+    assert [path for path, _, _ in stub_server.requests] == ["/tasks/batch"]
+
+def test_batch_endpoint_falls_back_to_single_requests(stub_server):
+    manager = stub_task_manager(stub_server, batch_endpoint=True)
+    results = manager.create_tasks_from_action_items(make_action_items(3))
+
+    assert all(result["status"] == "created" for result in results)
+    assert sum(path == "/tasks" for path, _, _ in stub_server.requests) == 3
@@ -1,5 +1,6 @@
 import pytest
 from src.nlp.action_item_extractor import ActionItemExtractor
+from src.audio.transcript import Transcript
 
 def test_action_item_extractor_initialization():
     extractor = ActionItemExtractor()
@@ -15,4 +16,56 @@ def test_extract_action_items():
     assert all(isinstance(item, dict) for item in action_items)
     assert all("action" in item for item in action_items)
     assert all("context" in item for item in action_items)
-    assert all("priority" in item for item in action_items)
\ No newline at end of file
+    assert all("priority" in item for item in action_items)
+
+def test_pipeline_only_splits_sentences():
+    extractor = ActionItemExtractor()
+    pipe_names = extractor.nlp.pipe_names
+    assert "sentencizer" in pipe_names
+    assert "parser" not in pipe_names
+    assert "ner" not in pipe_names
+
+def test_overlapping_phrases_are_all_found():
+    extractor = ActionItemExtractor()
+    action_items = extractor.extract_action_items("We will need to schedule a follow-up.")
+    assert [item["action"] for item in action_items] == ["need", "schedule"]
+
+def test_batch_matches_single_extraction():
+    extractor = ActionItemExtractor()
+    texts = [
+        "We need to schedule a follow-up meeting. John must prepare the report.",
+        "Nothing to do here.",
+        "The team is going to ship the release. Maria should review it."
+    ]
+    batched = extractor.extract_action_items_batch(texts)
+    assert batched == [extractor.extract_action_items(text) for text in texts]
+    assert batched[1] == []
+
+def test_segment_items_carry_timestamps():
+    extractor = ActionItemExtractor()
+    transcript = Transcript.from_segments([
+        {"start": 0.0, "end": 30.0, "text": "We need to schedule a follow-up meeting."},
+        {"start": 30.0, "end": 60.0, "text": ""},
+        {"start": 60.0, "end": 90.0, "text": "Maria should review the release."}
+    ])
+    action_items = extractor.extract_action_items_from_segments(transcript)
+
+    assert [(item["action"], item["start"], item["end"]) for item in action_items] == [
+        ("schedule", 0.0, 30.0),
+        ("review", 60.0, 90.0)
+    ]
+
+def test_phrase_split_across_segments_is_found():
+    extractor = ActionItemExtractor()
+    transcript = Transcript.from_segments([
+        {"start": 0.0, "end": 2.0, "text": "We need to"},
+        {"start": 2.0, "end": 5.0, "text": "schedule the review. Maria should"},
+        {"start": 5.0, "end": 7.0, "text": "send the slides"}
+    ])
+    action_items = extractor.extract_action_items_from_segments(transcript)
+
+    assert [(item["action"], item["start"], item["end"]) for item in action_items] == [
+        ("schedule", 0.0, 5.0),
+        ("send", 2.0, 7.0)
+    ]
+    assert action_items[0]["context"] == "We need to schedule the review."
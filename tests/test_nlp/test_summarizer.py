@@ -1,4 +1,7 @@
+import pytest
+from unittest.mock import patch
 from src.nlp.summarizer import ContentSummarizer
+from src.utils.model_registry import model_registry
 
 def test_summarizer_initialization():
     summarizer = ContentSummarizer()
@@ -21,4 +24,192 @@ def test_extract_key_points():
     key_points = summarizer.extract_key_points(text)
     assert isinstance(key_points, list)
     assert len(key_points) > 0
-    assert all(isinstance(point, str) for point in key_points)
\ No newline at end of file
+    assert all(isinstance(point, str) for point in key_points)
+
+class FakeTokenizer:
+    model_max_length = 1024
+
+    def __call__(self, texts, add_special_tokens=True):
+        return {"input_ids": [text.split() for text in texts]}
+
+class FakePipeline:
+    """Summarization pipeline stand-in that records each batched call."""
+
+    def __init__(self):
+        self.tokenizer = FakeTokenizer()
+        self.calls = []
+
+    def __call__(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        return [{"summary_text": " ".join(text.split()[:5]) + "."} for text in texts]
+
+@pytest.fixture
+def chunked_summarizer():
+    with patch('src.nlp.summarizer.pipeline', return_value=FakePipeline()):
+        yield ContentSummarizer(model_name="test/fake-summarizer", chunk_tokens=50, reduce_depth=2)
+    model_registry.unload(("summarization", "test/fake-summarizer", "full"))
+
+def test_summarizers_share_one_pipeline():
+    with patch('src.nlp.summarizer.pipeline', return_value=FakePipeline()) as mock_pipeline:
+        first = ContentSummarizer(model_name="test/shared-summarizer")
+        second = ContentSummarizer(model_name="test/shared-summarizer")
+        assert mock_pipeline.call_count == 0
+
+        assert first.summarizer is second.load_model()
+        assert mock_pipeline.call_count == 1
+    model_registry.unload(("summarization", "test/shared-summarizer", "full"))
+
+def test_chunk_text_respects_token_budget(chunked_summarizer):
+    text = " ".join(f"Sentence number {i} has exactly seven words." for i in range(40))
+    chunks = chunked_summarizer.chunk_text(text)
+
+    assert len(chunks) > 1
+    assert all(len(chunk.split()) <= 50 for chunk in chunks)
+    assert " ".join(chunks) == text
+
+def test_chunk_text_splits_overlong_sentence(chunked_summarizer):
+    text = " ".join(["word"] * 180) + "."
+    chunks = chunked_summarizer.chunk_text(text)
+    assert all(len(chunk.split()) <= 50 for chunk in chunks)
+
+def test_long_text_is_map_reduced_in_batches(chunked_summarizer):
+    text = " ".join(f"Topic {i} was discussed at length today." for i in range(60))
+    summary = chunked_summarizer.summarize(text)
+
+    calls = chunked_summarizer.summarizer.calls
+    assert isinstance(summary, str)
+    assert len(calls[0]) == len(chunked_summarizer.chunk_text(text))
+    assert len(calls[-1]) == 1
+    assert len(calls) <= chunked_summarizer.reduce_depth + 1
+
+def test_short_text_is_summarized_once(chunked_summarizer):
+    chunked_summarizer.summarize("A short meeting. Nothing else happened.")
+    assert chunked_summarizer.summarizer.calls == [["A short meeting. Nothing else happened."]]
+
+def test_analyze_short_text_generates_once(chunked_summarizer):
+    text = " ".join(f"Point {i} was agreed." for i in range(8))
+    analysis = chunked_summarizer.analyze(text)
+
+    assert len(chunked_summarizer.summarizer.calls) == 1
+    summary_sentences = [s.strip() for s in analysis["summary"].split('.') if s.strip()]
+    assert analysis["key_points"] == summary_sentences
+
+def test_analyze_long_text_reuses_chunk_summaries(chunked_summarizer):
+    text = " ".join(f"Topic {i} was discussed at length today." for i in range(60))
+    analysis = chunked_summarizer.analyze(text)
+
+    calls = chunked_summarizer.summarizer.calls
+    assert len(calls[0]) == len(analysis["key_points"])
+    assert analysis["summary"]
+
+def test_segments_are_analyzed_like_joined_text(chunked_summarizer):
+    segments = [" ".join(f"Topic {i} was discussed at length today." for i in range(start, start + 6)) for start in range(0, 60, 6)]
+    from_segments = chunked_summarizer.analyze_segments(iter(segments))
+    from_text = chunked_summarizer.analyze(" ".join(segments))
+    assert from_segments == from_text
+
+def test_completed_chunk_summaries_are_not_regenerated(chunked_summarizer):
+    text = " ".join(f"Topic {i} was discussed at length today." for i in range(60))
+    reported = []
+    expected = chunked_summarizer.analyze_segments([text], on_chunk_summaries=reported.extend)
+    chunked_summarizer.summarizer.calls.clear()
+
+    resumed = chunked_summarizer.analyze_segments([text], completed_chunks=reported[:2])
+    chunks = chunked_summarizer.chunk_text(text)
+    assert resumed == expected
+    assert chunked_summarizer.summarizer.calls[0] == chunks[2:]
+
+def test_sentence_split_across_segments_stays_whole(chunked_summarizer):
+    chunks = list(chunked_summarizer.iter_chunks(["We agreed that the", "release ships on Friday. Then lunch."]))
+    assert chunks == ["We agreed that the release ships on Friday. Then lunch."]
+
+def test_inference_modes_load_separately():
+    with patch('src.nlp.summarizer.pipeline', return_value=FakePipeline()):
+        full = ContentSummarizer(model_name="test/mode-summarizer")
+        quantized = ContentSummarizer(model_name="test/mode-summarizer", mode="quantized")
+        with patch.object(ContentSummarizer, '_load_quantized', return_value=FakePipeline()) as load_quantized:
+            assert full.load_model() is not quantized.load_model()
+            assert load_quantized.call_count == 1
+    full.unload_model()
+    quantized.unload_model()
+
+def test_distilled_mode_uses_distilled_model():
+    summarizer = ContentSummarizer(model_name="test/large", mode="distilled", distilled_model="test/small")
+    assert summarizer.model_name == "test/small"
+    with pytest.raises(ValueError):
+        ContentSummarizer(mode="fp4")
+
+def test_concurrent_summaries_are_micro_batched():
+    import threading
+
+    fake = FakePipeline()
+    with patch('src.nlp.summarizer.pipeline', return_value=fake):
+        # Separate instances, as each job's summarizer is, still share one batcher.
+        summarizers = [ContentSummarizer(model_name="test/batched-summarizer", max_batch=4, max_wait_ms=200) for _ in range(4)]
+        summarizer = summarizers[0]
+        results = {}
+
+        def call(index):
+            results[index] = summarizers[index].summarize(f"Meeting {index} covered the budget.")
+
+        threads = [threading.Thread(target=call, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+    assert results[2] == "Meeting 2 covered the budget.."
+    assert len(fake.calls) == 1 and len(fake.calls[0]) == 4
+    assert summarizers[3].batch_stats()["batch_sizes"] == {4: 1}
+    assert all(other.batcher is summarizer.batcher for other in summarizers)
+
+    batcher = summarizer.batcher
+    summarizer.unload_model()
+    with pytest.raises(RuntimeError):
+        batcher.submit(["After unloading."])
+    assert summarizer.batcher is not batcher
+    summarizer.unload_model()
+
+def test_micro_batches_run_as_length_sorted_buckets():
+    fake = FakePipeline()
+    with patch('src.nlp.summarizer.pipeline', return_value=fake):
+        summarizer = ContentSummarizer(model_name="test/bucketed-summarizer", batch_size=2, max_batch=4, max_wait_ms=200)
+        texts = ["A much longer text about the budget.", "Short.", "Medium length text.", "Tiny."]
+        summaries = summarizer.batcher.submit(texts, key=(130, 30, 2))
+
+    assert summaries == [" ".join(text.split()[:5]) + "." for text in texts]
+    assert fake.calls == [["Tiny.", "Short."], ["Medium length text.", "A much longer text about the budget."]]
+    summarizer.unload_model()
+
+class SingleThreadedPipeline(FakePipeline):
+    """Fails like a fast tokenizer does when two threads use it at once."""
+
+    def __init__(self):
+        super().__init__()
+        self.busy = False
+
+    def __call__(self, texts, **kwargs):
+        import time
+
+        if self.busy:
+            raise RuntimeError("Already borrowed")
+        self.busy = True
+        try:
+            time.sleep(0.05)
+            return super().__call__(texts, **kwargs)
+        finally:
+            self.busy = False
+
+def test_concurrent_jobs_take_turns_on_the_shared_pipeline():
+    from src.utils.job_queue import JobQueue
+
+    with patch('src.nlp.summarizer.pipeline', return_value=SingleThreadedPipeline()):
+        summarizer = ContentSummarizer(model_name="test/single-threaded-summarizer")
+        jobs = JobQueue(lambda payload, progress: summarizer.summarize(payload["text"]), workers=2)
+        jobs.start()
+        submitted = [jobs.submit({"text": f"Meeting {index} covered the budget."}) for index in range(2)]
+        assert jobs.drain(5)
+
+    assert [jobs.result(job["id"])["status"] for job in submitted] == ["completed", "completed"]
+    summarizer.unload_model()
+
@@ -0,0 +1,86 @@
+import os
+import time
+
+import pytest
+
+from src.utils.cache import ResultCache
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(str(tmp_path / "cache"), max_bytes=10 * 1024)
+
+def test_hash_file_is_content_addressed(tmp_path):
+    first = tmp_path / "a.wav"
+    second = tmp_path / "b.wav"
+    first.write_bytes(b"same bytes")
+    second.write_bytes(b"same bytes")
+
+    assert ResultCache.hash_file(str(first)) == ResultCache.hash_file(str(second))
+
+def test_stage_key_depends_on_config():
+    base = ResultCache.stage_key("analysis", "abc", {"model": "bart", "max_length": 130})
+    reordered = ResultCache.stage_key("analysis", "abc", {"max_length": 130, "model": "bart"})
+    changed = ResultCache.stage_key("analysis", "abc", {"model": "bart", "max_length": 100})
+
+    assert base == reordered
+    assert base != changed
+    assert base != ResultCache.stage_key("transcript", "abc", {"model": "bart", "max_length": 130})
+
+def test_get_and_set_round_trip(cache):
+    key = ResultCache.stage_key("transcript", "abc")
+    assert cache.get("transcript", key) is None
+
+    cache.set("transcript", key, "hello world")
+    assert cache.get("transcript", key) == "hello world"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["stages"]["transcript"]["entries"] == 1
+
+def test_lru_eviction_keeps_recently_used(cache):
+    payload = "x" * 3000
+    keys = [ResultCache.stage_key("transcript", str(i)) for i in range(3)]
+    for key in keys:
+        cache.set("transcript", key, payload)
+
+    old = time.time() - 100
+    for index, key in enumerate(keys):
+        os.utime(cache._entry_path("transcript", key), (old + index, old + index))
+    assert cache.get("transcript", keys[0]) == payload
+
+    cache.set("transcript", ResultCache.stage_key("transcript", "new"), payload)
+
+    assert cache.stats()["total_bytes"] <= cache.max_bytes
+    assert cache.get("transcript", keys[0]) == payload
+    assert cache.get("transcript", keys[1]) is None
+
+def test_only_a_store_over_budget_scans_the_cache(cache, monkeypatch):
+    cache.set("transcript", ResultCache.stage_key("transcript", "first"), "small")
+    scans = []
+    entries = cache._entries
+    monkeypatch.setattr(cache, "_entries", lambda: scans.append(1) or entries())
+
+    for index in range(5):
+        cache.set("transcript", ResultCache.stage_key("transcript", str(index)), "small")
+    cache.set("transcript", ResultCache.stage_key("transcript", "0"), "replaced")
+    assert scans == []
+
+    cache.set("analysis", ResultCache.stage_key("analysis", "big"), "x" * 11000)
+    assert len(scans) == 1
+    monkeypatch.undo()
+    assert cache.stats()["total_bytes"] <= cache.max_bytes
+
+def test_counters_are_exact_across_threads(cache):
+    import threading
+
+    def look_up():
+        for index in range(500):
+            cache.get("analysis", str(index))
+
+    threads = [threading.Thread(target=look_up) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache.stats()["misses"] == 4000
@@ -0,0 +1,86 @@
+import numpy as np
+
+from src.audio.audio_buffer import AudioBuffer
+from src.utils.checkpoint import JobCheckpoint
+
+def test_stages_and_streams_survive_reopening(tmp_path):
+    checkpoint = JobCheckpoint(tmp_path / "job", {"model": "a"})
+    checkpoint.save("analysis", {"summary": "Done."})
+    checkpoint.save("calendar_event", None)
+    checkpoint.append("chunks", {"index": 0, "text": "hello"})
+    checkpoint.save_audio(AudioBuffer(np.arange(10, dtype=np.int16), 8000))
+
+    reopened = JobCheckpoint(tmp_path / "job", {"model": "a"})
+    assert reopened.load("analysis") == {"summary": "Done."}
+    assert reopened.has("calendar_event") and reopened.load("calendar_event") is None
+    assert reopened.read("chunks") == [{"index": 0, "text": "hello"}]
+    audio = reopened.load_audio()
+    assert audio.sample_rate == 8000
+    assert audio.samples[:, 0].tolist() == list(range(10))
+
+def test_other_settings_discard_checkpoint(tmp_path):
+    JobCheckpoint(tmp_path / "job", {"model": "a"}).save("analysis", {"summary": "Done."})
+    assert not JobCheckpoint(tmp_path / "job", {"model": "b"}).has("analysis")
+
+def test_torn_stream_line_and_leftover_temp_files_are_ignored(tmp_path):
+    checkpoint = JobCheckpoint(tmp_path / "job")
+    checkpoint.append("chunks", {"index": 0, "text": "hello"})
+    with open(tmp_path / "job" / "chunks.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"index": 1, "te')
+    (tmp_path / "job" / "stray.tmp").write_bytes(b"partial")
+
+    reopened = JobCheckpoint(tmp_path / "job")
+    assert reopened.read("chunks") == [{"index": 0, "text": "hello"}]
+    assert not list((tmp_path / "job").glob("*.tmp"))
+
+def test_discard_and_remove(tmp_path):
+    checkpoint = JobCheckpoint(tmp_path / "job")
+    checkpoint.save_audio(AudioBuffer(np.zeros(4, dtype=np.int16), 8000))
+    checkpoint.discard("audio")
+    assert checkpoint.load_audio() is None
+
+    checkpoint.remove()
+    assert not (tmp_path / "job").exists()
+
+def test_directory_for_changes_with_file(tmp_path):
+    audio = tmp_path / "meeting.wav"
+    audio.write_bytes(b"one")
+    first = JobCheckpoint.directory_for(str(tmp_path / "jobs"), str(audio))
+    audio.write_bytes(b"longer")
+    assert first.name.startswith("meeting-")
+    assert JobCheckpoint.directory_for(str(tmp_path / "jobs"), str(audio)) != first
+
+def test_concurrent_jobs_for_one_file_get_separate_directories(tmp_path):
+    audio = tmp_path / "meeting.wav"
+    audio.write_bytes(b"audio")
+    first = JobCheckpoint.open_for(str(tmp_path / "jobs"), str(audio))
+    first.save("analysis", {"summary": "First."})
+    second = JobCheckpoint.open_for(str(tmp_path / "jobs"), str(audio))
+    assert second.directory != first.directory
+    assert first.load("analysis") == {"summary": "First."}
+
+    second.save("analysis", {"summary": "Second."})
+    second.remove()
+    first.save("action_items", [])
+    assert first.load("analysis") == {"summary": "First."}
+    first.remove()
+
+def test_resume_picks_up_released_directory(tmp_path):
+    audio = tmp_path / "meeting.wav"
+    audio.write_bytes(b"audio")
+    failed = JobCheckpoint.open_for(str(tmp_path / "jobs"), str(audio))
+    failed.save("analysis", {"summary": "Done."})
+    live = JobCheckpoint.open_for(str(tmp_path / "jobs"), str(audio))
+    live.save("analysis", {"summary": "Live."})
+    failed.release()
+
+    resumed = JobCheckpoint.open_for(str(tmp_path / "jobs"), str(audio), resume=True)
+    assert resumed.directory == failed.directory
+    assert resumed.load("analysis") == {"summary": "Done."}
+    resumed.remove()
+    live.release()
+
+    resumed = JobCheckpoint.open_for(str(tmp_path / "jobs"), str(audio), resume=True)
+    assert resumed.directory == live.directory
+    assert resumed.load("analysis") == {"summary": "Live."}
+    resumed.remove()
@@ -0,0 +1,87 @@
+import queue
+import threading
+
+import pytest
+
+from src.utils.job_queue import JobQueue
+
+def test_jobs_run_and_report_progress():
+    def process(payload, progress):
+        progress("decode", 0.5)
+        return {"doubled": payload["value"] * 2}
+
+    jobs = JobQueue(process, workers=2)
+    jobs.start()
+    submitted = [jobs.submit({"value": value}) for value in range(5)]
+    assert jobs.drain(timeout=5)
+
+    for value, status in enumerate(submitted):
+        job = jobs.result(status["id"])
+        assert job["status"] == "completed"
+        assert job["stage"] == "decode"
+        assert job["progress"] == 1.0
+        assert job["result"] == {"doubled": value * 2}
+
+def test_failed_job_keeps_its_error():
+    def process(payload, progress):
+        raise ValueError("bad audio")
+
+    jobs = JobQueue(process)
+    jobs.start()
+    job_id = jobs.submit({})["id"]
+    jobs.drain(timeout=5)
+    assert jobs.get(job_id)["status"] == "failed"
+    assert jobs.get(job_id)["error"] == "bad audio"
+
+def test_full_queue_refuses_jobs_and_cancelled_jobs_free_a_slot():
+    release = threading.Event()
+    jobs = JobQueue(lambda payload, progress: release.wait(5), max_queued=2)
+    first = jobs.submit({})
+    jobs.submit({})
+    with pytest.raises(queue.Full):
+        jobs.submit({})
+
+    assert jobs.cancel(first["id"])
+    third = jobs.submit({})
+    jobs.start()
+    release.set()
+    jobs.drain(timeout=5)
+    assert jobs.get(first["id"])["status"] == "cancelled"
+    assert jobs.get(third["id"])["status"] == "completed"
+    assert not jobs.cancel(third["id"])
+
+def test_draining_finishes_accepted_jobs_and_refuses_new_ones():
+    started = threading.Event()
+    release = threading.Event()
+
+    def process(payload, progress):
+        started.set()
+        release.wait(5)
+        return "done"
+
+    jobs = JobQueue(process)
+    jobs.start()
+    running = jobs.submit({})
+    waiting = jobs.submit({})
+    started.wait(5)
+
+    drainer = threading.Thread(target=jobs.drain)
+    drainer.start()
+    while not jobs.draining:
+        pass
+    with pytest.raises(RuntimeError):
+        jobs.submit({})
+
+    release.set()
+    drainer.join(5)
+    assert jobs.get(running["id"])["status"] == "completed"
+    assert jobs.get(waiting["id"])["status"] == "completed"
+    assert jobs.stats()["completed"] == 2
+
+def test_only_recent_finished_jobs_are_kept():
+    jobs = JobQueue(lambda payload, progress: None, keep_finished=2)
+    jobs.start()
+    ids = [jobs.submit({})["id"] for _ in range(4)]
+    jobs.drain(timeout=5)
+    assert jobs.get(ids[0]) is None
+    assert jobs.get(ids[-1])["status"] == "completed"
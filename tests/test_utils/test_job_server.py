@@ -0,0 +1,97 @@
+import http.client
+import json
+import socket
+import threading
+
+import pytest
+
+from src.utils.job_queue import JobQueue
+from src.utils.job_server import JobServer
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path):
+        super().__init__("localhost")
+        self.socket_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+
+def validate(payload):
+    if "file_path" not in payload:
+        raise ValueError("A job needs a file_path")
+    return payload
+
+@pytest.fixture
+def release():
+    return threading.Event()
+
+def start_server(release, **kwargs):
+    def process(payload, progress):
+        progress("transcribe", 0.5)
+        release.wait(5)
+        return {"summary": f"Summary of {payload['file_path']}"}
+
+    server = JobServer(JobQueue(process, max_queued=1), validate=validate, metrics=lambda: "echoes_up 1\n", **kwargs)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, thread
+
+def request(connection, method, path, body=None):
+    connection.request(method, path, body=json.dumps(body) if body is not None else None)
+    response = connection.getresponse()
+    data = response.read()
+    return response.status, (json.loads(data) if response.getheader("Content-Type") == "application/json" else data.decode())
+
+def test_submit_poll_and_fetch_result(release):
+    server, thread = start_server(release, port=0)
+    connection = http.client.HTTPConnection(*server.server.server_address[:2])
+
+    status, job = request(connection, "POST", "/jobs", {"file_path": "meeting.wav"})
+    assert status == 202
+    assert job["status"] in ("queued", "running")
+
+    status, body = request(connection, "GET", f"/jobs/{job['id']}/result")
+    assert status == 409
+
+    release.set()
+    server.shutdown(timeout=5)
+    thread.join(5)
+    assert server.jobs.result(job["id"])["result"] == {"summary": "Summary of meeting.wav"}
+
+def test_bad_requests_full_queue_and_metrics(release):
+    server, thread = start_server(release, port=0)
+    connection = http.client.HTTPConnection(*server.server.server_address[:2])
+
+    assert request(connection, "POST", "/jobs", {})[0] == 400
+    assert request(connection, "GET", "/jobs/unknown")[0] == 404
+    assert request(connection, "GET", "/metrics") == (200, "echoes_up 1\n")
+
+    status, running = request(connection, "POST", "/jobs", {"file_path": "running.wav"})
+    assert status == 202
+    while request(connection, "GET", f"/jobs/{running['id']}")[1]["status"] != "running":
+        pass
+    assert request(connection, "POST", "/jobs", {"file_path": "queued.wav"})[0] == 202
+    assert request(connection, "POST", "/jobs", {"file_path": "refused.wav"})[0] == 503
+
+    status, stats = request(connection, "GET", "/status")
+    assert status == 200
+    assert stats["running"] + stats["queued"] == 2
+
+    release.set()
+    server.shutdown(timeout=5)
+    thread.join(5)
+
+def test_serves_on_unix_socket(tmp_path, release):
+    socket_path = str(tmp_path / "echoes.sock")
+    server, thread = start_server(release, socket_path=socket_path)
+    release.set()
+
+    status, job = request(UnixHTTPConnection(socket_path), "POST", "/jobs", {"file_path": "standup.wav"})
+    assert status == 202
+    assert server.address == f"unix:{socket_path}"
+
+    server.shutdown(timeout=5)
+    thread.join(5)
+    assert server.jobs.get(job["id"])["status"] == "completed"
+    assert not (tmp_path / "echoes.sock").exists()
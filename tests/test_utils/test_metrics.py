@@ -0,0 +1,106 @@
+import time
+
+import pytest
+
+from src.utils.metrics import MetricsCollector, MetricsHook, PeakRSSMonitor
+
+class RecordingHook(MetricsHook):
+    def __init__(self):
+        self.events = []
+
+    def stage_started(self, stage, context):
+        context["span"] = f"span-{stage}"
+        self.events.append(("start", stage))
+
+    def stage_finished(self, stage, context, measurement, error):
+        self.events.append(("finish", stage, context["span"], error is not None))
+
+def test_stage_records_time_and_memory():
+    collector = MetricsCollector()
+    with collector.stage("decode") as measurement:
+        time.sleep(0.02)
+
+    assert measurement["wall_seconds"] >= 0.02
+    assert measurement["cpu_seconds"] >= 0
+    assert measurement["peak_rss_bytes"] > 0
+
+    totals = collector.snapshot()["stages"]["decode"]
+    assert totals["count"] == 1
+    assert totals["errors"] == 0
+
+def test_failed_stage_counts_error_and_reraises():
+    collector = MetricsCollector()
+    with pytest.raises(ValueError):
+        with collector.stage("transcribe"):
+            raise ValueError("boom")
+
+    assert collector.snapshot()["stages"]["transcribe"]["errors"] == 1
+
+def test_hooks_see_start_and_finish():
+    collector = MetricsCollector()
+    hook = RecordingHook()
+    collector.add_hook(hook)
+
+    with collector.stage("analyze", {"file_path": "a.wav"}):
+        pass
+
+    assert hook.events == [("start", "analyze"), ("finish", "analyze", "span-analyze", False)]
+
+def test_failing_hook_does_not_break_stage():
+    class BrokenHook(MetricsHook):
+        def stage_started(self, stage, context):
+            raise RuntimeError("tracer down")
+
+    collector = MetricsCollector()
+    collector.add_hook(BrokenHook())
+    with collector.stage("decode"):
+        pass
+    assert collector.snapshot()["stages"]["decode"]["count"] == 1
+
+def test_prometheus_export():
+    collector = MetricsCollector()
+    with collector.stage("decode"):
+        pass
+    collector.observe_size("audio_seconds", 12.5)
+
+    text = collector.to_prometheus()
+    assert "# TYPE echoes_stage_duration_seconds histogram" in text
+    assert 'echoes_stage_duration_seconds_bucket{stage="decode",le="+Inf"} 1' in text
+    assert "# TYPE echoes_stage_cpu_seconds_total counter" in text
+    assert "echoes_audio_seconds_total 12.5" in text
+    assert "# EOF" not in text
+
+def test_openmetrics_file(tmp_path):
+    collector = MetricsCollector()
+    with collector.stage("decode"):
+        pass
+    path = tmp_path / "metrics" / "echoes.om"
+    collector.write(str(path))
+
+    text = path.read_text()
+    assert "# TYPE echoes_stage_cpu_seconds counter" in text
+    assert 'echoes_stage_cpu_seconds_total{stage="decode"}' in text
+    assert text.endswith("# EOF\n")
+
+def test_concurrent_writes_leave_one_complete_file(tmp_path):
+    import threading
+
+    collector = MetricsCollector()
+    with collector.stage("decode"):
+        pass
+    path = tmp_path / "echoes.om"
+    threads = [threading.Thread(target=lambda: [collector.write(str(path)) for _ in range(20)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert path.read_text().endswith("# EOF\n")
+    assert [item.name for item in tmp_path.iterdir()] == ["echoes.om"]
+
+def test_peak_rss_monitor_sees_allocation():
+    with PeakRSSMonitor(interval=0.001) as monitor:
+        block = bytearray(b"\x01") * (50 * 2 ** 20)
+        time.sleep(0.02)
+        del block
+    assert monitor.peak_rss - monitor.start_rss >= 40 * 2 ** 20
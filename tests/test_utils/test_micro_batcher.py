@@ -0,0 +1,75 @@
+import threading
+import time
+
+import pytest
+
+from src.utils.micro_batcher import MicroBatcher
+
+class RecordingProcessor:
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, items, key):
+        self.batches.append((list(items), key))
+        return [f"{key}:{item}" for item in items]
+
+def test_concurrent_callers_share_a_batch():
+    processor = RecordingProcessor()
+    batcher = MicroBatcher(processor, max_batch=8, max_wait_ms=200)
+    results = {}
+
+    def call(name):
+        results[name] = batcher.submit([f"{name}-1", f"{name}-2"])
+
+    threads = [threading.Thread(target=call, args=(name,)) for name in "abcd"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    batcher.close()
+
+    assert len(processor.batches) == 1
+    assert results["c"] == ["None:c-1", "None:c-2"]
+    stats = batcher.stats()
+    assert stats["batch_sizes"] == {8: 1}
+    assert stats["mean_callers_per_batch"] == 4
+
+def test_batches_are_capped_sorted_by_length_and_split_by_key():
+    processor = RecordingProcessor()
+    batcher = MicroBatcher(processor, max_batch=3, max_wait_ms=50)
+    first = batcher.submit_async(["long text", "a", "mid", "xx"], key="short")
+    other = batcher.submit_async(["z"], key="long")
+    assert [future.result(5) for future in first] == ["short:long text", "short:a", "short:mid", "short:xx"]
+    assert other[0].result(5) == "long:z"
+    batcher.close()
+
+    assert processor.batches[0] == (["a", "mid", "long text"], "short")
+    assert all(len(items) <= 3 for items, _ in processor.batches)
+    assert {key for _, key in processor.batches} == {"short", "long"}
+    assert batcher.stats()["items"] == 5
+
+def test_lone_request_waits_at_most_max_wait():
+    batcher = MicroBatcher(RecordingProcessor(), max_batch=64, max_wait_ms=30)
+    start = time.perf_counter()
+    assert batcher.submit(["only"]) == ["None:only"]
+    assert time.perf_counter() - start < 1.0
+    batcher.close()
+
+def test_batch_errors_reach_every_caller():
+    def fail(items, key):
+        raise RuntimeError("model crashed")
+
+    batcher = MicroBatcher(fail, max_wait_ms=1)
+    with pytest.raises(RuntimeError, match="model crashed"):
+        batcher.submit(["a", "b"])
+    batcher.close()
+    with pytest.raises(RuntimeError):
+        batcher.submit(["c"])
+
+def test_short_result_list_fails_every_caller():
+    batcher = MicroBatcher(lambda items, key: items[:1], max_wait_ms=1)
+    futures = batcher.submit_async(["a", "b"])
+    for future in futures:
+        with pytest.raises(RuntimeError, match="returned 1 results"):
+            future.result(5)
+    batcher.close()
@@ -0,0 +1,61 @@
+import threading
+import time
+
+from src.utils.model_registry import ModelRegistry
+
+def test_loader_runs_once_per_key():
+    registry = ModelRegistry()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return object()
+
+    first = registry.get("model", loader)
+    second = registry.get("model", loader)
+
+    assert first is second
+    assert len(calls) == 1
+    assert registry.is_loaded("model")
+
+def test_concurrent_requests_share_one_load():
+    registry = ModelRegistry()
+    calls = []
+
+    def slow_loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get("slow", slow_loader))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+def test_unload_forces_reload():
+    registry = ModelRegistry()
+    first = registry.get("model", object)
+    registry.unload("model")
+
+    assert not registry.is_loaded("model")
+    assert registry.get("model", object) is not first
+
+def test_batcher_is_shared_and_closed_on_unload():
+    class Batcher:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    registry = ModelRegistry()
+    batcher = registry.batcher("model", Batcher)
+    assert registry.batcher("model", Batcher) is batcher
+
+    registry.unload("model")
+    assert batcher.closed
+    assert registry.batcher("model", Batcher) is not batcher
@@ -0,0 +1,103 @@
+import gzip
+import json
+
+import pytest
+
+from src.audio.transcript import Transcript
+from src.utils.output_writers import JSONLinesWriter, create_writer, output_extension, read_results
+
+@pytest.fixture
+def results():
+    return {
+        "transcript": "Welcome everyone. Maria will review it.",
+        "segments": Transcript.from_segments([
+            {"start": 0.0, "end": 30.0, "text": "Welcome everyone."},
+            {"start": 30.0, "end": 60.0, "text": "Maria will review it."}
+        ]),
+        "summary": "A short meeting.",
+        "action_items": [{"action": "Maria will review it.", "assignee": "Maria"}],
+        "calendar_event": None
+    }
+
+def expected(results):
+    return dict(results, segments=results["segments"].to_list())
+
+@pytest.mark.parametrize("output_format", ["json", "compact"])
+def test_json_formats_write_one_object(tmp_path, results, output_format):
+    path = str(tmp_path / "out.json")
+    with create_writer(path, output_format) as writer:
+        writer.write(results)
+
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    assert json.loads(content) == expected(results)
+    assert ("\n  " in content) == (output_format == "json")
+
+def test_compact_json_is_smaller(tmp_path, results):
+    sizes = {}
+    for output_format in ("json", "compact"):
+        path = tmp_path / f"{output_format}.json"
+        with create_writer(str(path), output_format) as writer:
+            writer.write(results)
+        sizes[output_format] = path.stat().st_size
+    assert sizes["compact"] < sizes["json"]
+
+def test_jsonl_writes_a_line_per_field_and_segment(tmp_path, results):
+    path = str(tmp_path / "out.jsonl")
+    with create_writer(path, "jsonl") as writer:
+        writer.write(results)
+
+    with open(path, encoding='utf-8') as f:
+        records = [json.loads(line) for line in f]
+    assert [record["field"] for record in records] == [
+        "transcript", "segments", "segments", "summary", "action_items", "calendar_event"
+    ]
+    assert records[2]["value"] == {"start": 30.0, "end": 60.0, "text": "Maria will review it."}
+
+def test_jsonl_fields_are_readable_before_close(tmp_path):
+    path = str(tmp_path / "out.jsonl")
+    with JSONLinesWriter(path) as writer:
+        writer.write_field("summary", "Partial.")
+        with open(path, encoding='utf-8') as f:
+            assert json.loads(f.readline()) == {"field": "summary", "value": "Partial."}
+
+def test_gz_path_is_compressed(tmp_path, results):
+    path = str(tmp_path / "out.json.gz")
+    with create_writer(path, "json") as writer:
+        writer.write(results)
+
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        assert json.load(f) == expected(results)
+
+def test_msgpack_round_trip(tmp_path, results):
+    msgpack = pytest.importorskip("msgpack")
+    path = str(tmp_path / "out.msgpack")
+    with create_writer(path, "msgpack") as writer:
+        writer.write(results)
+
+    with open(path, 'rb') as f:
+        records = {record["field"]: record["value"] for record in msgpack.Unpacker(f, raw=False)}
+    assert Transcript.from_dict(records.pop("segments")).to_list() == results["segments"].to_list()
+    assert records == {key: value for key, value in results.items() if key != "segments"}
+
+def test_output_extension():
+    assert output_extension("compact") == ".json"
+    assert output_extension("jsonl", compress=True) == ".jsonl.gz"
+    with pytest.raises(ValueError):
+        output_extension("xml")
+
+@pytest.mark.parametrize("output_format,name", [("json", "out.json"), ("compact", "out.json.gz"), ("jsonl", "out.jsonl")])
+def test_read_results_round_trips(tmp_path, results, output_format, name):
+    path = str(tmp_path / name)
+    with create_writer(path, output_format) as writer:
+        writer.write(results)
+    assert read_results(path) == expected(results)
+
+@pytest.mark.parametrize("output_format", ["json", "compact", "jsonl"])
+def test_segment_list_is_written_like_a_transcript(tmp_path, results, output_format):
+    streamed, finished = tmp_path / "streamed.out", tmp_path / "finished.out"
+    with create_writer(str(streamed), output_format) as writer:
+        writer.write(results)
+    with create_writer(str(finished), output_format) as writer:
+        writer.write(expected(results))
+    assert finished.read_bytes() == streamed.read_bytes()
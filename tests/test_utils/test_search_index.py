@@ -0,0 +1,97 @@
+import threading
+
+import pytest
+
+from src.audio.transcript import Transcript
+from src.utils.output_writers import create_writer, read_results
+from src.utils.search_index import TranscriptIndex, meeting_key, parse_query
+
+def meeting(*texts, summary="A short meeting.", action_items=()):
+    return {
+        "segments": Transcript.from_segments([
+            {"start": 10.0 * i, "end": 10.0 * (i + 1), "text": text} for i, text in enumerate(texts)
+        ]),
+        "summary": summary,
+        "key_points": [],
+        "action_items": list(action_items)
+    }
+
+@pytest.fixture
+def index(tmp_path):
+    index = TranscriptIndex(str(tmp_path / "index"), merge_factor=3)
+    index.add("standup", meeting("We agreed the release ships on Friday.", "Budget review is next week."))
+    index.add("planning", meeting(
+        "Friday is a holiday, so the release slips.",
+        action_items=[{"action": "send the deck", "context": "Maria will send the deck.", "start": 4.0, "end": 5.0}]
+    ))
+    yield index
+    index.close()
+
+def test_parse_query_splits_phrases_and_words():
+    assert parse_query('budget "ships on Friday" follow-up') == [["budget"], ["ships", "on", "friday"], ["follow", "up"]]
+
+def test_keyword_hits_carry_meeting_and_segment(index):
+    hits = index.search("budget")
+    assert [(hit["meeting"], hit["field"], hit["segment"], hit["start"]) for hit in hits] == [("standup", "transcript", 1, 10.0)]
+
+def test_phrase_must_match_in_order(index):
+    assert [hit["meeting"] for hit in index.search('"ships on friday"')] == ["standup"]
+    assert index.search('"friday on ships"') == []
+    assert {hit["meeting"] for hit in index.search("friday release")} == {"standup", "planning"}
+
+def test_field_filter_and_meeting_results(index):
+    hits = index.search("deck", fields=["action_items"])
+    assert hits[0]["text"] == "Maria will send the deck." and (hits[0]["start"], hits[0]["end"]) == (4.0, 5.0)
+    assert index.search("deck", fields=["summary"]) == []
+
+    meetings = index.search_meetings("friday")
+    assert {result["meeting"] for result in meetings} == {"standup", "planning"}
+    assert all(result["hits"] == 1 and result["best"]["field"] == "transcript" for result in meetings)
+
+def test_adding_again_replaces_meeting_across_merges(index):
+    index.add("standup", meeting("Nothing about money today."))
+    assert index.search("budget") == []
+    for number in range(4):
+        index.add(f"extra-{number}", meeting(f"Extra meeting {number} on budget."))
+
+    assert index.stats()["parts"] < 6
+    assert index.search('"money today"')[0]["meeting"] == "standup"
+    assert len(index.search("budget")) == 4
+
+    index.optimize()
+    stats = index.stats()
+    assert stats["meetings"] == 6 and stats["parts"] == 1
+    assert index.remove("planning")
+    assert index.search("deck") == []
+
+def test_reader_sees_other_writers_and_concurrent_adds(tmp_path, index):
+    reader = TranscriptIndex(str(index.directory))
+    assert len(reader.search("friday")) == 2
+
+    threads = [
+        threading.Thread(target=index.add, args=(f"call-{number}", meeting(f"Call {number} about pricing.")))
+        for number in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(reader.search("pricing")) == 6
+    reader.close()
+
+def test_meeting_indexed_on_completion_and_from_results_file_is_stored_once(tmp_path, index):
+    audio_path = str(tmp_path / "audio" / ".." / "review.wav")
+    results = dict(meeting("The roadmap review went well."), source_file=str(tmp_path / "review.wav"))
+    index.add(meeting_key(results, audio_path), results)
+
+    results_path = str(tmp_path / "review_summary.jsonl")
+    with create_writer(results_path, "jsonl") as writer:
+        writer.write(results)
+    from_file = read_results(results_path)
+    index.add(meeting_key(from_file, results_path), from_file)
+
+    hits = index.search("roadmap")
+    assert len(hits) == 1 and hits[0]["meeting"] == str(tmp_path / "review.wav")
+    assert index.stats()["meetings"] == 3
+
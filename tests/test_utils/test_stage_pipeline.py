@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pytest
+
+from src.utils.stage_pipeline import Stage, StagePipeline
+
+def test_results_keep_input_order():
+    pipeline = StagePipeline([
+        Stage("double", lambda x: x * 2, concurrency=3),
+        Stage("increment", lambda x: x + 1, concurrency=2)
+    ])
+    jobs = pipeline.run(range(20))
+
+    assert [job["value"] for job in jobs] == [x * 2 + 1 for x in range(20)]
+    assert all(set(job["timings"]) == {"double", "increment"} for job in jobs)
+
+def test_failed_item_skips_later_stages():
+    seen = []
+
+    def fail_on_three(x):
+        if x == 3:
+            raise ValueError("bad item")
+        return x
+
+    pipeline = StagePipeline([
+        Stage("check", fail_on_three),
+        Stage("record", lambda x: seen.append(x) or x)
+    ])
+    jobs = pipeline.run(range(5))
+
+    assert str(jobs[3]["error"]) == "bad item"
+    assert jobs[3]["failed_stage"] == "check"
+    assert 3 not in seen
+    assert all(job["error"] is None for index, job in enumerate(jobs) if index != 3)
+
+def test_stages_overlap_across_items():
+    def slow(x):
+        time.sleep(0.05)
+        return x
+
+    pipeline = StagePipeline([Stage("a", slow), Stage("b", slow), Stage("c", slow)])
+    start = time.perf_counter()
+    pipeline.run(range(6))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 6 * 3 * 0.05 * 0.75
+
+def test_bounded_queues_apply_backpressure():
+    lock = threading.Lock()
+    in_flight = [0]
+    peak = [0]
+
+    def produce(x):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        return x
+
+    def consume(x):
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return x
+
+    pipeline = StagePipeline([Stage("produce", produce), Stage("consume", consume)], queue_size=2)
+    pipeline.run(range(30))
+
+    assert peak[0] <= 2 + 2
+
+def test_on_complete_called_for_every_item():
+    completed = []
+    StagePipeline([Stage("noop", lambda x: x)]).run(range(7), on_complete=completed.append)
+    assert sorted(job["index"] for job in completed) == list(range(7))
+
+def test_stage_requires_a_worker():
+    with pytest.raises(ValueError):
+        Stage("idle", lambda x: x, concurrency=0)